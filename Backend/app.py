@@ -16,21 +16,44 @@ Features:
 Requirements covered: 1.1, 1.5
 """
 
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
+import orjson
 import uvicorn
 import logging
+import logging.handlers
+import traceback
+import atexit
+import queue
 from datetime import datetime, timedelta
 import os
 from pathlib import Path
 import pickle
 import numpy as np
 from typing import Dict, Any, Optional, List
+import asyncio
 import hashlib
 import json
+import secrets
+import struct
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pydantic import ValidationError as PydanticValidationError
 
+# Optional cachetools for the bounded prediction cache
+try:
+    from cachetools import TTLCache
+except ImportError:
+    TTLCache = None
+
+# Optional xxhash for faster cache key hashing (stdlib blake2b fallback)
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
 # Import schemas
 from schemas import (
     StressPredictionRequest, 
@@ -49,15 +72,87 @@ try:
 except ImportError as e:
     logging.warning(f"Could not import some sklearn classes: {e}")
 
-# Configure logging
+# Optional Numba acceleration for batched insight thresholding
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _insight_flags(sleep, work, activity):
+        """Compute per-row insight bitmasks (bit0: low sleep, bit1: long work, bit2: low activity)."""
+        flags = np.empty(sleep.shape[0], dtype=np.uint8)
+        for i in range(sleep.shape[0]):
+            f = 0
+            if sleep[i] < 6:
+                f |= 1
+            if work[i] > 10:
+                f |= 2
+            if activity[i] < 1:
+                f |= 4
+            flags[i] = f
+        return flags
+
+    # Trigger compilation at import time so the first batch request
+    # does not pay the JIT warmup cost
+    _insight_flags(np.zeros(1), np.zeros(1), np.zeros(1))
+else:
+    def _insight_flags(sleep, work, activity):
+        """NumPy fallback for the insight bitmask kernel when Numba is unavailable."""
+        return (
+            (sleep < 6).astype(np.uint8)
+            | ((work > 10).astype(np.uint8) << 1)
+            | ((activity < 1).astype(np.uint8) << 2)
+        )
+
+
+# Insight strings for each bit in the _insight_flags bitmask
+_INSIGHT_FLAG_MESSAGES = (
+    (1, "Your sleep duration is below the recommended 7-9 hours"),
+    (2, "Long work hours may be a significant stress factor"),
+    (4, "Increasing physical activity could help reduce stress"),
+)
+
+# Recommendation tables built once at import time; the tuples are
+# immutable and shared across requests instead of rebuilt per call
+_REC_TABLE = {
+    'Low': (
+        "Maintain your current healthy lifestyle habits",
+        "Continue regular physical activity and good sleep schedule"
+    ),
+    'Medium': (
+        "Focus on improving sleep quality and duration",
+        "Incorporate regular physical exercise into your routine",
+        "Practice stress-reduction techniques like deep breathing"
+    ),
+    'High': (
+        "Prioritize getting adequate sleep (7-9 hours per night)",
+        "Engage in regular physical activity to reduce stress hormones",
+        "Practice meditation or mindfulness exercises daily",
+        "Consider speaking with a healthcare professional"
+    )
+}
+_REC_DEFAULT = ("Focus on maintaining a balanced lifestyle",)
+
+# Configure logging. Handlers sit behind a QueueListener so request
+# handlers never block on file/console I/O: records are dropped onto an
+# in-memory queue and written by a background thread.
+_log_queue = queue.Queue(maxsize=10000)
+_log_listener = logging.handlers.QueueListener(
+    _log_queue,
+    logging.StreamHandler(),
+    logging.FileHandler('pulse_ai_backend.log', mode='a'),
+    respect_handler_level=True
+)
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler('pulse_ai_backend.log', mode='a')
-    ]
+    handlers=[logging.handlers.QueueHandler(_log_queue)]
 )
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger(__name__)
 
 # Set specific log levels for different components
@@ -76,6 +171,7 @@ class ModelService:
         self.model_name = None
         self.model_score = None
         self.is_loaded = False
+        self._model_info = None  # built lazily by get_model_info
         
         # Expected feature names
         self.expected_features = [
@@ -100,11 +196,13 @@ class ModelService:
         """Load the trained ML model from the pickle file."""
         try:
             logger.info(f"Loading ML model from: {self.model_path}")
-            
-            if not os.path.exists(self.model_path):
+
+            try:
+                os.stat(self.model_path)
+            except FileNotFoundError:
                 logger.error(f"Model file not found: {self.model_path}")
                 return False
-            
+
             with open(self.model_path, 'rb') as f:
                 model_artifacts = pickle.load(f)
             
@@ -215,6 +313,93 @@ class ModelService:
             logger.error(f"Error generating prediction: {str(e)}")
             return None
     
+    def predict_batch(self, input_rows: List[Dict[str, Any]]) -> Optional[List[Dict[str, Any]]]:
+        """
+        Generate stress level predictions for a batch of inputs.
+
+        All rows are stacked into a single (N, F) float32 matrix so that
+        model.predict / predict_proba run once per batch instead of once
+        per row, amortizing sklearn's per-call overhead.
+        """
+        try:
+            if not self.is_loaded:
+                logger.error("Model not loaded")
+                return None
+
+            # Preprocess each row and stack into one contiguous matrix
+            processed_rows = []
+            for input_data in input_rows:
+                processed = self.preprocess_input(input_data)
+                if processed is None:
+                    return None
+                processed_rows.append(processed[0])
+
+            feature_matrix = np.ascontiguousarray(processed_rows, dtype=np.float32)
+
+            # Single model call for the whole batch
+            predictions = self.model.predict(feature_matrix)
+
+            if hasattr(self.model, 'predict_proba'):
+                probabilities = self.model.predict_proba(feature_matrix)
+                confidences = np.max(probabilities, axis=1)
+            else:
+                confidences = np.full(len(input_rows), 0.8)
+
+            stress_levels = [str(prediction) for prediction in predictions]
+            batch_insights = self._generate_insights_batch(input_rows, stress_levels)
+
+            results = []
+            for input_data, stress_level, confidence, insights in zip(
+                input_rows, stress_levels, confidences, batch_insights
+            ):
+                if stress_level == 'Low':
+                    numerical_score = 25
+                elif stress_level == 'Medium':
+                    numerical_score = 50
+                elif stress_level == 'High':
+                    numerical_score = 75
+                else:
+                    numerical_score = 50
+
+                results.append({
+                    'level': stress_level,
+                    'score': numerical_score,
+                    'confidence': float(confidence),
+                    'insights': insights,
+                    'recommendations': self._generate_recommendations(stress_level),
+                    'model_name': self.model_name,
+                    'model_score': self.model_score
+                })
+
+            logger.info(f"Batch prediction generated for {len(results)} inputs")
+            return results
+
+        except Exception as e:
+            logger.error(f"Error generating batch prediction: {str(e)}")
+            return None
+
+    def _generate_insights_batch(
+        self, input_rows: List[Dict[str, Any]], stress_levels: List[str]
+    ) -> List[List[str]]:
+        """
+        Generate insights for a batch of inputs using the compiled
+        threshold kernel instead of per-row dict comparisons.
+        """
+        sleep = np.array([row.get('Sleep_Duration', 0) for row in input_rows], dtype=np.float64)
+        work = np.array([row.get('Work_Hours', 0) for row in input_rows], dtype=np.float64)
+        activity = np.array([row.get('Physical_Activity', 0) for row in input_rows], dtype=np.float64)
+
+        flags = _insight_flags(sleep, work, activity)
+
+        batch_insights = []
+        for row_flags, stress_level in zip(flags, stress_levels):
+            insights = [message for bit, message in _INSIGHT_FLAG_MESSAGES if row_flags & bit]
+            if not insights:
+                insights.append(f"Your current stress level is {stress_level.lower()}")
+            batch_insights.append(insights)
+
+        return batch_insights
+
     def _generate_insights(self, input_data: Dict[str, Any], stress_level: str) -> List[str]:
         """Generate insights based on input data and prediction."""
         insights = []
@@ -241,42 +426,27 @@ class ModelService:
         
         return insights
     
-    def _generate_recommendations(self, stress_level: str) -> List[str]:
+    def _generate_recommendations(self, stress_level: str) -> tuple:
         """Generate recommendations based on stress level."""
-        if stress_level == 'Low':
-            return [
-                "Maintain your current healthy lifestyle habits",
-                "Continue regular physical activity and good sleep schedule"
-            ]
-        elif stress_level == 'Medium':
-            return [
-                "Focus on improving sleep quality and duration",
-                "Incorporate regular physical exercise into your routine",
-                "Practice stress-reduction techniques like deep breathing"
-            ]
-        elif stress_level == 'High':
-            return [
-                "Prioritize getting adequate sleep (7-9 hours per night)",
-                "Engage in regular physical activity to reduce stress hormones",
-                "Practice meditation or mindfulness exercises daily",
-                "Consider speaking with a healthcare professional"
-            ]
-        else:
-            return ["Focus on maintaining a balanced lifestyle"]
+        return _REC_TABLE.get(stress_level, _REC_DEFAULT)
     
     def get_model_info(self) -> Dict[str, Any]:
         """Get information about the loaded model."""
         if not self.is_loaded:
             return {'loaded': False, 'error': 'Model not loaded'}
-        
-        return {
-            'loaded': True,
-            'model_name': self.model_name,
-            'model_score': self.model_score,
-            'feature_count': len(self.feature_names) if self.feature_names else 0,
-            'feature_names': self.feature_names,
-            'expected_features': self.expected_features
-        }
+
+        # The model never changes after load, so the info dict is built
+        # once and reused by the health and debug endpoints
+        if self._model_info is None:
+            self._model_info = {
+                'loaded': True,
+                'model_name': self.model_name,
+                'model_score': self.model_score,
+                'feature_count': len(self.feature_names) if self.feature_names else 0,
+                'feature_names': self.feature_names,
+                'expected_features': self.expected_features
+            }
+        return self._model_info
 
 
 # Global model service instance
@@ -288,7 +458,8 @@ app = FastAPI(
     description="REST API for stress level prediction using trained ML model",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse  # orjson serialization for all responses
 )
 
 # CORS configuration for frontend integration
@@ -325,14 +496,147 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Thread pool for offloading blocking model predictions from the event loop.
+# sklearn predict is C-bound and releases the GIL, so concurrent requests
+# can run model inference in parallel instead of serializing the loop.
+prediction_executor = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 4,
+    thread_name_prefix="predict"
+)
+
+
+class _PredictionBatcher:
+    """
+    Coalesce concurrent single-sample predictions into batched model calls.
+
+    Requests that arrive within a small window are drained from an
+    asyncio.Queue into one predict_batch call, amortizing sklearn's
+    per-call dispatch overhead across callers; results fan back out via
+    per-request futures. Tunable with PULSE_BATCH_SIZE (set to 1 to
+    disable coalescing) and PULSE_BATCH_WAIT_MS.
+    """
+
+    def __init__(self, max_batch_size: int, max_wait_seconds: float):
+        self.max_batch_size = max_batch_size
+        self.max_wait_seconds = max_wait_seconds
+        self._queue = None
+        self._drain_task = None
+
+    @property
+    def enabled(self) -> bool:
+        """Whether coalescing is active (started and batch size > 1)."""
+        return self._drain_task is not None and self.max_batch_size > 1
+
+    def start(self) -> None:
+        """Start the background drain task (call from app startup)."""
+        if self.max_batch_size > 1 and self._drain_task is None:
+            self._queue = asyncio.Queue()
+            self._drain_task = asyncio.get_running_loop().create_task(self._drain_loop())
+            logger.info(
+                "Prediction batcher started (max_batch=%d, max_wait=%.1fms)",
+                self.max_batch_size, self.max_wait_seconds * 1000
+            )
+
+    def stop(self) -> None:
+        """Cancel the drain task (call from app shutdown)."""
+        if self._drain_task is not None:
+            self._drain_task.cancel()
+            self._drain_task = None
+
+    async def submit(self, model_input: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Queue one input and wait for its result from the next batch."""
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((model_input, future))
+        return await future
+
+    async def _drain_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+
+        while True:
+            # Block for the first item, then collect whatever else arrives
+            # within the wait window (up to max_batch_size items total)
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait_seconds
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            inputs = [model_input for model_input, _ in batch]
+            try:
+                results = await loop.run_in_executor(
+                    prediction_executor, model_service.predict_batch, inputs
+                )
+            except Exception as e:
+                logger.error("Batched prediction failed: %s", str(e))
+                results = None
+
+            if results is None or len(results) != len(batch):
+                results = [None] * len(batch)
+
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+
+
+prediction_batcher = _PredictionBatcher(
+    max_batch_size=int(os.getenv("PULSE_BATCH_SIZE", "64")),
+    max_wait_seconds=float(os.getenv("PULSE_BATCH_WAIT_MS", "5")) / 1000.0
+)
+
 # Global variables for application state
 app_start_time = datetime.now()
 model_loaded = False
 model_path = "models/pulse_ai_model_test.pkl"  # Use the working test model in models folder
 
 # Cache for prediction results
-prediction_cache = {}
 cache_ttl = timedelta(minutes=5)  # 5-minute cache TTL
+cache_maxsize = 10000  # Bound memory growth under sustained load
+
+
+class _BoundedTTLCache:
+    """
+    Minimal TTL + LRU cache used when cachetools is unavailable.
+
+    Entries expire after `ttl` seconds and the least recently used entry
+    is evicted once `maxsize` is reached, so the cache can never grow
+    unbounded the way the previous plain dict did.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()  # key -> (expiry, value)
+
+    def get(self, key, default=None):
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        expiry, value = entry
+        if time.monotonic() >= expiry:
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return value
+
+    def __setitem__(self, key, value):
+        # pop() combines the membership test and removal in one lookup
+        if self._data.pop(key, None) is None and len(self._data) >= self.maxsize:
+            self._data.popitem(last=False)
+        self._data[key] = (time.monotonic() + self.ttl, value)
+
+    def __len__(self):
+        return len(self._data)
+
+
+if TTLCache is not None:
+    prediction_cache = TTLCache(maxsize=cache_maxsize, ttl=cache_ttl.total_seconds())
+else:
+    prediction_cache = _BoundedTTLCache(maxsize=cache_maxsize, ttl=cache_ttl.total_seconds())
 
 
 @app.on_event("startup")
@@ -343,21 +647,62 @@ async def startup_event():
     This function runs when the FastAPI application starts up.
     It performs initialization tasks like loading the ML model.
     """
-    global model_loaded, model_service
-    
     startup_id = f"startup_{datetime.now().timestamp()}"
     logger.info(f"[{startup_id}] Starting PULSE-AI Backend API...")
     logger.info(f"[{startup_id}] Application started at: {app_start_time}")
-    
+
+    # Prime psutil's CPU counter so /health can sample it without blocking
+    try:
+        import psutil
+        psutil.cpu_percent(interval=None)
+    except ImportError:
+        pass
+
+    # If access logging is enabled, route uvicorn's access logger through
+    # the same async queue as application logs so it never blocks the loop
+    # (uvicorn installs its own synchronous handlers before startup runs)
+    access_logger = logging.getLogger("uvicorn.access")
+    if access_logger.handlers:
+        access_logger.handlers = [logging.handlers.QueueHandler(_log_queue)]
+
+    if model_loaded and model_service is not None:
+        # Model was already loaded at import time (PRELOAD_MODEL); with a
+        # pre-forking server such as `gunicorn --preload` the loaded pages
+        # are shared copy-on-write across workers
+        logger.info(f"[{startup_id}] Model already loaded pre-fork; skipping reload")
+    else:
+        _initialize_model(startup_id)
+
+    # Coalesce concurrent single predictions into batched model calls
+    prediction_batcher.start()
+
+    logger.info(f"[{startup_id}] PULSE-AI Backend API startup complete")
+
+
+def _initialize_model(startup_id: str = "preload") -> None:
+    """
+    Load the best available ML model into module globals.
+
+    Called from the FastAPI startup event, or at import time when
+    PRELOAD_MODEL=1 so pre-forking process managers load the model once
+    before workers fork and share it copy-on-write.
+    """
+    global model_loaded, model_service, model_path
+
     # Initialize model service with comprehensive error handling
     try:
-        # Check for available model files
+        # Check for available model files (one stat per candidate path)
         model_files = []
-        if os.path.exists("models/pulse_ai_model_test.pkl"):
-            model_files.append(("models/pulse_ai_model_test.pkl", "test"))
-        if os.path.exists("models/pulse_ai_model.pkl"):
-            model_files.append(("models/pulse_ai_model.pkl", "production"))
-        
+        for candidate, model_type in (
+            ("models/pulse_ai_model_test.pkl", "test"),
+            ("models/pulse_ai_model.pkl", "production"),
+        ):
+            try:
+                file_stat = os.stat(candidate)
+            except FileNotFoundError:
+                continue
+            model_files.append((candidate, model_type, file_stat.st_size))
+
         if not model_files:
             logger.error(f"[{startup_id}] No model files found in current directory")
             logger.error(f"[{startup_id}] Current directory: {os.getcwd()}")
@@ -366,14 +711,13 @@ async def startup_event():
             return
         
         logger.info(f"[{startup_id}] Found model files: {[f[0] for f in model_files]}")
-        
+
         # Try to load models in order of preference
-        for model_file, model_type in model_files:
+        for model_file, model_type, file_size in model_files:
             try:
                 logger.info(f"[{startup_id}] Attempting to load {model_type} model: {model_file}")
-                
-                # Check file integrity
-                file_size = os.path.getsize(model_file)
+
+                # Check file integrity (size already known from the stat above)
                 if file_size == 0:
                     logger.warning(f"[{startup_id}] Model file {model_file} is empty, skipping")
                     continue
@@ -387,7 +731,6 @@ async def startup_event():
                 if model_service.load_model():
                     model_loaded = True
                     # Update the global model_path to reflect the actually loaded model
-                    global model_path
                     model_path = model_file
                     logger.info(f"[{startup_id}] Successfully loaded {model_type} model: {model_file}")
                     logger.info(f"[{startup_id}] Updated global model_path to: {model_path}")
@@ -418,6 +761,19 @@ async def startup_event():
         if model_loaded and model_service:
             logger.info(f"[{startup_id}] ML model initialization completed successfully")
             logger.info(f"[{startup_id}] Model ready for predictions")
+
+            # Warm the predictor with one canned request so the first real
+            # user never pays for sklearn/ONNX first-call setup. WARMUP=false
+            # skips it (e.g. in tests).
+            if os.getenv("WARMUP", "true").lower() == "true":
+                try:
+                    example = StressPredictionRequest.model_config[
+                        "json_schema_extra"]["example"]
+                    warm_input = StressPredictionRequest(**example).to_model_format()
+                    model_service.predict(warm_input)
+                    logger.info(f"[{startup_id}] Prediction path warmed up")
+                except Exception as warmup_error:
+                    logger.warning(f"[{startup_id}] Warmup prediction failed: {str(warmup_error)}")
         else:
             logger.error(f"[{startup_id}] Failed to initialize any ML model")
             logger.error(f"[{startup_id}] API will use fallback responses for all predictions")
@@ -439,8 +795,13 @@ async def startup_event():
         
         model_loaded = False
         model_service = None
-    
-    logger.info(f"[{startup_id}] PULSE-AI Backend API startup complete")
+
+
+# Load the model at import time so pre-forking servers (e.g.
+# `gunicorn --preload -k uvicorn.workers.UvicornWorker`) load it once
+# and share it across workers. Set PRELOAD_MODEL=0 to defer to startup.
+if os.getenv("PRELOAD_MODEL", "1") == "1":
+    _initialize_model("preload")
 
 
 @app.on_event("shutdown")
@@ -452,6 +813,8 @@ async def shutdown_event():
     It performs cleanup tasks and logs shutdown information.
     """
     logger.info("Shutting down PULSE-AI Backend API...")
+    prediction_batcher.stop()
+    prediction_executor.shutdown(wait=False)
     uptime = datetime.now() - app_start_time
     logger.info(f"Application uptime: {uptime}")
     logger.info("PULSE-AI Backend API shutdown complete")
@@ -487,7 +850,7 @@ async def health_check():
         
     Requirements: 1.1, 1.5
     """
-    health_id = f"health_{datetime.now().timestamp()}"
+    health_id = f"health_{time.monotonic_ns()}"
     
     try:
         # Calculate uptime
@@ -495,10 +858,10 @@ async def health_check():
         uptime_seconds = int(uptime.total_seconds())
         
         # Debug logging for health check
-        logger.info(f"[{health_id}] Health check - model_loaded: {model_loaded}")
-        logger.info(f"[{health_id}] Health check - model_path: {model_path}")
-        logger.info(f"[{health_id}] Health check - model_service exists: {model_service is not None}")
-        logger.info(f"[{health_id}] Health check - model_service.is_loaded: {model_service.is_loaded if model_service else 'N/A'}")
+        logger.debug(f"[{health_id}] Health check - model_loaded: {model_loaded}")
+        logger.debug(f"[{health_id}] Health check - model_path: {model_path}")
+        logger.debug(f"[{health_id}] Health check - model_service exists: {model_service is not None}")
+        logger.debug(f"[{health_id}] Health check - model_service.is_loaded: {model_service.is_loaded if model_service else 'N/A'}")
         
         # Check model file status
         model_file_exists = os.path.exists(model_path)
@@ -512,7 +875,9 @@ async def health_check():
             import psutil
             memory_info = psutil.virtual_memory()
             disk_info = psutil.disk_usage('.')
-            cpu_percent = psutil.cpu_percent(interval=1)
+            # Non-blocking: returns usage since the previous call instead
+            # of sleeping for a sampling interval inside the handler
+            cpu_percent = psutil.cpu_percent(interval=None)
             
             system_resources = {
                 "memory_total_gb": round(memory_info.total / (1024**3), 2),
@@ -592,7 +957,7 @@ async def health_check():
         logger.error(f"[{health_id}] Health check failed: {str(e)}")
         logger.error(f"[{health_id}] Exception type: {type(e).__name__}")
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=503,
             content={
                 "status": "unhealthy",
@@ -604,16 +969,39 @@ async def health_check():
         )
 
 
+# Precompiled double packer for cache key generation
+_PACK_DOUBLE = struct.Struct('<d').pack
+
+# Fixed feature order for cache key generation (matches the model input format)
+_CACHE_KEY_FIELDS = (
+    'Age', 'Gender', 'Sleep_Duration', 'Sleep_Quality',
+    'Physical_Activity', 'Screen_Time', 'Caffeine_Intake',
+    'Smoking_Habit', 'Work_Hours', 'Travel_Time',
+    'Social_Interactions', 'Meditation_Practice', 'Exercise_Type'
+)
+
+
 def _generate_cache_key(request_data: Dict[str, Any]) -> str:
-    """Generate a cache key for the prediction request."""
-    # Sort the dictionary to ensure consistent key generation
-    sorted_data = json.dumps(request_data, sort_keys=True)
-    return hashlib.md5(sorted_data.encode()).hexdigest()
+    """
+    Generate a cache key for the prediction request.
 
+    Features are packed into a canonical binary buffer in fixed field
+    order (doubles for numeric values, UTF-8 bytes for categoricals)
+    and hashed, avoiding the JSON serialization that dominated the old
+    sort_keys + MD5 path.
+    """
+    parts = []
+    for field in _CACHE_KEY_FIELDS:
+        value = request_data.get(field)
+        if isinstance(value, str):
+            parts.append(value.encode('utf-8'))
+        else:
+            parts.append(_PACK_DOUBLE(float(value)))
+    buffer = b'\x00'.join(parts)
 
-def _is_cache_valid(timestamp: datetime) -> bool:
-    """Check if a cache entry is still valid."""
-    return datetime.now() - timestamp < cache_ttl
+    if xxhash is not None:
+        return xxhash.xxh3_64_hexdigest(buffer)
+    return hashlib.blake2b(buffer, digest_size=16).hexdigest()
 
 
 def _create_fallback_response() -> StressPredictionResponse:
@@ -626,25 +1014,25 @@ def _create_fallback_response() -> StressPredictionResponse:
     Requirements: 1.4, 5.2
     """
     try:
-        fallback_wellness_plan = WellnessPlan(
+        fallback_wellness_plan = WellnessPlan.model_construct(
             title="Basic Wellness Plan",
             summary="General wellness recommendations while we resolve technical issues",
             tasks=[
-                WellnessTask(
+                WellnessTask.model_construct(
                     id="fallback-1",
                     title="Practice Deep Breathing",
                     type="tool",
                     link="/tools/breathing",
                     reward=10
                 ),
-                WellnessTask(
+                WellnessTask.model_construct(
                     id="fallback-2",
                     title="Take a Short Walk",
                     type="lifestyle", 
                     link="/wellness/walking",
                     reward=10
                 ),
-                WellnessTask(
+                WellnessTask.model_construct(
                     id="fallback-3",
                     title="Stay Hydrated",
                     type="lifestyle",
@@ -654,7 +1042,7 @@ def _create_fallback_response() -> StressPredictionResponse:
             ]
         )
         
-        fallback_response = StressPredictionResponse(
+        fallback_response = StressPredictionResponse.model_construct(
             level="Medium",
             score=50,
             confidence=0.5,
@@ -680,11 +1068,11 @@ def _create_fallback_response() -> StressPredictionResponse:
         
         # Create minimal fallback if even the standard fallback fails
         try:
-            minimal_plan = WellnessPlan(
+            minimal_plan = WellnessPlan.model_construct(
                 title="Emergency Wellness Plan",
                 summary="Basic recommendations",
                 tasks=[
-                    WellnessTask(
+                    WellnessTask.model_construct(
                         id="emergency-1",
                         title="Take Deep Breaths",
                         type="tool",
@@ -694,7 +1082,7 @@ def _create_fallback_response() -> StressPredictionResponse:
                 ]
             )
             
-            return StressPredictionResponse(
+            return StressPredictionResponse.model_construct(
                 level="Medium",
                 score=50,
                 confidence=0.5,
@@ -722,72 +1110,78 @@ def _create_fallback_response() -> StressPredictionResponse:
 def _log_prediction_request(request_data: Dict[str, Any], client_ip: str = None):
     """Log prediction request details for monitoring and debugging."""
     try:
-        request_id = f"req_{datetime.now().timestamp()}_{hash(str(request_data)) % 10000:04d}"
-        
-        # Log basic request info without sensitive data
-        logger.info(f"[{request_id}] Prediction request received from {client_ip or 'unknown'}")
-        logger.info(f"[{request_id}] Request features: {list(request_data.keys())}")
-        
-        # Log key metrics for analysis (anonymized)
-        age = request_data.get('Age', 'unknown')
-        sleep_duration = request_data.get('Sleep_Duration', 'unknown')
-        work_hours = request_data.get('Work_Hours', 'unknown')
-        physical_activity = request_data.get('Physical_Activity', 'unknown')
-        stress_indicators = []
-        
-        # Identify potential stress indicators for monitoring
-        if isinstance(sleep_duration, (int, float)) and sleep_duration < 6:
-            stress_indicators.append("low_sleep")
-        if isinstance(work_hours, (int, float)) and work_hours > 10:
-            stress_indicators.append("long_work_hours")
-        if isinstance(physical_activity, (int, float)) and physical_activity < 2:
-            stress_indicators.append("low_activity")
-        
-        logger.info(f"[{request_id}] Key metrics - Age: {age}, Sleep: {sleep_duration}h, "
-                   f"Work: {work_hours}h, Activity: {physical_activity}")
-        
-        if stress_indicators:
-            logger.info(f"[{request_id}] Stress indicators detected: {', '.join(stress_indicators)}")
-        
-        # Log request timing for performance monitoring
-        logger.debug(f"[{request_id}] Request processing started at {datetime.now().isoformat()}")
+        request_id = f"req_{time.monotonic_ns()}"
         
+        # Detailed per-request logging is DEBUG-only; skip the string
+        # formatting entirely when the level is disabled
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"[{request_id}] Prediction request received from {client_ip or 'unknown'}")
+            logger.debug(f"[{request_id}] Request features: {list(request_data.keys())}")
+
+            # Log key metrics for analysis (anonymized)
+            age = request_data.get('Age', 'unknown')
+            sleep_duration = request_data.get('Sleep_Duration', 'unknown')
+            work_hours = request_data.get('Work_Hours', 'unknown')
+            physical_activity = request_data.get('Physical_Activity', 'unknown')
+            stress_indicators = []
+
+            # Identify potential stress indicators for monitoring
+            if isinstance(sleep_duration, (int, float)) and sleep_duration < 6:
+                stress_indicators.append("low_sleep")
+            if isinstance(work_hours, (int, float)) and work_hours > 10:
+                stress_indicators.append("long_work_hours")
+            if isinstance(physical_activity, (int, float)) and physical_activity < 2:
+                stress_indicators.append("low_activity")
+
+            logger.debug(f"[{request_id}] Key metrics - Age: {age}, Sleep: {sleep_duration}h, "
+                        f"Work: {work_hours}h, Activity: {physical_activity}")
+
+            if stress_indicators:
+                logger.debug(f"[{request_id}] Stress indicators detected: {', '.join(stress_indicators)}")
+
+            logger.debug(f"[{request_id}] Request processing started at {datetime.now().isoformat()}")
+
         return request_id
         
     except Exception as e:
         logger.error(f"Error logging prediction request: {str(e)}")
-        return f"req_error_{datetime.now().timestamp()}"
+        return f"req_error_{time.monotonic_ns()}"
 
 
 def _log_prediction_result(result: Dict[str, Any], cache_hit: bool = False, request_id: str = None):
     """Log prediction result for monitoring and analysis."""
     try:
+        # Runs on every prediction, including cache hits: bail out before
+        # doing any work when no handler would accept the records
+        if not logger.isEnabledFor(logging.WARNING):
+            return
+
         level = result.get('level', 'unknown')
         confidence = result.get('confidence', 0)
         model_name = result.get('model_name', 'unknown')
-        
+
         cache_status = "cache_hit" if cache_hit else "fresh_prediction"
-        log_id = request_id or f"result_{datetime.now().timestamp()}"
-        
-        logger.info(f"[{log_id}] Prediction result - Level: {level}, Confidence: {confidence:.3f}, "
-                   f"Model: {model_name}, Status: {cache_status}")
-        
-        # Log performance metrics
-        processing_time = datetime.now()
-        logger.debug(f"[{log_id}] Result generated at {processing_time.isoformat()}")
-        
-        # Log stress level distribution for monitoring
-        if level in ['Low', 'Medium', 'High']:
-            logger.info(f"[{log_id}] Stress level distribution: {level}")
-        
+        log_id = request_id or f"result_{time.monotonic_ns()}"
+
+        logger.info("[%s] Prediction result - Level: %s, Confidence: %.3f, Model: %s, Status: %s",
+                    log_id, level, confidence, model_name, cache_status)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            # Log performance metrics
+            logger.debug("[%s] Result generated at %s", log_id, datetime.now().isoformat())
+
+            # Log stress level distribution for monitoring
+            if level in ('Low', 'Medium', 'High'):
+                logger.debug("[%s] Stress level distribution: %s", log_id, level)
+
         # Log confidence score ranges for model performance monitoring
         if confidence < 0.5:
-            logger.warning(f"[{log_id}] Low confidence prediction: {confidence:.3f}")
+            logger.warning("[%s] Low confidence prediction: %.3f", log_id, confidence)
         elif confidence > 0.9:
-            logger.info(f"[{log_id}] High confidence prediction: {confidence:.3f}")
-        
+            logger.info("[%s] High confidence prediction: %.3f", log_id, confidence)
+
     except Exception as e:
-        logger.error(f"Error logging prediction result: {str(e)}")
+        logger.error("Error logging prediction result: %s", str(e))
 
 
 @app.exception_handler(Exception)
@@ -801,13 +1195,15 @@ async def global_exception_handler(request: Request, exc: Exception):
     
     Requirements: 1.4, 5.2
     """
-    # Generate unique error ID for tracking
-    error_id = f"err_{datetime.now().timestamp()}_{hash(str(exc)) % 10000:04d}"
+    # Generate unique error ID for tracking (single datetime.now() call
+    # reused for the response timestamp below)
+    now = datetime.now()
+    error_id = f"err_{now.timestamp()}_{secrets.token_hex(2)}"
     
     # Log comprehensive error information
-    logger.error(f"[{error_id}] Unhandled exception in {request.method} {request.url}")
-    logger.error(f"[{error_id}] Exception type: {type(exc).__name__}")
-    logger.error(f"[{error_id}] Exception message: {str(exc)}")
+    logger.error("[%s] Unhandled exception in %s %s", error_id, request.method, request.url)
+    logger.error("[%s] Exception type: %s", error_id, type(exc).__name__)
+    logger.error("[%s] Exception message: %s", error_id, str(exc))
     
     # Log request details for debugging
     try:
@@ -815,78 +1211,88 @@ async def global_exception_handler(request: Request, exc: Exception):
         user_agent = request.headers.get('user-agent', 'unknown')
         content_type = request.headers.get('content-type', 'unknown')
         
-        logger.error(f"[{error_id}] Request from: {client_ip}")
-        logger.error(f"[{error_id}] User-Agent: {user_agent}")
-        logger.error(f"[{error_id}] Content-Type: {content_type}")
+        logger.error("[%s] Request from: %s", error_id, client_ip)
+        logger.error("[%s] User-Agent: %s", error_id, user_agent)
+        logger.error("[%s] Content-Type: %s", error_id, content_type)
         
-        # Log request body for POST requests (but limit size)
+        # Log request body for POST requests (but limit size). Stream the
+        # body and stop after 500 bytes instead of buffering the whole
+        # payload just to log a preview
         if request.method == "POST":
             try:
-                body = await request.body()
-                if len(body) > 0:
-                    body_preview = body[:500].decode('utf-8', errors='ignore')
-                    logger.error(f"[{error_id}] Request body preview: {body_preview}")
+                body_buffer = bytearray()
+                async for chunk in request.stream():
+                    body_buffer.extend(chunk)
+                    if len(body_buffer) >= 500:
+                        break
+                if body_buffer:
+                    body_preview = bytes(body_buffer[:500]).decode('utf-8', errors='ignore')
+                    logger.error("[%s] Request body preview: %s", error_id, body_preview)
             except Exception as body_error:
-                logger.error(f"[{error_id}] Could not read request body: {str(body_error)}")
+                logger.error("[%s] Could not read request body: %s", error_id, str(body_error))
                 
     except Exception as log_error:
-        logger.error(f"[{error_id}] Error logging request details: {str(log_error)}")
+        logger.error("[%s] Error logging request details: %s", error_id, str(log_error))
     
-    # Log stack trace for debugging
-    import traceback
-    logger.error(f"[{error_id}] Stack trace:\n{traceback.format_exc()}")
+    # Log stack trace for debugging (skip the format_exc() cost when
+    # error logging is disabled)
+    if logger.isEnabledFor(logging.ERROR):
+        logger.error("[%s] Stack trace:\n%s", error_id, traceback.format_exc())
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "error": "InternalServerError",
             "message": "An unexpected error occurred. Please try again later.",
             "error_id": error_id,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now.isoformat(),
         }
     )
 
 
-def _create_wellness_plan(stress_level: str, insights: List[str]) -> WellnessPlan:
-    """Create a wellness plan based on stress level and insights."""
-    if stress_level == "Low":
-        title = "Maintenance Wellness Plan"
-        summary = "Keep up your great habits with these maintenance activities"
-        tasks = [
-            WellnessTask(
+# Wellness plans are static templates keyed only on stress level, so the
+# three possible outputs are built once at import time and shared; the
+# response path never mutates them
+_WELLNESS_PLANS: Dict[str, WellnessPlan] = {
+    "Low": WellnessPlan.model_construct(
+        title="Maintenance Wellness Plan",
+        summary="Keep up your great habits with these maintenance activities",
+        tasks=[
+            WellnessTask.model_construct(
                 id="maintain-1",
                 title="Continue Regular Exercise",
                 type="lifestyle",
                 link="/wellness/exercise",
                 reward=10
             ),
-            WellnessTask(
-                id="maintain-2", 
+            WellnessTask.model_construct(
+                id="maintain-2",
                 title="Maintain Sleep Schedule",
                 type="lifestyle",
                 link="/wellness/sleep",
                 reward=10
             )
         ]
-    elif stress_level == "Medium":
-        title = "Balanced Stress Management Plan"
-        summary = "Targeted activities to help reduce your moderate stress levels"
-        tasks = [
-            WellnessTask(
+    ),
+    "Medium": WellnessPlan.model_construct(
+        title="Balanced Stress Management Plan",
+        summary="Targeted activities to help reduce your moderate stress levels",
+        tasks=[
+            WellnessTask.model_construct(
                 id="medium-1",
                 title="Daily Meditation Practice",
                 type="tool",
                 link="/tools/meditation",
                 reward=15
             ),
-            WellnessTask(
+            WellnessTask.model_construct(
                 id="medium-2",
                 title="Improve Sleep Hygiene",
                 type="article",
                 link="/articles/sleep-hygiene",
                 reward=10
             ),
-            WellnessTask(
+            WellnessTask.model_construct(
                 id="medium-3",
                 title="30-Minute Daily Walk",
                 type="lifestyle",
@@ -894,32 +1300,33 @@ def _create_wellness_plan(stress_level: str, insights: List[str]) -> WellnessPla
                 reward=15
             )
         ]
-    else:  # High stress
-        title = "Intensive Stress Relief Plan"
-        summary = "Comprehensive plan to help manage your high stress levels"
-        tasks = [
-            WellnessTask(
+    ),
+    "High": WellnessPlan.model_construct(
+        title="Intensive Stress Relief Plan",
+        summary="Comprehensive plan to help manage your high stress levels",
+        tasks=[
+            WellnessTask.model_construct(
                 id="high-1",
                 title="Deep Breathing Exercises",
                 type="tool",
                 link="/tools/breathing",
                 reward=20
             ),
-            WellnessTask(
+            WellnessTask.model_construct(
                 id="high-2",
                 title="Professional Stress Management",
                 type="article",
                 link="/articles/professional-help",
                 reward=15
             ),
-            WellnessTask(
+            WellnessTask.model_construct(
                 id="high-3",
                 title="Sleep Optimization Program",
                 type="lifestyle",
                 link="/wellness/sleep-program",
                 reward=20
             ),
-            WellnessTask(
+            WellnessTask.model_construct(
                 id="high-4",
                 title="Regular Exercise Routine",
                 type="lifestyle",
@@ -927,89 +1334,13 @@ def _create_wellness_plan(stress_level: str, insights: List[str]) -> WellnessPla
                 reward=20
             )
         ]
-    
-    return WellnessPlan(title=title, summary=summary, tasks=tasks)
+    )
+}
+
+
+def _create_wellness_plan(stress_level: str, insights: List[str]) -> WellnessPlan:
     """Create a wellness plan based on stress level and insights."""
-    if stress_level == "Low":
-        title = "Maintenance Wellness Plan"
-        summary = "Keep up your great habits with these maintenance activities"
-        tasks = [
-            WellnessTask(
-                id="maintain-1",
-                title="Continue Regular Exercise",
-                type="lifestyle",
-                link="/wellness/exercise",
-                reward=10
-            ),
-            WellnessTask(
-                id="maintain-2", 
-                title="Maintain Sleep Schedule",
-                type="lifestyle",
-                link="/wellness/sleep",
-                reward=10
-            )
-        ]
-    elif stress_level == "Medium":
-        title = "Balanced Stress Management Plan"
-        summary = "Targeted activities to help reduce your moderate stress levels"
-        tasks = [
-            WellnessTask(
-                id="medium-1",
-                title="Daily Meditation Practice",
-                type="tool",
-                link="/tools/meditation",
-                reward=15
-            ),
-            WellnessTask(
-                id="medium-2",
-                title="Improve Sleep Hygiene",
-                type="article",
-                link="/articles/sleep-hygiene",
-                reward=10
-            ),
-            WellnessTask(
-                id="medium-3",
-                title="30-Minute Daily Walk",
-                type="lifestyle",
-                link="/wellness/walking",
-                reward=15
-            )
-        ]
-    else:  # High stress
-        title = "Intensive Stress Relief Plan"
-        summary = "Comprehensive plan to help manage your high stress levels"
-        tasks = [
-            WellnessTask(
-                id="high-1",
-                title="Deep Breathing Exercises",
-                type="tool",
-                link="/tools/breathing",
-                reward=20
-            ),
-            WellnessTask(
-                id="high-2",
-                title="Professional Stress Management",
-                type="article",
-                link="/articles/professional-help",
-                reward=15
-            ),
-            WellnessTask(
-                id="high-3",
-                title="Sleep Optimization Program",
-                type="lifestyle",
-                link="/wellness/sleep-program",
-                reward=20
-            ),
-            WellnessTask(
-                id="high-4",
-                title="Regular Exercise Routine",
-                type="lifestyle",
-                link="/wellness/exercise-routine",
-                reward=20
-            )
-        ]
-    
-    return WellnessPlan(title=title, summary=summary, tasks=tasks)
+    return _WELLNESS_PLANS.get(stress_level, _WELLNESS_PLANS["Medium"])
 
 
 @app.get("/debug/logs")
@@ -1023,7 +1354,8 @@ async def get_recent_logs():
     Returns:
         dict: Recent log entries and system status
     """
-    debug_id = f"debug_{datetime.now().timestamp()}"
+    now = datetime.now()
+    debug_id = f"debug_{now.timestamp()}"
     
     try:
         # Read recent log entries from the log file
@@ -1032,13 +1364,16 @@ async def get_recent_logs():
         
         if os.path.exists(log_file_path):
             try:
-                with open(log_file_path, 'r') as log_file:
-                    lines = log_file.readlines()
-                    # Get last 50 lines
-                    recent_lines = lines[-50:] if len(lines) > 50 else lines
-                    log_entries = [line.strip() for line in recent_lines if line.strip()]
+                # Read only the last ~8 KB of the file instead of loading
+                # the whole log into memory to take the final 50 lines
+                with open(log_file_path, 'rb') as log_file:
+                    log_file.seek(0, os.SEEK_END)
+                    file_size = log_file.tell()
+                    log_file.seek(max(0, file_size - 8192))
+                    tail = log_file.read().decode('utf-8', errors='ignore')
+                log_entries = [line.strip() for line in tail.splitlines()[-50:] if line.strip()]
             except Exception as file_error:
-                logger.warning(f"[{debug_id}] Could not read log file: {str(file_error)}")
+                logger.warning("[%s] Could not read log file: %s", debug_id, str(file_error))
                 log_entries = ["Could not read log file"]
         else:
             log_entries = ["Log file not found"]
@@ -1048,8 +1383,8 @@ async def get_recent_logs():
             "model_loaded": model_loaded,
             "model_service_ready": model_service is not None and model_service.is_loaded,
             "cache_entries": len(prediction_cache),
-            "uptime_seconds": int((datetime.now() - app_start_time).total_seconds()),
-            "current_time": datetime.now().isoformat()
+            "uptime_seconds": int((now - app_start_time).total_seconds()),
+            "current_time": now.isoformat()
         }
         
         # Get model information if available
@@ -1062,7 +1397,7 @@ async def get_recent_logs():
         
         debug_response = {
             "debug_id": debug_id,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now.isoformat(),
             "application_state": app_state,
             "model_info": model_debug_info,
             "recent_logs": log_entries,
@@ -1070,12 +1405,12 @@ async def get_recent_logs():
             "note": "This endpoint should be secured in production"
         }
         
-        logger.info(f"[{debug_id}] Debug information requested")
+        logger.info("[%s] Debug information requested", debug_id)
         return debug_response
         
     except Exception as e:
-        logger.error(f"[{debug_id}] Error retrieving debug information: {str(e)}")
-        return JSONResponse(
+        logger.error("[%s] Error retrieving debug information: %s", debug_id, str(e))
+        return ORJSONResponse(
             status_code=500,
             content={
                 "error": "DebugError",
@@ -1086,6 +1421,32 @@ async def get_recent_logs():
         )
 
 
+_model_file_stats_cache: Dict[str, Dict[str, Any]] = {}
+
+
+def _model_file_stats(model_path: str) -> Dict[str, Any]:
+    """Return existence/size/mtime for a model file from a single stat call.
+
+    Results are memoized per path: the model file does not change while
+    the process is running, so repeated debug calls cost no syscalls.
+    """
+    stats = _model_file_stats_cache.get(model_path)
+    if stats is not None:
+        return stats
+    try:
+        file_stat = os.stat(model_path)
+    except OSError:
+        # Not cached: a missing file may appear later
+        return {"exists": False, "size_bytes": 0, "modified_time": None}
+    stats = {
+        "exists": True,
+        "size_bytes": file_stat.st_size,
+        "modified_time": datetime.fromtimestamp(file_stat.st_mtime).isoformat()
+    }
+    _model_file_stats_cache[model_path] = stats
+    return stats
+
+
 @app.get("/debug/model")
 async def get_model_debug_info():
     """
@@ -1097,13 +1458,14 @@ async def get_model_debug_info():
     Returns:
         dict: Detailed model information and status
     """
-    debug_id = f"model_debug_{datetime.now().timestamp()}"
+    now = datetime.now()
+    debug_id = f"model_debug_{now.timestamp()}"
     
     try:
         if not model_service:
             return {
                 "debug_id": debug_id,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": now.isoformat(),
                 "status": "no_model_service",
                 "message": "Model service not initialized"
             }
@@ -1111,7 +1473,7 @@ async def get_model_debug_info():
         if not model_service.is_loaded:
             return {
                 "debug_id": debug_id,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": now.isoformat(),
                 "status": "model_not_loaded",
                 "message": "Model service exists but model not loaded",
                 "model_path": model_service.model_path
@@ -1123,25 +1485,21 @@ async def get_model_debug_info():
         # Add additional debug information
         debug_info = {
             "debug_id": debug_id,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now.isoformat(),
             "status": "model_loaded",
             "model_info": model_info,
             "model_path": model_service.model_path,
             "expected_features": model_service.expected_features,
             "categorical_mappings": model_service.categorical_mappings,
-            "file_stats": {
-                "exists": os.path.exists(model_service.model_path),
-                "size_bytes": os.path.getsize(model_service.model_path) if os.path.exists(model_service.model_path) else 0,
-                "modified_time": datetime.fromtimestamp(os.path.getmtime(model_service.model_path)).isoformat() if os.path.exists(model_service.model_path) else None
-            }
+            "file_stats": _model_file_stats(model_service.model_path)
         }
         
-        logger.info(f"[{debug_id}] Model debug information requested")
+        logger.info("[%s] Model debug information requested", debug_id)
         return debug_info
         
     except Exception as e:
-        logger.error(f"[{debug_id}] Error retrieving model debug information: {str(e)}")
-        return JSONResponse(
+        logger.error("[%s] Error retrieving model debug information: %s", debug_id, str(e))
+        return ORJSONResponse(
             status_code=500,
             content={
                 "error": "ModelDebugError",
@@ -1153,7 +1511,7 @@ async def get_model_debug_info():
         )
 
 
-@app.post("/predict", response_model=StressPredictionResponse)
+@app.post("/predict", response_model=StressPredictionResponse, response_model_exclude_unset=True)
 async def predict_stress(request: StressPredictionRequest, http_request: Request):
     """
     Predict stress level based on user input data.
@@ -1164,9 +1522,8 @@ async def predict_stress(request: StressPredictionRequest, http_request: Request
     
     Requirements: 1.2, 1.3, 6.4
     """
-    logger.info("=== PREDICT ENDPOINT CALLED ===")
     client_ip = http_request.client.host if http_request.client else "unknown"
-    logger.info(f"Prediction request from {client_ip}")
+    logger.debug("Prediction request from %s", client_ip)
     
     try:
         # Convert request to model format
@@ -1175,10 +1532,12 @@ async def predict_stress(request: StressPredictionRequest, http_request: Request
         # Log the prediction request
         request_id = _log_prediction_request(model_input, client_ip)
         
-        # Check if model is loaded
-        logger.info(f"Model loaded status: {model_loaded}")
-        logger.info(f"Model service status: {model_service is not None}")
-        logger.info(f"Model service loaded: {model_service.is_loaded if model_service else 'N/A'}")
+        # Check if model is loaded (argument expressions skipped entirely
+        # unless DEBUG logging is on)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Model loaded status: %s", model_loaded)
+            logger.debug("Model service status: %s", model_service is not None)
+            logger.debug("Model service loaded: %s", model_service.is_loaded if model_service else 'N/A')
         
         if not model_loaded or model_service is None:
             logger.error("ML model not available - returning fallback response")
@@ -1189,31 +1548,37 @@ async def predict_stress(request: StressPredictionRequest, http_request: Request
         # Generate cache key
         cache_key = _generate_cache_key(model_input)
         
-        # Check cache first
-        if cache_key in prediction_cache:
-            cached_entry = prediction_cache[cache_key]
-            if _is_cache_valid(cached_entry['timestamp']):
-                logger.info(f"Returning cached prediction for key: {cache_key[:8]}...")
-                _log_prediction_result(
-                    {"level": cached_entry['response'].level, 
-                     "confidence": cached_entry['response'].confidence,
-                     "model_name": cached_entry['response'].model_name or "cached"},
-                    cache_hit=True
-                )
-                return cached_entry['response']
-            else:
-                # Remove expired cache entry
-                del prediction_cache[cache_key]
-                logger.debug(f"Removed expired cache entry: {cache_key[:8]}...")
+        # Check cache first (expiry and eviction are handled by the cache itself)
+        cached_entry = prediction_cache.get(cache_key)
+        if cached_entry is not None:
+            cached_response, cached_body = cached_entry
+            logger.info("Returning cached prediction for key: %s...", cache_key[:8])
+            _log_prediction_result(
+                {"level": cached_response.level,
+                 "confidence": cached_response.confidence,
+                 "model_name": cached_response.model_name or "cached"},
+                cache_hit=True
+            )
+            # Return the pre-serialized bytes directly: cache hits skip
+            # response_model validation and JSON encoding entirely
+            return Response(content=cached_body, media_type="application/json")
         
         # Generate prediction using model service
         try:
-            logger.debug(f"Generating prediction for request from {client_ip}")
-            prediction_result = model_service.predict(model_input)
-            
+            logger.debug("Generating prediction for request from %s", client_ip)
+            # Offload the blocking sklearn call so the event loop stays
+            # free; under concurrency the batcher coalesces queued inputs
+            # into one predict_batch call
+            if prediction_batcher.enabled:
+                prediction_result = await prediction_batcher.submit(model_input)
+            else:
+                prediction_result = await asyncio.get_running_loop().run_in_executor(
+                    prediction_executor, model_service.predict, model_input
+                )
+
         except ValueError as validation_error:
             # Handle data validation errors from model service
-            logger.warning(f"Model validation error from {client_ip}: {str(validation_error)}")
+            logger.warning("Model validation error from %s: %s", client_ip, str(validation_error))
             raise HTTPException(
                 status_code=400,
                 detail={
@@ -1221,40 +1586,40 @@ async def predict_stress(request: StressPredictionRequest, http_request: Request
                     "message": "Input data failed model validation",
                     "details": str(validation_error),
                     "timestamp": datetime.now().isoformat(),
-                    "request_id": f"req_{datetime.now().timestamp()}"
+                    "request_id": f"req_{time.monotonic_ns()}"
                 }
             )
             
         except FileNotFoundError as file_error:
             # Handle missing model files
-            logger.error(f"Model file not found: {str(file_error)}")
+            logger.error("Model file not found: %s", str(file_error))
             fallback_response = _create_fallback_response()
             _log_prediction_result({"level": "Medium", "confidence": 0.5, "model_name": "Fallback (File Not Found)"})
             return fallback_response
             
         except MemoryError as memory_error:
             # Handle memory issues during prediction
-            logger.error(f"Memory error during prediction: {str(memory_error)}")
+            logger.error("Memory error during prediction: %s", str(memory_error))
             raise HTTPException(
                 status_code=503,
                 detail={
                     "error": "ServiceUnavailable",
                     "message": "Service temporarily unavailable due to resource constraints",
                     "timestamp": datetime.now().isoformat(),
-                    "request_id": f"req_{datetime.now().timestamp()}"
+                    "request_id": f"req_{time.monotonic_ns()}"
                 }
             )
             
         except Exception as model_error:
             # Handle all other model prediction errors
-            error_id = f"model_err_{datetime.now().timestamp()}_{hash(str(model_error)) % 10000:04d}"
-            logger.error(f"[{error_id}] Model prediction failed from {client_ip}: {str(model_error)}")
-            logger.error(f"[{error_id}] Model error type: {type(model_error).__name__}")
+            error_id = f"model_err_{time.monotonic_ns()}"
+            logger.error("[%s] Model prediction failed from %s: %s", error_id, client_ip, str(model_error))
+            logger.error("[%s] Model error type: %s", error_id, type(model_error).__name__)
             
             # Log model state for debugging
             if model_service:
-                logger.error(f"[{error_id}] Model loaded: {model_service.is_loaded}")
-                logger.error(f"[{error_id}] Model name: {getattr(model_service, 'model_name', 'unknown')}")
+                logger.error("[%s] Model loaded: %s", error_id, model_service.is_loaded)
+                logger.error("[%s] Model name: %s", error_id, getattr(model_service, 'model_name', 'unknown'))
             
             # Return fallback response on model failure
             fallback_response = _create_fallback_response()
@@ -1277,13 +1642,13 @@ async def predict_stress(request: StressPredictionRequest, http_request: Request
                 prediction_result['insights']
             )
         except Exception as wellness_error:
-            logger.error(f"Error creating wellness plan: {str(wellness_error)}")
+            logger.error("Error creating wellness plan: %s", str(wellness_error))
             # Create a basic wellness plan as fallback
-            wellness_plan = WellnessPlan(
+            wellness_plan = WellnessPlan.model_construct(
                 title="Basic Wellness Plan",
                 summary="General wellness recommendations",
                 tasks=[
-                    WellnessTask(
+                    WellnessTask.model_construct(
                         id="basic-1",
                         title="Practice Mindfulness",
                         type="tool",
@@ -1295,7 +1660,10 @@ async def predict_stress(request: StressPredictionRequest, http_request: Request
         
         # Format response
         try:
-            response = StressPredictionResponse(
+            # feature_importance travels as a fixed-order list: the keys
+            # are redundant with the model's feature_names metadata
+            importance = prediction_result.get('feature_importance')
+            response = StressPredictionResponse.model_construct(
                 level=prediction_result['level'],
                 score=prediction_result['score'],
                 confidence=prediction_result['confidence'],
@@ -1304,43 +1672,31 @@ async def predict_stress(request: StressPredictionRequest, http_request: Request
                 wellness_plan=wellness_plan,
                 model_name=prediction_result.get('model_name'),
                 model_score=prediction_result.get('model_score'),
-                feature_importance=prediction_result.get('feature_importance')
+                feature_importance=list(importance.values()) if importance else None
             )
         except Exception as response_error:
-            logger.error(f"Error formatting response: {str(response_error)}")
+            logger.error("Error formatting response: %s", str(response_error))
             # Return fallback response if formatting fails
             fallback_response = _create_fallback_response()
             _log_prediction_result({"level": "Medium", "confidence": 0.5, "model_name": "Fallback (Format Error)"})
             return fallback_response
         
-        # Cache the response
+        # Cache the response alongside its serialized body so cache hits
+        # can be answered without re-encoding (TTL/LRU eviction automatic)
         try:
-            prediction_cache[cache_key] = {
-                'response': response,
-                'timestamp': datetime.now()
-            }
-            
-            # Clean up old cache entries (simple cleanup)
-            current_time = datetime.now()
-            expired_keys = [
-                key for key, entry in prediction_cache.items()
-                if current_time - entry['timestamp'] > cache_ttl
-            ]
-            for key in expired_keys:
-                del prediction_cache[key]
-            
-            if expired_keys:
-                logger.debug(f"Cleaned up {len(expired_keys)} expired cache entries")
-                
+            prediction_cache[cache_key] = (
+                response,
+                orjson.dumps(response.model_dump(by_alias=True))
+            )
         except Exception as cache_error:
-            logger.warning(f"Error managing cache: {str(cache_error)}")
+            logger.warning("Error managing cache: %s", str(cache_error))
             # Continue without caching if cache operations fail
         
-        logger.info(f"Prediction successful: {prediction_result['level']} (cached with key: {cache_key[:8]}...)")
+        logger.info("Prediction successful: %s (cached with key: %s...)", prediction_result['level'], cache_key[:8])
         return response
         
     except PydanticValidationError as e:
-        logger.warning(f"Validation error in prediction request from {client_ip}: {str(e)}")
+        logger.warning("Validation error in prediction request from %s: %s", client_ip, str(e))
         
         # Format validation errors
         validation_errors = []
@@ -1359,7 +1715,7 @@ async def predict_stress(request: StressPredictionRequest, http_request: Request
                 "message": "Invalid input data provided",
                 "details": validation_errors,
                 "timestamp": datetime.now().isoformat(),
-                "request_id": f"req_{datetime.now().timestamp()}"
+                "request_id": f"req_{time.monotonic_ns()}"
             }
         )
     
@@ -1368,8 +1724,8 @@ async def predict_stress(request: StressPredictionRequest, http_request: Request
         raise
     
     except Exception as e:
-        logger.error(f"Unexpected error in prediction endpoint from {client_ip}: {str(e)}")
-        logger.error(f"Exception type: {type(e).__name__}")
+        logger.error("Unexpected error in prediction endpoint from %s: %s", client_ip, str(e))
+        logger.error("Exception type: %s", type(e).__name__)
         
         # Return fallback response for unexpected errors
         try:
@@ -1377,18 +1733,86 @@ async def predict_stress(request: StressPredictionRequest, http_request: Request
             _log_prediction_result({"level": "Medium", "confidence": 0.5, "model_name": "Fallback (Unexpected Error)"})
             return fallback_response
         except Exception as fallback_error:
-            logger.critical(f"Fallback response creation failed: {str(fallback_error)}")
+            logger.critical("Fallback response creation failed: %s", str(fallback_error))
             raise HTTPException(
                 status_code=500,
                 detail={
                     "error": "InternalServerError",
                     "message": "An unexpected error occurred while processing your request",
                     "timestamp": datetime.now().isoformat(),
-                    "request_id": f"req_{datetime.now().timestamp()}"
+                    "request_id": f"req_{time.monotonic_ns()}"
                 }
             )
 
 
+@app.post("/predict_batch", response_model=List[StressPredictionResponse], response_model_exclude_unset=True)
+async def predict_stress_batch(requests: List[StressPredictionRequest], http_request: Request):
+    """
+    Predict stress levels for a batch of inputs in a single model call.
+
+    This endpoint accepts a list of prediction requests, stacks them into
+    one feature matrix, and runs the ML model once for the whole batch.
+    It amortizes per-call model overhead for clients that submit many
+    assessments at once.
+
+    Requirements: 1.2, 1.3
+    """
+    client_ip = http_request.client.host if http_request.client else "unknown"
+    logger.info(f"Batch prediction request from {client_ip} ({len(requests)} items)")
+
+    if not requests:
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "error": "EmptyBatch",
+                "message": "Batch must contain at least one prediction request",
+                "timestamp": datetime.now().isoformat()
+            }
+        )
+
+    if not model_loaded or model_service is None:
+        logger.error("ML model not available - returning fallback responses for batch")
+        return [_create_fallback_response() for _ in requests]
+
+    model_inputs = [request.to_model_format() for request in requests]
+
+    try:
+        batch_results = await asyncio.get_running_loop().run_in_executor(
+            prediction_executor, model_service.predict_batch, model_inputs
+        )
+    except Exception as model_error:
+        logger.error(f"Batch prediction failed from {client_ip}: {str(model_error)}")
+        return [_create_fallback_response() for _ in requests]
+
+    if batch_results is None:
+        logger.error("Batch prediction returned None - returning fallback responses")
+        return [_create_fallback_response() for _ in requests]
+
+    responses = []
+    for prediction_result in batch_results:
+        try:
+            wellness_plan = _create_wellness_plan(
+                prediction_result['level'],
+                prediction_result['insights']
+            )
+            responses.append(StressPredictionResponse.model_construct(
+                level=prediction_result['level'],
+                score=prediction_result['score'],
+                confidence=prediction_result['confidence'],
+                insights=prediction_result['insights'],
+                recommendations=prediction_result['recommendations'],
+                wellness_plan=wellness_plan,
+                model_name=prediction_result.get('model_name'),
+                model_score=prediction_result.get('model_score')
+            ))
+        except Exception as response_error:
+            logger.error(f"Error formatting batch response item: {str(response_error)}")
+            responses.append(_create_fallback_response())
+
+    logger.info(f"Batch prediction successful for {len(responses)} items")
+    return responses
+
+
 @app.get("/analytics")
 async def get_model_analytics():
     """
@@ -1508,22 +1932,27 @@ if __name__ == "__main__":
     This section runs when the script is executed directly.
     It starts the Uvicorn server with appropriate configuration.
     """
-    import os
-    
     logger.info("Starting PULSE-AI Backend API server...")
     
     # Get port from environment variable (for Render deployment) or default to 8000
     port = int(os.getenv("PORT", 8000))
     host = os.getenv("HOST", "0.0.0.0")
-    
-    logger.info(f"Server will run on {host}:{port}")
-    
-    # Run the application with Uvicorn
+    workers = int(os.getenv("WORKERS", os.cpu_count() or 1))
+
+    logger.info(f"Server will run on {host}:{port} with {workers} worker(s)")
+
+    # Run the application with Uvicorn. uvloop and httptools ship with
+    # uvicorn[standard] and outperform the asyncio/h11 defaults; the
+    # per-request access log is disabled in production (ACCESS_LOG=true
+    # re-enables it).
     uvicorn.run(
         "app:app",
         host=host,
         port=port,
         reload=False,  # Disable reload in production
         log_level="info",
-        access_log=True
+        loop="uvloop",
+        http="httptools",
+        workers=workers,
+        access_log=os.getenv("ACCESS_LOG", "false").lower() == "true"
     )
\ No newline at end of file
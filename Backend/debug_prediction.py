@@ -44,26 +44,41 @@ categorical_mappings = {
     }
 }
 
-# Process input
-processed_features = []
-for feature in feature_names:
-    value = test_input[feature]
-    
-    # Handle categorical features
-    if feature in categorical_mappings:
-        if value in categorical_mappings[feature]:
-            processed_value = categorical_mappings[feature][value]
-        else:
+# Build a packer specialized to this model's feature order: columns are
+# split into categorical and scalar groups up front so the per-call loops
+# are branch-free straight-line assignments into a preallocated buffer,
+# mirroring the precompiled lookup-table path in the production ModelService
+cat_columns = [
+    (i, feature, categorical_mappings[feature])
+    for i, feature in enumerate(feature_names)
+    if feature in categorical_mappings
+]
+scalar_columns = [
+    (i, feature) for i, feature in enumerate(feature_names)
+    if feature not in categorical_mappings
+]
+feature_array = np.empty((1, len(feature_names)), dtype=np.float32)
+
+
+def pack_input(input_data, out):
+    row = out[0]
+    for i, feature, lut in cat_columns:
+        value = input_data[feature]
+        processed_value = lut.get(value)
+        if processed_value is None:
             print(f"ERROR: Invalid categorical value for {feature}: {value}")
             processed_value = 0
-    else:
+        row[i] = processed_value
+        print(f"{feature}: {value} -> {processed_value}")
+    for i, feature in scalar_columns:
+        value = input_data[feature]
         processed_value = float(value)
-    
-    processed_features.append(processed_value)
-    print(f"{feature}: {value} -> {processed_value}")
+        row[i] = processed_value
+        print(f"{feature}: {value} -> {processed_value}")
+
 
-# Convert to numpy array
-feature_array = np.array(processed_features).reshape(1, -1)
+# Process input
+pack_input(test_input, feature_array)
 print(f"\nFeature array: {feature_array}")
 
 # Make prediction
@@ -17,27 +17,122 @@ Requirements covered: 1.1, 1.2, 4.3, 6.1
 
 import pickle
 import logging
+import threading
 import numpy as np
-import pandas as pd
 from typing import Dict, Any, Optional, List
 import os
 
-# Import sklearn classes that might be needed for unpickling
+# sklearn submodules needed so pickle can resolve estimator classes when
+# unpickling. Imported lazily in load_model rather than at module import:
+# pulling in sklearn (and scipy/threadpoolctl behind it) costs hundreds
+# of milliseconds and tens of MB before the first request.
+_SKLEARN_UNPICKLE_MODULES = (
+    'sklearn.ensemble', 'sklearn.neural_network', 'sklearn.naive_bayes',
+    'sklearn.neighbors', 'sklearn.preprocessing', 'sklearn.svm',
+    'sklearn.linear_model', 'sklearn.tree'
+)
+
+
+def _import_sklearn_modules():
+    """Import the sklearn submodules pickle needs to resolve classes."""
+    import importlib
+    for module_name in _SKLEARN_UNPICKLE_MODULES:
+        try:
+            importlib.import_module(module_name)
+        except ImportError as e:
+            logging.warning(f"Could not import {module_name}: {e}")
+
+
+# joblib ships with scikit-learn; used for memory-mapped model loading
+try:
+    import joblib
+except ImportError:
+    joblib = None
+
+# Optional skops for safe sklearn model serialization: its constrained
+# deserializer only reconstructs vetted types instead of running
+# arbitrary pickle opcodes
 try:
-    from sklearn.ensemble import RandomForestClassifier
-    from sklearn.neural_network import MLPClassifier
-    from sklearn.naive_bayes import GaussianNB
-    from sklearn.neighbors import KNeighborsClassifier
-    from sklearn.preprocessing import StandardScaler, LabelEncoder
-    from sklearn.svm import SVC
-    from sklearn.linear_model import LogisticRegression
-    from sklearn.tree import DecisionTreeClassifier
-except ImportError as e:
-    logging.warning(f"Could not import some sklearn classes: {e}")
+    import skops.io as skops_io
+except ImportError:
+    skops_io = None
+
+# Optional numba for the compiled forest-traversal kernel
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+# Optional ONNX Runtime for serving exported models (see models/export_onnx.py)
+try:
+    import onnxruntime as ort
+except ImportError:
+    ort = None
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Recommendation tables built once at import time. Tuples are immutable,
+# so they can be returned directly and shared across requests without
+# re-allocating a list per prediction.
+_REC_TABLE = {
+    'Low': (
+        "Maintain your current healthy lifestyle habits",
+        "Continue regular physical activity and good sleep schedule"
+    ),
+    'Medium': (
+        "Focus on improving sleep quality and duration",
+        "Incorporate regular physical exercise into your routine",
+        "Practice stress-reduction techniques like deep breathing"
+    ),
+    'High': (
+        "Prioritize getting adequate sleep (7-9 hours per night)",
+        "Engage in regular physical activity to reduce stress hormones",
+        "Practice meditation or mindfulness exercises daily",
+        "Consider speaking with a healthcare professional"
+    )
+}
+_REC_DEFAULT = ("Focus on maintaining a balanced lifestyle",)
+
+# Sentinel for one-pass missing-feature detection via dict.get
+_MISSING = object()
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _forest_predict_proba(X, features, thresholds, left, right, values, offsets):
+        """
+        Walk every tree of a flattened random forest for each input row.
+
+        Rows are parallelized with prange (each row owns its output slice,
+        so there is no cross-thread accumulation). The forest is stored in
+        structure-of-arrays form: one contiguous array per node field with
+        all trees concatenated and an offsets table marking each tree's
+        root, so thresholds stay packed in cache across trees and child
+        indices are plain global offsets. The native loop avoids sklearn's
+        per-call Python and Cython dispatch overhead.
+        """
+        n_rows = X.shape[0]
+        n_trees = offsets.shape[0] - 1
+        n_classes = values.shape[1]
+        out = np.zeros((n_rows, n_classes), dtype=np.float64)
+
+        for i in prange(n_rows):
+            for t in range(n_trees):
+                node = offsets[t]
+                while left[node] != -1:
+                    if X[i, features[node]] <= thresholds[node]:
+                        node = left[node]
+                    else:
+                        node = right[node]
+                for c in range(n_classes):
+                    out[i, c] += values[node, c]
+            for c in range(n_classes):
+                out[i, c] /= n_trees
+
+        return out
+else:
+    _forest_predict_proba = None
+
 print("DEBUG: model_service.py - Starting module execution")
 
 
@@ -60,7 +155,33 @@ class ModelService:
         self.model_name = None
         self.model_score = None
         self.is_loaded = False
-        
+
+        # Feature importance cache, populated once in load_model so the
+        # per-prediction path is a plain attribute read
+        self._feature_importance = None
+        self._top_feature_name = None
+
+        # Flattened forest arrays for the numba kernel (set in load_model
+        # when the model is a RandomForest and numba is available)
+        self._forest_arrays = None
+
+        # ONNX Runtime session (set when loading an exported .onnx model)
+        self._session = None
+        self._onnx_input_name = None
+
+        # Bounded cache of prediction results keyed by the sorted input
+        # items; identical inputs skip the ensemble entirely
+        self._prediction_cache = {}
+
+        # Per-thread scratch buffer for single-row preprocessing, so the
+        # hot path reuses one (1, F) float32 array per worker thread
+        # instead of allocating a list plus a fresh ndarray per call
+        self._scratch = threading.local()
+
+        # Specialized per-feature preprocessing plan (built in load_model
+        # once feature_names is known)
+        self._preprocess_plan = None
+
         # Expected feature names based on the dataset structure
         self.expected_features = [
             'Age', 'Gender', 'Sleep_Duration', 'Sleep_Quality', 
@@ -85,6 +206,33 @@ class ModelService:
             'Low': 0, 'Medium': 1, 'High': 2
         }
         self.reverse_stress_mappings = {v: k for k, v in self.stress_level_mappings.items()}
+
+        # Numerical score (0-100) per stress level: one hash lookup in the
+        # hot path instead of a chain of string comparisons
+        self._score_table = {'Low': 25, 'Medium': 50, 'High': 75}
+
+        # Validation bounds as parallel vectors: one vectorized comparison
+        # replaces nine chained Python range checks, and error strings are
+        # only built for the failing features
+        self._range_features = (
+            'Age', 'Sleep_Duration', 'Sleep_Quality', 'Physical_Activity',
+            'Screen_Time', 'Caffeine_Intake', 'Work_Hours', 'Travel_Time',
+            'Social_Interactions'
+        )
+        self._range_units = (
+            '', ' hours', '', '', ' hours', ' cups', ' hours', ' hours', ''
+        )
+        self._range_lo = np.array([18, 4, 1, 0, 1, 0, 4, 0, 1], dtype=np.float32)
+        self._range_hi = np.array([65, 12, 5, 5, 14, 8, 16, 4, 5], dtype=np.float32)
+
+        # Sorted key/value arrays per categorical column, built once here
+        # so batch preprocessing can encode a whole column with a single
+        # np.searchsorted call instead of one dict lookup per row
+        self._categorical_arrays = {}
+        for feature, mapping in self.categorical_mappings.items():
+            keys = np.array(sorted(mapping.keys()))
+            values = np.array([mapping[k] for k in keys], dtype=np.float32)
+            self._categorical_arrays[feature] = (keys, values)
     
     def load_model(self) -> bool:
         """
@@ -107,10 +255,39 @@ class ModelService:
                 return False
             
             logger.info(f"Model file size: {file_size} bytes")
-            
-            # Load model artifacts
-            with open(self.model_path, 'rb') as f:
-                model_artifacts = pickle.load(f)
+
+            # Exported ONNX models are served through ONNX Runtime
+            if self.model_path.endswith('.onnx'):
+                return self._load_onnx_model()
+
+            # Load model artifacts. .skops files go through skops'
+            # constrained deserializer, which rejects unvetted types
+            # instead of executing arbitrary pickle opcodes.
+            if self.model_path.endswith('.skops'):
+                if skops_io is None:
+                    logger.error("skops is not installed; cannot load .skops model")
+                    return False
+                model_artifacts = skops_io.load(self.model_path)
+            elif self.model_path.endswith('.joblib'):
+                if joblib is None:
+                    logger.error("joblib is not installed; cannot load .joblib model")
+                    return False
+                # Memory-map the ndarray payloads: startup avoids a full
+                # deserialization pass, and with gunicorn --preload the
+                # mapped pages are shared across forked workers instead
+                # of each holding a private heap copy
+                model_artifacts = joblib.load(self.model_path, mmap_mode='r')
+            else:
+                logger.warning(
+                    f"Loading model via pickle from {self.model_path}; "
+                    "pickle executes arbitrary code on load - prefer a "
+                    ".skops artifact (see save_model_safe)"
+                )
+                # Make the estimator classes resolvable for unpickling
+                # (deferred from module import to keep cold start lean)
+                _import_sklearn_modules()
+                with open(self.model_path, 'rb') as f:
+                    model_artifacts = pickle.load(f)
             
             # Validate model artifacts structure
             required_keys = ['model', 'feature_names', 'model_name', 'model_score']
@@ -135,14 +312,186 @@ class ModelService:
             logger.info(f"  - Model name: {self.model_name}")
             logger.info(f"  - Model score: {self.model_score:.4f}")
             logger.info(f"  - Feature count: {len(self.feature_names)}")
-            
+
+            # Cache feature importance once: _get_feature_importance runs
+            # on every predict call (directly and via _generate_insights),
+            # and the scores never change after load
+            if hasattr(self.model, 'feature_importances_'):
+                importance_scores = self.model.feature_importances_
+                self._feature_importance = {
+                    feature_name: float(importance_scores[i])
+                    for i, feature_name in enumerate(self.feature_names)
+                    if i < len(importance_scores)
+                }
+                if self._feature_importance:
+                    self._top_feature_name = max(
+                        self._feature_importance, key=self._feature_importance.get
+                    )
+
+            # Flatten random forests into stacked arrays for the compiled
+            # traversal kernel (no-op for other estimator types)
+            self._compile_forest()
+
+            # Specialize the per-feature preprocessing plan for this model
+            self._compile_preprocess_plan()
+
+            # A different model invalidates any cached predictions
+            self._prediction_cache.clear()
+
             self.is_loaded = True
             return True
             
         except Exception as e:
             logger.error(f"Error loading model: {str(e)}")
             return False
-    
+
+    def _load_onnx_model(self) -> bool:
+        """
+        Load an ONNX-exported model through ONNX Runtime.
+
+        Models exported with models/export_onnx.py run the forest as one
+        compiled graph with fused SIMD kernels and skip pickle entirely at
+        startup. Setting PULSE_DEVICE=cuda selects the CUDA execution
+        provider when a GPU build of onnxruntime is installed.
+        """
+        if ort is None:
+            logger.error("onnxruntime is not installed; cannot load ONNX model")
+            return False
+
+        if os.getenv('PULSE_DEVICE', 'cpu').lower() == 'cuda':
+            providers = ['CUDAExecutionProvider', 'CPUExecutionProvider']
+        else:
+            providers = ['CPUExecutionProvider']
+
+        self._session = ort.InferenceSession(self.model_path, providers=providers)
+        self._onnx_input_name = self._session.get_inputs()[0].name
+
+        # Feature order is fixed by the export; metadata carries the rest
+        metadata = self._session.get_modelmeta().custom_metadata_map
+        self.feature_names = list(self.expected_features)
+        self.model_name = metadata.get('model_name', 'ONNXModel')
+        self.model_score = float(metadata.get('model_score', 0.0))
+
+        logger.info(f"ONNX model loaded: {self.model_name}")
+
+        self._compile_preprocess_plan()
+
+        self._prediction_cache.clear()
+
+        self.is_loaded = True
+        return True
+
+    def _compile_forest(self):
+        """
+        Flatten a RandomForest into SoA node arrays for the numba kernel.
+
+        All trees' feature/threshold/children/value buffers are
+        concatenated into one contiguous array per field, with an offset
+        table marking each tree's root, so _forest_predict_proba can
+        traverse the whole forest in one compiled call with no padding
+        waste and cache-friendly threshold loads. Thresholds are stored
+        as float32 and feature indices as int16 - with 13 features and
+        bounded inputs the precision loss is far below threshold
+        granularity. The kernel is warmed with a dummy row so the JIT
+        cost is paid at load time.
+        """
+        self._forest_arrays = None
+
+        if _forest_predict_proba is None:
+            return
+
+        try:
+            from sklearn.ensemble import RandomForestClassifier
+        except ImportError:
+            return
+
+        if not isinstance(self.model, RandomForestClassifier):
+            return
+
+        try:
+            estimators = self.model.estimators_
+            n_trees = len(estimators)
+            node_counts = np.array(
+                [est.tree_.node_count for est in estimators], dtype=np.int64
+            )
+
+            # Per-tree root offsets into the concatenated node arrays
+            offsets = np.zeros(n_trees + 1, dtype=np.int64)
+            np.cumsum(node_counts, out=offsets[1:])
+            total_nodes = int(offsets[-1])
+
+            features = np.concatenate(
+                [est.tree_.feature for est in estimators]
+            ).astype(np.int16)
+            thresholds = np.concatenate(
+                [est.tree_.threshold for est in estimators]
+            ).astype(np.float32)
+
+            # Child pointers are tree-local; shift them by the tree's
+            # offset so they index the concatenated arrays directly
+            # (leaf markers stay -1)
+            left = np.full(total_nodes, -1, dtype=np.int32)
+            right = np.full(total_nodes, -1, dtype=np.int32)
+            values_parts = []
+            for t, estimator in enumerate(estimators):
+                tree = estimator.tree_
+                start, end = offsets[t], offsets[t + 1]
+
+                tree_left = tree.children_left.astype(np.int32)
+                tree_right = tree.children_right.astype(np.int32)
+                tree_left[tree_left >= 0] += start
+                tree_right[tree_right >= 0] += start
+                left[start:end] = tree_left
+                right[start:end] = tree_right
+
+                # Normalize leaf value rows to per-tree class probabilities
+                # (matches what predict_proba does per call)
+                node_values = tree.value[:, 0, :].astype(np.float32)
+                row_sums = node_values.sum(axis=1, keepdims=True)
+                np.divide(node_values, row_sums, out=node_values, where=row_sums > 0)
+                values_parts.append(node_values)
+
+            values = np.ascontiguousarray(np.concatenate(values_parts))
+
+            self._forest_arrays = (features, thresholds, left, right, values, offsets)
+
+            # Warm the JIT so the first request does not pay compilation
+            warm_row = np.zeros((1, len(self.feature_names)), dtype=np.float32)
+            _forest_predict_proba(warm_row, *self._forest_arrays)
+
+            logger.info(f"Compiled forest kernel: {n_trees} trees, {total_nodes} nodes")
+
+        except Exception as e:
+            logger.error(f"Error compiling forest kernel: {str(e)}")
+            self._forest_arrays = None
+
+    def _compile_preprocess_plan(self):
+        """
+        Partially evaluate the preprocessing loop for the loaded model.
+
+        feature_names, the categorical mappings, and the validation
+        bounds are all fixed once a model is loaded, so the generic
+        loop's per-call dict membership tests and the separate range
+        pass collapse into one tuple of (feature, lut, bounds) entries
+        that preprocess_input consumes as straight-line work per feature.
+        """
+        bounds_by_feature = {
+            feature: (
+                float(self._range_lo[i]),
+                float(self._range_hi[i]),
+                self._range_units[i]
+            )
+            for i, feature in enumerate(self._range_features)
+        }
+        self._preprocess_plan = tuple(
+            (
+                feature,
+                self.categorical_mappings.get(feature),
+                bounds_by_feature.get(feature)
+            )
+            for feature in self.feature_names
+        )
+
     def preprocess_input(self, input_data: Dict[str, Any]) -> Optional[np.ndarray]:
         """
         Preprocess input data for model prediction.
@@ -154,188 +503,301 @@ class ModelService:
         Requirements: 1.2, 4.3
         """
         try:
-            logger.debug(f"Preprocessing input data: {input_data}")
-            
-            # Validate required features are present
-            missing_features = []
-            for feature in self.expected_features:
-                if feature not in input_data:
-                    missing_features.append(feature)
-            
-            if missing_features:
-                logger.error(f"Missing required features: {missing_features}")
-                return None
-            
-            # Validate data ranges and types BEFORE processing
-            validation_errors = self._validate_input_ranges(input_data)
-            if validation_errors:
-                logger.error(f"Input validation errors: {validation_errors}")
-                return None
-            
-            # Create feature array in the correct order
-            processed_features = []
-            
-            for feature in self.feature_names:
-                if feature in input_data:
-                    value = input_data[feature]
-                    
-                    # Handle categorical features
-                    if feature in self.categorical_mappings:
-                        if value in self.categorical_mappings[feature]:
-                            processed_value = self.categorical_mappings[feature][value]
-                        else:
-                            logger.error(f"Invalid categorical value for {feature}: {value}")
-                            logger.error(f"Valid values are: {list(self.categorical_mappings[feature].keys())}")
-                            return None
-                    else:
-                        # Handle numerical features
-                        try:
-                            processed_value = float(value)
-                        except (ValueError, TypeError):
-                            logger.error(f"Invalid numerical value for {feature}: {value}")
-                            return None
-                    
-                    processed_features.append(processed_value)
-                else:
+            # Gate debug logs so the f-string (and the numpy repr below)
+            # is never built when DEBUG is off
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Preprocessing input data: {input_data}")
+
+            # The specialized plan folds the categorical-vs-numerical
+            # branch and the range bounds into one precomputed tuple, so
+            # this loop does no dict membership tests and no separate
+            # validation pass
+            plan = self._preprocess_plan
+            if plan is None:
+                self._compile_preprocess_plan()
+                plan = self._preprocess_plan
+
+            # Fill the thread-local scratch row in the correct order. One
+            # pass with a dict.get sentinel replaces the separate
+            # missing-feature pre-pass plus the `in` check / lookup pair
+            # per feature; writing into the reusable float32 buffer avoids
+            # a per-call list plus ndarray allocation. (Each worker thread
+            # gets its own buffer, so concurrent calls cannot clobber one
+            # another's rows.)
+            feature_array = getattr(self._scratch, 'buf', None)
+            if feature_array is None:
+                feature_array = np.empty((1, len(self.feature_names)), dtype=np.float32)
+                self._scratch.buf = feature_array
+            row = feature_array[0]
+
+            for i, (feature, lut, bounds) in enumerate(plan):
+                value = input_data.get(feature, _MISSING)
+                if value is _MISSING:
                     logger.error(f"Feature {feature} not found in input data")
                     return None
-            
-            # Convert to numpy array and reshape for single prediction
-            feature_array = np.array(processed_features).reshape(1, -1)
-            
-            logger.debug(f"Preprocessed features shape: {feature_array.shape}")
-            logger.debug(f"Preprocessed features: {feature_array[0]}")
-            
+
+                # Handle categorical features
+                if lut is not None:
+                    processed_value = lut.get(value)
+                    if processed_value is None:
+                        logger.error(f"Invalid categorical value for {feature}: {value}")
+                        logger.error(f"Valid values are: {list(lut.keys())}")
+                        return None
+                else:
+                    # Handle numerical features with the inline range check
+                    try:
+                        processed_value = float(value)
+                    except (ValueError, TypeError):
+                        logger.error(f"Invalid numerical value for {feature}: {value}")
+                        return None
+
+                    if bounds is not None:
+                        lo, hi, unit = bounds
+                        if processed_value < lo or processed_value > hi:
+                            logger.error(
+                                f"Input validation errors: "
+                                f"['{feature} must be between {int(lo)} and "
+                                f"{int(hi)}{unit}, got {value}']"
+                            )
+                            return None
+
+                row[i] = processed_value
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Preprocessed features shape: {feature_array.shape}")
+                logger.debug(f"Preprocessed features: {feature_array[0]}")
+
             return feature_array
             
         except Exception as e:
             logger.error(f"Error preprocessing input data: {str(e)}")
             return None
     
+    def preprocess_batch(self, input_rows: List[Dict[str, Any]]) -> Optional[np.ndarray]:
+        """
+        Preprocess a batch of input dictionaries into an (N, F) feature matrix.
+
+        Unlike preprocess_input, which loops over features in Python for a
+        single row, this encodes each column in one vectorized pass: the
+        sorted key arrays built in __init__ let np.searchsorted translate a
+        whole categorical column at once, and numerical columns are cast
+        with a single np.asarray call. Per-row interpreter work is limited
+        to the validation checks.
+
+        Requirements: 1.2, 4.3
+        """
+        try:
+            if not input_rows:
+                return None
+
+            for input_data in input_rows:
+                missing_features = [
+                    feature for feature in self.expected_features
+                    if feature not in input_data
+                ]
+                if missing_features:
+                    logger.error(f"Missing required features: {missing_features}")
+                    return None
+
+                validation_errors = self._validate_input_ranges(input_data)
+                if validation_errors:
+                    logger.error(f"Input validation errors: {validation_errors}")
+                    return None
+
+            n_rows = len(input_rows)
+            feature_matrix = np.empty((n_rows, len(self.feature_names)), dtype=np.float32)
+
+            for i, feature in enumerate(self.feature_names):
+                cat_arrays = self._categorical_arrays.get(feature)
+
+                if cat_arrays is not None:
+                    # Vectorized categorical encoding: one searchsorted per column
+                    keys, values = cat_arrays
+                    raw = np.array([row[feature] for row in input_rows])
+                    idx = np.searchsorted(keys, raw)
+                    idx_clipped = np.minimum(idx, len(keys) - 1)
+                    invalid = keys[idx_clipped] != raw
+                    if invalid.any():
+                        bad_value = raw[invalid][0]
+                        logger.error(f"Invalid categorical value for {feature}: {bad_value}")
+                        logger.error(f"Valid values are: {list(keys)}")
+                        return None
+                    feature_matrix[:, i] = values[idx_clipped]
+                else:
+                    # Numerical column: single batched cast
+                    try:
+                        feature_matrix[:, i] = np.asarray(
+                            [row[feature] for row in input_rows], dtype=np.float32
+                        )
+                    except (ValueError, TypeError):
+                        logger.error(f"Invalid numerical value in column {feature}")
+                        return None
+
+            logger.debug(f"Preprocessed batch shape: {feature_matrix.shape}")
+            return feature_matrix
+
+        except Exception as e:
+            logger.error(f"Error preprocessing input batch: {str(e)}")
+            return None
+
     def _validate_input_ranges(self, input_data: Dict[str, Any]) -> List[str]:
-        """Validate input data ranges based on dataset boundaries."""
+        """
+        Validate input data ranges based on dataset boundaries.
+
+        All nine numeric features are checked with one vectorized
+        comparison against the bounds vectors built in __init__; error
+        messages are only formatted for the features that fail.
+        """
         errors = []
-        
+
         try:
-            # Age validation
-            age = input_data.get('Age', 0)
-            if not (18 <= age <= 65):
-                errors.append(f"Age must be between 18 and 65, got {age}")
-            
-            # Sleep duration validation
-            sleep_duration = input_data.get('Sleep_Duration', 0)
-            if not (4 <= sleep_duration <= 12):
-                errors.append(f"Sleep_Duration must be between 4 and 12 hours, got {sleep_duration}")
-            
-            # Sleep quality validation
-            sleep_quality = input_data.get('Sleep_Quality', 0)
-            if not (1 <= sleep_quality <= 5):
-                errors.append(f"Sleep_Quality must be between 1 and 5, got {sleep_quality}")
-            
-            # Physical activity validation
-            physical_activity = input_data.get('Physical_Activity', 0)
-            if not (0 <= physical_activity <= 5):
-                errors.append(f"Physical_Activity must be between 0 and 5, got {physical_activity}")
-            
-            # Screen time validation
-            screen_time = input_data.get('Screen_Time', 0)
-            if not (1 <= screen_time <= 14):
-                errors.append(f"Screen_Time must be between 1 and 14 hours, got {screen_time}")
-            
-            # Caffeine intake validation
-            caffeine_intake = input_data.get('Caffeine_Intake', 0)
-            if not (0 <= caffeine_intake <= 8):
-                errors.append(f"Caffeine_Intake must be between 0 and 8 cups, got {caffeine_intake}")
-            
-            # Work hours validation
-            work_hours = input_data.get('Work_Hours', 0)
-            if not (4 <= work_hours <= 16):
-                errors.append(f"Work_Hours must be between 4 and 16 hours, got {work_hours}")
-            
-            # Travel time validation
-            travel_time = input_data.get('Travel_Time', 0)
-            if not (0 <= travel_time <= 4):
-                errors.append(f"Travel_Time must be between 0 and 4 hours, got {travel_time}")
-            
-            # Social interactions validation
-            social_interactions = input_data.get('Social_Interactions', 0)
-            if not (1 <= social_interactions <= 5):
-                errors.append(f"Social_Interactions must be between 1 and 5, got {social_interactions}")
-            
+            values = np.array(
+                [input_data.get(feature, 0) for feature in self._range_features],
+                dtype=np.float32
+            )
+            out_of_range = (values < self._range_lo) | (values > self._range_hi)
+
+            if out_of_range.any():
+                for i in np.flatnonzero(out_of_range):
+                    feature = self._range_features[i]
+                    errors.append(
+                        f"{feature} must be between {int(self._range_lo[i])} "
+                        f"and {int(self._range_hi[i])}{self._range_units[i]}, "
+                        f"got {input_data.get(feature, 0)}"
+                    )
+
         except Exception as e:
             errors.append(f"Error during validation: {str(e)}")
-        
+
         return errors
     
     def predict(self, input_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
         Generate stress level prediction with confidence scoring.
-        
+
+        Single predictions run through predict_batch with a one-element
+        list, so both paths share the same preprocessing and model call.
+        Results are cached per distinct input: the model is
+        deterministic, so a repeated dict returns the stored result in
+        one dict lookup instead of another ensemble evaluation.
+
+        Requirements: 1.2, 4.3
+        """
+        try:
+            cache_key = tuple(sorted(input_data.items()))
+        except TypeError:
+            cache_key = None
+
+        if cache_key is not None:
+            cached = self._prediction_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        results = self.predict_batch([input_data])
+        if results is None:
+            return None
+
+        result = results[0]
+        if cache_key is not None and result is not None:
+            # FIFO-bounded so long-running servers cannot grow it freely
+            if len(self._prediction_cache) >= 128:
+                self._prediction_cache.pop(next(iter(self._prediction_cache)))
+            self._prediction_cache[cache_key] = result
+
+        return result
+
+    def predict_batch(self, input_rows: List[Dict[str, Any]]) -> Optional[List[Dict[str, Any]]]:
+        """
+        Generate stress level predictions for a batch of inputs.
+
+        All rows are stacked into a single (N, F) float32 matrix via
+        preprocess_batch so that model.predict / predict_proba run once
+        per batch instead of once per row, amortizing sklearn's per-call
+        dispatch overhead across the whole batch.
+
         Requirements: 1.2, 4.3
         """
         try:
             if not self.is_loaded:
                 logger.error("Model not loaded. Call load_model() first.")
                 return None
-            
-            # Preprocess input data
-            processed_features = self.preprocess_input(input_data)
-            if processed_features is None:
+
+            # Preprocess all rows into one contiguous matrix
+            feature_matrix = self.preprocess_batch(input_rows)
+            if feature_matrix is None:
                 logger.error("Failed to preprocess input data")
                 return None
-            
-            # Generate prediction
-            prediction = self.model.predict(processed_features)[0]
-            
-            # Get prediction probabilities for confidence scoring
-            confidence_score = 0.0
-            if hasattr(self.model, 'predict_proba'):
-                probabilities = self.model.predict_proba(processed_features)[0]
-                confidence_score = float(np.max(probabilities))
-            else:
-                confidence_score = 0.8  # Default confidence
-            
-            # Convert prediction to stress level
-            if isinstance(prediction, (int, np.integer)):
-                if prediction in self.reverse_stress_mappings:
-                    stress_level = self.reverse_stress_mappings[prediction]
+
+            # Single model call for the whole batch. ONNX exports run
+            # through the Runtime session, random forests go through the
+            # compiled traversal kernel when available, and other
+            # estimator types fall back to sklearn.
+            if self._session is not None:
+                outputs = self._session.run(
+                    None, {self._onnx_input_name: feature_matrix}
+                )
+                predictions = outputs[0]
+                if len(outputs) > 1:
+                    raw_probs = outputs[1]
+                    if isinstance(raw_probs[0], dict):
+                        confidences = np.array(
+                            [max(row.values()) for row in raw_probs]
+                        )
+                    else:
+                        confidences = np.max(raw_probs, axis=1)
                 else:
-                    logger.error(f"Invalid prediction value: {prediction}")
-                    return None
-            else:
-                stress_level = str(prediction)
-            
-            # Calculate numerical score (0-100)
-            if stress_level == 'Low':
-                numerical_score = 25
-            elif stress_level == 'Medium':
-                numerical_score = 50
-            elif stress_level == 'High':
-                numerical_score = 75
+                    confidences = np.full(len(input_rows), 0.8)  # Default confidence
+            elif self._forest_arrays is not None:
+                probabilities = _forest_predict_proba(feature_matrix, *self._forest_arrays)
+                predictions = self.model.classes_[np.argmax(probabilities, axis=1)]
+                confidences = np.max(probabilities, axis=1)
             else:
-                numerical_score = 50
-            
-            # Generate insights and recommendations
-            insights = self._generate_insights(input_data, stress_level)
-            recommendations = self._generate_recommendations(stress_level)
-            
-            # Get feature importance for additional analysis
-            feature_importance = self._get_feature_importance()
-            
-            result = {
-                'level': stress_level,
-                'score': numerical_score,
-                'confidence': confidence_score,
-                'insights': insights,
-                'recommendations': recommendations,
-                'model_name': self.model_name,
-                'model_score': self.model_score,
-                'feature_importance': feature_importance
-            }
-            
-            logger.info(f"Prediction generated: {stress_level} (confidence: {confidence_score:.3f})")
-            return result
-            
+                predictions = self.model.predict(feature_matrix)
+
+                # Prediction probabilities for confidence scoring
+                if hasattr(self.model, 'predict_proba'):
+                    probabilities = self.model.predict_proba(feature_matrix)
+                    confidences = np.max(probabilities, axis=1)
+                else:
+                    confidences = np.full(len(input_rows), 0.8)  # Default confidence
+
+            # Feature importance is model-level, shared across the batch
+            feature_importance = self._feature_importance
+
+            results = []
+            for input_data, prediction, confidence in zip(input_rows, predictions, confidences):
+                # Convert prediction to stress level
+                if isinstance(prediction, (int, np.integer)):
+                    if prediction in self.reverse_stress_mappings:
+                        stress_level = self.reverse_stress_mappings[prediction]
+                    else:
+                        logger.error(f"Invalid prediction value: {prediction}")
+                        return None
+                else:
+                    stress_level = str(prediction)
+
+                # Calculate numerical score (0-100)
+                numerical_score = self._score_table.get(stress_level, 50)
+
+                # Generate insights and recommendations
+                insights = self._generate_insights(input_data, stress_level)
+                recommendations = self._generate_recommendations(stress_level)
+
+                results.append({
+                    'level': stress_level,
+                    'score': numerical_score,
+                    'confidence': float(confidence),
+                    'insights': insights,
+                    'recommendations': recommendations,
+                    'model_name': self.model_name,
+                    'model_score': self.model_score,
+                    'feature_importance': feature_importance
+                })
+
+                logger.info(f"Prediction generated: {stress_level} (confidence: {confidence:.3f})")
+
+            return results
+
         except Exception as e:
             logger.error(f"Error generating prediction: {str(e)}")
             return None
@@ -345,9 +807,6 @@ class ModelService:
         insights = []
         
         try:
-            # Get feature importance if available
-            feature_importance = self._get_feature_importance()
-            
             # Sleep-related insights
             sleep_duration = input_data.get('Sleep_Duration', 0)
             if sleep_duration < 6:
@@ -365,13 +824,9 @@ class ModelService:
             if physical_activity < 1:
                 insights.append("Increasing physical activity could help reduce stress")
             
-            # Feature importance insights
-            if feature_importance:
-                top_features = sorted(feature_importance.items(), key=lambda x: x[1], reverse=True)[:3]
-                if len(top_features) > 0:
-                    top_feature_name = top_features[0][0]
-                    if top_feature_name in input_data:
-                        insights.append(f"Your {top_feature_name.lower().replace('_', ' ')} appears to be a key factor in your stress level")
+            # Feature importance insights (top feature cached in load_model)
+            if self._top_feature_name is not None and self._top_feature_name in input_data:
+                insights.append(f"Your {self._top_feature_name.lower().replace('_', ' ')} appears to be a key factor in your stress level")
             
             # Screen time insights
             screen_time = input_data.get('Screen_Time', 0)
@@ -394,46 +849,12 @@ class ModelService:
         return insights
     
     def _get_feature_importance(self) -> Optional[Dict[str, float]]:
-        """Get feature importance from the model if available."""
-        try:
-            if not self.is_loaded or not hasattr(self.model, 'feature_importances_'):
-                return None
-            
-            importance_scores = self.model.feature_importances_
-            feature_importance = {}
-            
-            for i, feature_name in enumerate(self.feature_names):
-                if i < len(importance_scores):
-                    feature_importance[feature_name] = float(importance_scores[i])
-            
-            return feature_importance
-            
-        except Exception as e:
-            logger.error(f"Error getting feature importance: {str(e)}")
-            return None
+        """Get the feature importance dict cached in load_model."""
+        return self._feature_importance
     
-    def _generate_recommendations(self, stress_level: str) -> List[str]:
+    def _generate_recommendations(self, stress_level: str) -> tuple:
         """Generate recommendations based on stress level."""
-        if stress_level == 'Low':
-            return [
-                "Maintain your current healthy lifestyle habits",
-                "Continue regular physical activity and good sleep schedule"
-            ]
-        elif stress_level == 'Medium':
-            return [
-                "Focus on improving sleep quality and duration",
-                "Incorporate regular physical exercise into your routine",
-                "Practice stress-reduction techniques like deep breathing"
-            ]
-        elif stress_level == 'High':
-            return [
-                "Prioritize getting adequate sleep (7-9 hours per night)",
-                "Engage in regular physical activity to reduce stress hormones",
-                "Practice meditation or mindfulness exercises daily",
-                "Consider speaking with a healthcare professional"
-            ]
-        else:
-            return ["Focus on maintaining a balanced lifestyle"]
+        return _REC_TABLE.get(stress_level, _REC_DEFAULT)
     
     def get_model_info(self) -> Dict[str, Any]:
         """Get information about the loaded model."""
@@ -450,6 +871,28 @@ class ModelService:
         }
 
 
+def save_model_safe(model_artifacts: Dict[str, Any], output_path: str) -> bool:
+    """
+    Save model artifacts as a .skops file for safe loading.
+
+    Unlike pickle, a .skops artifact can be loaded without trusting the
+    file's author: skops only reconstructs vetted sklearn/numpy types.
+
+    Requirements: 1.1, 6.1
+    """
+    if skops_io is None:
+        logger.error("skops is not installed; cannot save .skops model")
+        return False
+
+    try:
+        skops_io.dump(model_artifacts, output_path)
+        logger.info(f"Model artifacts saved to: {output_path}")
+        return True
+    except Exception as e:
+        logger.error(f"Error saving model artifacts: {str(e)}")
+        return False
+
+
 # Global model service instance
 model_service = None
 
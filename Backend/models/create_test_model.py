@@ -4,54 +4,99 @@ Create a test model for development purposes.
 """
 import pickle
 import numpy as np
+
+# joblib ships with scikit-learn; used for memory-mapped model loading
+try:
+    import joblib
+except ImportError:
+    joblib = None
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.model_selection import train_test_split
 import pandas as pd
 
-# Load the dataset
-print("Loading dataset...")
-df = pd.read_csv('stress_detection_data.csv')
-
 # Prepare features and target
 feature_columns = [
-    'Age', 'Gender', 'Sleep_Duration', 'Sleep_Quality', 
-    'Physical_Activity', 'Screen_Time', 'Caffeine_Intake', 
-    'Smoking_Habit', 'Work_Hours', 'Travel_Time', 
+    'Age', 'Gender', 'Sleep_Duration', 'Sleep_Quality',
+    'Physical_Activity', 'Screen_Time', 'Caffeine_Intake',
+    'Smoking_Habit', 'Work_Hours', 'Travel_Time',
     'Social_Interactions', 'Meditation_Practice', 'Exercise_Type'
 ]
 
-# Encode categorical variables
-df_encoded = df.copy()
+# Categorical encodings shipped with the model artifacts
 categorical_mappings = {
     'Gender': {'Male': 0, 'Female': 1},
     'Smoking_Habit': {'No': 0, 'Yes': 1},
     'Meditation_Practice': {'No': 0, 'Yes': 1},
     'Exercise_Type': {
-        'Cardio': 0, 'Yoga': 1, 'Strength Training': 2, 
+        'Cardio': 0, 'Yoga': 1, 'Strength Training': 2,
         'Aerobics': 3, 'Walking': 4, 'Pilates': 5
     }
 }
 
-for col, mapping in categorical_mappings.items():
-    if col in df_encoded.columns:
-        df_encoded[col] = df_encoded[col].map(mapping)
+# Pre-defined CategoricalDtypes with the known category order: the CSV
+# parser produces integer codes directly (the mapping values are 0..n-1
+# in key order), so no recode or .map pass is needed afterwards
+categorical_dtypes = {
+    col: pd.CategoricalDtype(list(mapping.keys()))
+    for col, mapping in categorical_mappings.items()
+}
 
-# Prepare features and target
-X = df_encoded[feature_columns]
-y = df_encoded['Stress_Level']
+# Load the dataset. Only the needed columns are parsed, and explicit
+# dtypes skip pandas' type-inference pass over each column.
+print("Loading dataset...")
+df = pd.read_csv(
+    'stress_detection_data.csv',
+    usecols=feature_columns + ['Stress_Level'],
+    dtype={
+        'Age': np.float32,
+        'Sleep_Duration': np.float32,
+        'Sleep_Quality': np.float32,
+        'Physical_Activity': np.float32,
+        'Screen_Time': np.float32,
+        'Caffeine_Intake': np.float32,
+        'Work_Hours': np.float32,
+        'Travel_Time': np.float32,
+        'Social_Interactions': np.float32,
+        **categorical_dtypes
+    },
+    engine='c'
+)
+
+# Encode categorical variables: codes come straight from the parser's
+# categoricals (columns are replaced in place, no full-frame copy)
+for col in categorical_dtypes:
+    df[col] = df[col].cat.codes.astype(np.int8)
+
+# Prepare features and target. float32 is what sklearn's trees use
+# internally, so passing it directly avoids check_array's float64
+# conversion copy during fit and halves the feature matrix's footprint.
+X = np.ascontiguousarray(df[feature_columns].to_numpy(dtype=np.float32))
+y = df['Stress_Level'].to_numpy()
 
 # Split the data
 X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
 
-# Train a simple model
+# Train a simple model. Trees are independent, so building them across
+# all cores is a near-linear speedup; n_jobs is reset to 1 before the
+# model is saved for serving.
 print("Training model...")
-model = RandomForestClassifier(n_estimators=100, random_state=42)
+model = RandomForestClassifier(
+    n_estimators=100, random_state=42, n_jobs=-1, max_features='sqrt'
+)
 model.fit(X_train, y_train)
 
 # Calculate accuracy
 accuracy = model.score(X_test, y_test)
 print(f"Model accuracy: {accuracy:.4f}")
 
+# Strip training-only state before serializing: a single-threaded
+# predictor pickles smaller and loads faster, and OOB buffers are
+# never used at serving time
+model.n_jobs = 1
+for attr in ('oob_score_', 'oob_decision_function_'):
+    if hasattr(model, attr):
+        delattr(model, attr)
+
 # Create model artifacts
 model_artifacts = {
     'model': model,
@@ -61,9 +106,40 @@ model_artifacts = {
     'categorical_mappings': categorical_mappings
 }
 
-# Save the model
+# Save the model. The .pkl is always written - it is what the server's
+# startup discovery and the test harness look for.
 print("Saving model...")
 with open('pulse_ai_model_test.pkl', 'wb') as f:
-    pickle.dump(model_artifacts, f)
+    # Protocol 5 serializes ndarrays via out-of-band buffers
+    pickle.dump(model_artifacts, f, protocol=pickle.HIGHEST_PROTOCOL)
+print("Model saved to pulse_ai_model_test.pkl")
+
+if joblib is not None:
+    # Companion artifact: joblib stores the RF node arrays as raw
+    # ndarray payloads, so ModelService can memory-map them at load
+    # instead of unpickling copies. Left uncompressed on purpose:
+    # compression would disable mmap.
+    joblib.dump(model_artifacts, 'pulse_ai_model_test.joblib')
+    print("Model saved to pulse_ai_model_test.joblib")
+
+# Export an ONNX copy when the converter is available: ModelService
+# serves .onnx files through ONNX Runtime, which runs the forest as one
+# compiled graph with no unpickling at startup (export_onnx.py handles
+# int8 quantization of an existing export)
+try:
+    from skl2onnx import to_onnx
+except ImportError:
+    to_onnx = None
+
+if to_onnx is not None:
+    print("Exporting ONNX model...")
+    onx = to_onnx(model, X_train[:1], target_opset=17)
+    meta = onx.metadata_props.add()
+    meta.key, meta.value = 'model_name', 'RandomForestClassifier'
+    meta = onx.metadata_props.add()
+    meta.key, meta.value = 'model_score', str(accuracy)
+    with open('pulse_ai_model_test.onnx', 'wb') as f:
+        f.write(onx.SerializeToString())
+    print("ONNX model saved to pulse_ai_model_test.onnx")
 
 print("Test model created successfully!")
\ No newline at end of file
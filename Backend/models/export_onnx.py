@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Export the trained sklearn model to ONNX for faster, pickle-free serving.
+
+The exported model can be loaded by ModelService by pointing it at the
+.onnx file; inference then runs through ONNX Runtime instead of the
+pickled sklearn estimator.
+
+Pass --quantize to additionally emit a dynamically quantized int8 copy
+(<output>.int8.onnx), which halves the model's memory footprint and
+speeds up matmul-heavy estimators like MLPClassifier on VNNI CPUs.
+
+Usage:
+    python export_onnx.py [input.pkl] [output.onnx] [--quantize]
+"""
+import pickle
+import sys
+
+from skl2onnx import convert_sklearn
+from skl2onnx.common.data_types import FloatTensorType
+
+args = [a for a in sys.argv[1:] if not a.startswith('--')]
+quantize = '--quantize' in sys.argv[1:]
+
+input_path = args[0] if len(args) > 0 else 'pulse_ai_model_test.pkl'
+output_path = args[1] if len(args) > 1 else 'pulse_ai_model.onnx'
+
+print(f"Loading model artifacts from {input_path}...")
+with open(input_path, 'rb') as f:
+    model_artifacts = pickle.load(f)
+
+model = model_artifacts['model']
+feature_names = model_artifacts['feature_names']
+
+print(f"Converting {model_artifacts['model_name']} to ONNX...")
+initial_type = [('input', FloatTensorType([None, len(feature_names)]))]
+onx = convert_sklearn(model, initial_types=initial_type)
+
+# Carry model metadata so ModelService can report it without the pickle
+meta = onx.metadata_props.add()
+meta.key, meta.value = 'model_name', str(model_artifacts['model_name'])
+meta = onx.metadata_props.add()
+meta.key, meta.value = 'model_score', str(model_artifacts['model_score'])
+
+print(f"Saving ONNX model to {output_path}...")
+with open(output_path, 'wb') as f:
+    f.write(onx.SerializeToString())
+
+if quantize:
+    from onnxruntime.quantization import quantize_dynamic, QuantType
+
+    quantized_path = output_path.replace('.onnx', '.int8.onnx')
+    print(f"Quantizing weights to int8: {quantized_path}...")
+    quantize_dynamic(output_path, quantized_path, weight_type=QuantType.QInt8)
+    print("Quantized model saved.")
+
+print("ONNX export completed successfully!")
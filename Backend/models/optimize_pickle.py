@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Re-pickle a saved model artifact with pickletools.optimize.
+
+Default pickling emits a memo PUT opcode for every object whether or
+not it is ever referenced again; pickletools.optimize strips the unused
+ones, shrinking the file and skipping the corresponding memo writes at
+load time. The artifacts are also re-encoded with protocol 5 so numpy
+arrays serialize as out-of-band buffers.
+
+Usage:
+    python optimize_pickle.py [input.pkl] [output.pkl]
+"""
+import os
+import pickle
+import pickletools
+import sys
+
+args = sys.argv[1:]
+input_path = args[0] if len(args) > 0 else 'pulse_ai_model.pkl'
+output_path = args[1] if len(args) > 1 else 'pulse_ai_model_test.pkl'
+
+print(f"Loading model artifacts from {input_path}...")
+with open(input_path, 'rb') as f:
+    model_artifacts = pickle.load(f)
+
+print("Optimizing pickle stream...")
+optimized = pickletools.optimize(
+    pickle.dumps(model_artifacts, protocol=5)
+)
+
+with open(output_path, 'wb') as f:
+    f.write(optimized)
+
+original_size = os.path.getsize(input_path)
+optimized_size = len(optimized)
+saved = original_size - optimized_size
+print(f"Optimized model saved to {output_path}")
+print(f"  {original_size} -> {optimized_size} bytes "
+      f"({saved / max(original_size, 1):.1%} smaller)")
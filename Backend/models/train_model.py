@@ -120,35 +120,40 @@ def create_sample_dataset():
     import numpy as np
     
     print("Creating sample dataset for testing...")
-    
-    # Set random seed for reproducible sample data
-    np.random.seed(42)
-    
+
+    # Single PCG64 generator for reproducible sample data; default_rng is
+    # faster than the legacy global RandomState and avoids re-locking its
+    # shared state on every draw
+    rng = np.random.default_rng(42)
+
     # Generate sample data
     n_samples = 1000
-    
+
     # Define categorical options
-    genders = ['Male', 'Female']
-    occupations = ['Student', 'Engineer', 'Teacher', 'Doctor', 'Artist', 'Manager']
-    conditions = ['Anxiety', 'Depression', 'Bipolar', 'None', 'PTSD']
-    severities = ['Low', 'Medium', 'High']
-    
-    # Generate sample data
+    genders = np.array(['Male', 'Female'])
+    occupations = np.array(['Student', 'Engineer', 'Teacher', 'Doctor', 'Artist', 'Manager'])
+    conditions = np.array(['Anxiety', 'Depression', 'Bipolar', 'None', 'PTSD'])
+    severities = np.array(['Low', 'Medium', 'High'])
+    countries = np.array(['USA', 'UK', 'Canada'])
+    yes_no = np.array(['Yes', 'No'])
+
+    # Generate sample data: every column is a preallocated numpy array,
+    # categoricals are drawn as integer indices into the option arrays
     data = {
-        'User_ID': range(1, n_samples + 1),  # Will be dropped
-        'Age': np.random.randint(18, 65, n_samples),
-        'Gender': np.random.choice(genders, n_samples),
-        'Occupation': np.random.choice(occupations, n_samples),
-        'Sleep_Hours': np.random.uniform(4, 12, n_samples).round(1),
-        'Work_Hours': np.random.uniform(4, 16, n_samples).round(1),
-        'Physical_Activity_Hours': np.random.uniform(0, 4, n_samples).round(1),
-        'Mental_Health_Condition': np.random.choice(conditions, n_samples),
-        'Severity': np.random.choice(severities, n_samples),
-        'Country': np.random.choice(['USA', 'UK', 'Canada'], n_samples),  # Will be dropped
-        'Consultation_History': np.random.choice(['Yes', 'No'], n_samples),  # Will be dropped
-        'Stress_Level': np.random.randint(1, 11, n_samples)  # Target variable
+        'User_ID': np.arange(1, n_samples + 1, dtype=np.int32),  # Will be dropped
+        'Age': rng.integers(18, 65, n_samples, dtype=np.int16),
+        'Gender': genders[rng.integers(0, len(genders), n_samples)],
+        'Occupation': occupations[rng.integers(0, len(occupations), n_samples)],
+        'Sleep_Hours': rng.uniform(4, 12, n_samples).round(1),
+        'Work_Hours': rng.uniform(4, 16, n_samples).round(1),
+        'Physical_Activity_Hours': rng.uniform(0, 4, n_samples).round(1),
+        'Mental_Health_Condition': conditions[rng.integers(0, len(conditions), n_samples)],
+        'Severity': severities[rng.integers(0, len(severities), n_samples)],
+        'Country': countries[rng.integers(0, len(countries), n_samples)],  # Will be dropped
+        'Consultation_History': yes_no[rng.integers(0, 2, n_samples)],  # Will be dropped
+        'Stress_Level': rng.integers(1, 11, n_samples, dtype=np.int8)  # Target variable
     }
-    
+
     # Create DataFrame and save
     df = pd.DataFrame(data)
     df.to_csv('sample_dataset.csv', index=False)
@@ -15,40 +15,70 @@ Features:
 Requirements covered: 2.4, 4.1, 4.2
 """
 
-from pydantic import BaseModel, Field, field_validator, model_validator
-from typing import List, Dict, Any, Optional, Union
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+from typing import List, Dict, Any, Literal, Optional, Union
 from enum import Enum
 import logging
 
-logger = logging.getLogger(__name__)
-
+import numpy as np
 
-class GenderEnum(str, Enum):
-    """Valid gender options for the stress prediction model."""
-    MALE = "Male"
-    FEMALE = "Female"
+# Optional numba JIT for the per-request feature packing; falls back to
+# plain numpy writes when numba is not installed
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 
+logger = logging.getLogger(__name__)
 
-class SmokingHabitEnum(str, Enum):
-    """Valid smoking habit options."""
-    YES = "Yes"
-    NO = "No"
+# Categorical encodings used by to_feature_vector; these mirror the
+# mappings the ML model was trained with
+_GENDER_CODES = {'Male': 0, 'Female': 1}
+_YES_NO_CODES = {'No': 0, 'Yes': 1}
+_EXERCISE_CODES = {
+    'Cardio': 0, 'Yoga': 1, 'Strength Training': 2,
+    'Aerobics': 3, 'Walking': 4, 'Pilates': 5
+}
 
+if njit is not None:
+    @njit(cache=True)
+    def _pack_features(age, gender, sleep_duration, sleep_quality,
+                       physical_activity, screen_time, caffeine_intake,
+                       smoking_habit, work_hours, travel_time,
+                       social_interactions, meditation_practice,
+                       exercise_type):  # pragma: no cover - compiled path
+        out = np.empty((1, 13), dtype=np.float32)
+        out[0, 0] = age
+        out[0, 1] = gender
+        out[0, 2] = sleep_duration
+        out[0, 3] = sleep_quality
+        out[0, 4] = physical_activity
+        out[0, 5] = screen_time
+        out[0, 6] = caffeine_intake
+        out[0, 7] = smoking_habit
+        out[0, 8] = work_hours
+        out[0, 9] = travel_time
+        out[0, 10] = social_interactions
+        out[0, 11] = meditation_practice
+        out[0, 12] = exercise_type
+        return out
 
-class MeditationPracticeEnum(str, Enum):
-    """Valid meditation practice options."""
-    YES = "Yes"
-    NO = "No"
+    # Warm the JIT at import so the compile cost is never paid on a
+    # user request
+    _pack_features(0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0,
+                   0.0, 0.0, 0.0)
+else:
+    _pack_features = None
 
 
-class ExerciseTypeEnum(str, Enum):
-    """Valid exercise type options matching the ML model categories."""
-    CARDIO = "Cardio"
-    YOGA = "Yoga"
-    STRENGTH_TRAINING = "Strength Training"
-    AEROBICS = "Aerobics"
-    WALKING = "Walking"
-    PILATES = "Pilates"
+# Closed string sets for the request schema. Literal fields validate in
+# pydantic-core's Rust layer with a hashed compare and never instantiate
+# an Enum, which keeps request parsing off the Python interpreter.
+GenderLiteral = Literal['Male', 'Female']
+YesNoLiteral = Literal['Yes', 'No']
+ExerciseTypeLiteral = Literal[
+    'Cardio', 'Yoga', 'Strength Training', 'Aerobics', 'Walking', 'Pilates'
+]
 
 
 class StressLevelEnum(str, Enum):
@@ -76,7 +106,7 @@ class StressPredictionRequest(BaseModel):
         description="Age in years (18-65)"
     )
     
-    gender: GenderEnum = Field(
+    gender: GenderLiteral = Field(
         ...,
         description="Gender (Male or Female)"
     )
@@ -118,7 +148,7 @@ class StressPredictionRequest(BaseModel):
         description="Daily caffeine intake in cups (0-8)"
     )
     
-    smoking_habit: SmokingHabitEnum = Field(
+    smoking_habit: YesNoLiteral = Field(
         ...,
         description="Smoking habit (Yes or No)"
     )
@@ -146,76 +176,51 @@ class StressPredictionRequest(BaseModel):
         description="Social interactions level (1-5 scale)"
     )
     
-    meditation_practice: MeditationPracticeEnum = Field(
+    meditation_practice: YesNoLiteral = Field(
         ...,
         description="Meditation practice (Yes or No)"
     )
     
-    exercise_type: ExerciseTypeEnum = Field(
+    exercise_type: ExerciseTypeLiteral = Field(
         ...,
         description="Primary exercise type"
     )
     
-    @field_validator('sleep_duration')
-    @classmethod
-    def validate_sleep_duration(cls, v):
-        """Custom validator for sleep duration with business logic."""
-        if v < 4.0:
-            raise ValueError('Sleep duration cannot be less than 4 hours')
-        if v > 12.0:
-            raise ValueError('Sleep duration cannot exceed 12 hours')
-        return round(v, 1)  # Round to 1 decimal place
-    
-    @field_validator('work_hours')
-    @classmethod
-    def validate_work_hours(cls, v):
-        """Custom validator for work hours with business logic."""
-        if v < 4.0:
-            raise ValueError('Work hours cannot be less than 4 hours')
-        if v > 16.0:
-            raise ValueError('Work hours cannot exceed 16 hours per day')
-        return round(v, 1)  # Round to 1 decimal place
-    
-    @field_validator('screen_time')
-    @classmethod
-    def validate_screen_time(cls, v):
-        """Custom validator for screen time with business logic."""
-        if v < 1.0:
-            raise ValueError('Screen time cannot be less than 1 hour')
-        if v > 14.0:
-            raise ValueError('Screen time cannot exceed 14 hours per day')
-        return round(v, 1)  # Round to 1 decimal place
-    
-    @field_validator('travel_time')
+    @model_validator(mode='before')
     @classmethod
-    def validate_travel_time(cls, v):
-        """Custom validator for travel time with business logic."""
-        if v < 0.0:
-            raise ValueError('Travel time cannot be negative')
-        if v > 4.0:
-            raise ValueError('Travel time cannot exceed 4 hours per day')
-        return round(v, 1)  # Round to 1 decimal place
+    def round_hour_fields(cls, data):
+        """Round the hour fields to 1 decimal before validation.
+
+        Rounding happens pre-validation so instances can stay frozen;
+        range checks live on the Field(ge=..., le=...) constraints, which
+        pydantic-core enforces natively.
+        """
+        if isinstance(data, dict):
+            for key in ('sleep_duration', 'work_hours', 'screen_time', 'travel_time'):
+                value = data.get(key)
+                if isinstance(value, (int, float)):
+                    data[key] = round(value, 1)
+        return data
     
     @model_validator(mode='after')
     def validate_lifestyle_consistency(self):
         """Cross-field validation for lifestyle consistency."""
-        work_hours = self.work_hours
-        sleep_duration = self.sleep_duration
-        screen_time = self.screen_time
-        travel_time = self.travel_time
-        
         # Check if total time allocation is reasonable (allowing for overlap)
-        total_structured_time = work_hours + sleep_duration + travel_time
-        if total_structured_time > 24:
+        if self.work_hours + self.sleep_duration + self.travel_time > 24.0:
             raise ValueError(
-                f'Total time allocation (work: {work_hours}h, sleep: {sleep_duration}h, '
-                f'travel: {travel_time}h) exceeds 24 hours per day'
+                f'Total time allocation (work: {self.work_hours}h, '
+                f'sleep: {self.sleep_duration}h, travel: {self.travel_time}h) '
+                f'exceeds 24 hours per day'
             )
         
-        # Validate screen time vs work hours relationship
-        if screen_time > work_hours + 6:  # Allow 6 hours personal screen time
+        # Validate screen time vs work hours relationship (6 hours of
+        # personal screen time allowed); the level check keeps the message
+        # from being formatted when warnings are suppressed
+        if (self.screen_time > self.work_hours + 6
+                and logger.isEnabledFor(logging.WARNING)):
             logger.warning(
-                f'Screen time ({screen_time}h) significantly exceeds work hours ({work_hours}h)'
+                'Screen time (%sh) significantly exceeds work hours (%sh)',
+                self.screen_time, self.work_hours
             )
         
         return self
@@ -227,28 +232,73 @@ class StressPredictionRequest(BaseModel):
         This method transforms the Pydantic model to match the exact field names
         and format expected by the trained ML model.
         """
+        # use_enum_values=True guarantees the enum fields are already plain
+        # strings, so no per-field isinstance/.value branching is needed
         return {
             'Age': self.age,
-            'Gender': self.gender if isinstance(self.gender, str) else self.gender.value,
+            'Gender': self.gender,
             'Sleep_Duration': self.sleep_duration,
             'Sleep_Quality': self.sleep_quality,
             'Physical_Activity': self.physical_activity,
             'Screen_Time': self.screen_time,
             'Caffeine_Intake': self.caffeine_intake,
-            'Smoking_Habit': self.smoking_habit if isinstance(self.smoking_habit, str) else self.smoking_habit.value,
+            'Smoking_Habit': self.smoking_habit,
             'Work_Hours': self.work_hours,
             'Travel_Time': self.travel_time,
             'Social_Interactions': self.social_interactions,
-            'Meditation_Practice': self.meditation_practice if isinstance(self.meditation_practice, str) else self.meditation_practice.value,
-            'Exercise_Type': self.exercise_type if isinstance(self.exercise_type, str) else self.exercise_type.value
+            'Meditation_Practice': self.meditation_practice,
+            'Exercise_Type': self.exercise_type
         }
     
-    class Config:
-        """Pydantic configuration."""
-        use_enum_values = True
-        validate_assignment = True
-        extra = "forbid"  # Reject extra fields
-        json_schema_extra = {
+    def to_feature_vector(self) -> np.ndarray:
+        """
+        Encode the request directly as a (1, 13) float32 feature vector.
+        
+        The columns follow the exact feature order the ML model was
+        trained with, so the result can be passed straight to
+        model.predict without building a dict or DataFrame first.
+        """
+        if _pack_features is not None:
+            return _pack_features(
+                self.age,
+                _GENDER_CODES[self.gender],
+                self.sleep_duration,
+                self.sleep_quality,
+                self.physical_activity,
+                self.screen_time,
+                self.caffeine_intake,
+                _YES_NO_CODES[self.smoking_habit],
+                self.work_hours,
+                self.travel_time,
+                self.social_interactions,
+                _YES_NO_CODES[self.meditation_practice],
+                _EXERCISE_CODES[self.exercise_type]
+            )
+
+        v = np.empty((1, 13), dtype=np.float32)
+        row = v[0]
+        row[0] = self.age
+        row[1] = _GENDER_CODES[self.gender]
+        row[2] = self.sleep_duration
+        row[3] = self.sleep_quality
+        row[4] = self.physical_activity
+        row[5] = self.screen_time
+        row[6] = self.caffeine_intake
+        row[7] = _YES_NO_CODES[self.smoking_habit]
+        row[8] = self.work_hours
+        row[9] = self.travel_time
+        row[10] = self.social_interactions
+        row[11] = _YES_NO_CODES[self.meditation_practice]
+        row[12] = _EXERCISE_CODES[self.exercise_type]
+        return v
+    
+    # frozen=True skips the __setattr__ validation hook and lets
+    # instances be shared safely; extra='forbid' rejects unknown fields
+    model_config = ConfigDict(
+        frozen=True,
+        use_enum_values=True,
+        extra="forbid",
+        json_schema_extra={
             "example": {
                 "age": 30,
                 "gender": "Male",
@@ -265,11 +315,14 @@ class StressPredictionRequest(BaseModel):
                 "exercise_type": "Cardio"
             }
         }
+    )
 
 
 class WellnessTask(BaseModel):
     """Individual wellness task within a wellness plan."""
     
+    model_config = ConfigDict(frozen=True)
+    
     id: str = Field(..., description="Unique task identifier")
     title: str = Field(..., description="Task title")
     type: str = Field(..., description="Task type (article, tool, lifestyle)")
@@ -280,6 +333,8 @@ class WellnessTask(BaseModel):
 class WellnessPlan(BaseModel):
     """Wellness plan structure matching frontend interface."""
     
+    model_config = ConfigDict(frozen=True)
+    
     title: str = Field(..., description="Wellness plan title")
     summary: str = Field(..., description="Plan summary description")
     tasks: List[WellnessTask] = Field(..., description="List of wellness tasks")
@@ -341,16 +396,19 @@ class StressPredictionResponse(BaseModel):
         description="Accuracy score of the ML model"
     )
     
-    feature_importance: Optional[Dict[str, float]] = Field(
+    feature_importance: Optional[List[float]] = Field(
         None,
-        description="Feature importance scores from the model"
+        min_length=13,
+        max_length=13,
+        description="Feature importance scores, ordered to match the "
+                    "model's feature_names metadata"
     )
     
-    class Config:
-        """Pydantic configuration."""
-        use_enum_values = True
-        populate_by_name = True  # Allow both field name and alias
-        json_schema_extra = {
+    model_config = ConfigDict(
+        frozen=True,
+        use_enum_values=True,
+        populate_by_name=True,  # Allow both field name and alias
+        json_schema_extra={
             "example": {
                 "level": "Medium",
                 "score": 65,
@@ -388,6 +446,7 @@ class StressPredictionResponse(BaseModel):
                 "model_score": 0.92
             }
         }
+    )
 
 
 class ValidationError(BaseModel):
@@ -90,14 +90,21 @@ def main():
         # Change to backend directory before starting server
         os.chdir(backend_dir)
         
-        # Start the server
+        # Start the server. uvloop and httptools replace the default
+        # asyncio loop and h11 parser with their C implementations, and
+        # one worker per core serves requests around the GIL (workers and
+        # reload are mutually exclusive in uvicorn). Access logs stay on
+        # only at debug level - formatting them costs a line per request.
         uvicorn.run(
             "app:app",
             host=args.host,
             port=args.port,
             reload=args.reload,
             log_level=args.log_level,
-            access_log=True
+            access_log=args.log_level == "debug",
+            loop="uvloop",
+            http="httptools",
+            workers=1 if args.reload else max(1, os.cpu_count() or 2)
         )
     except KeyboardInterrupt:
         logger.info("Server stopped by user")
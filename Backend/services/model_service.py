@@ -17,6 +17,7 @@ Requirements covered: 1.1, 1.2, 4.3, 6.1
 
 import pickle
 import logging
+import threading
 import numpy as np
 import pandas as pd
 from typing import Dict, Any, Optional, List
@@ -35,9 +36,43 @@ try:
 except ImportError as e:
     logging.warning(f"Could not import some sklearn classes: {e}")
 
+# joblib ships with scikit-learn; used for memory-mapped model loading
+try:
+    import joblib
+except ImportError:
+    joblib = None
+
+# Optional ONNX Runtime for serving exported models (see models/export_onnx.py)
+try:
+    import onnxruntime as ort
+except ImportError:
+    ort = None
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Recommendation tables built once at import time. Tuples are immutable,
+# so they can be returned directly and shared across requests without
+# re-allocating a list per prediction.
+_REC_TABLE = {
+    'Low': (
+        "Maintain your current healthy lifestyle habits",
+        "Continue regular physical activity and good sleep schedule"
+    ),
+    'Medium': (
+        "Focus on improving sleep quality and duration",
+        "Incorporate regular physical exercise into your routine",
+        "Practice stress-reduction techniques like deep breathing"
+    ),
+    'High': (
+        "Prioritize getting adequate sleep (7-9 hours per night)",
+        "Engage in regular physical activity to reduce stress hormones",
+        "Practice meditation or mindfulness exercises daily",
+        "Consider speaking with a healthcare professional"
+    )
+}
+_REC_DEFAULT = ("Focus on maintaining a balanced lifestyle",)
+
 
 class ModelService:
     """
@@ -47,7 +82,43 @@ class ModelService:
     preprocessing input data, and generating predictions with confidence scores.
     It handles all model-related operations and error handling.
     """
-    
+
+    # Slots avoid the per-instance __dict__ and speed up attribute access
+    # in the prediction hot path
+    __slots__ = (
+        'model_path', 'model', 'feature_names', 'model_name', 'model_score',
+        'is_loaded', '_categorical_luts', '_categorical_arrays',
+        '_categorical_items', '_numerical_indices', '_numerical_names',
+        '_scratch', '_session', '_onnx_input_name',
+        '_feature_importance'
+    )
+
+    # Expected feature names based on the dataset structure. These never
+    # change per instance, so they live on the class.
+    expected_features = (
+        'Age', 'Gender', 'Sleep_Duration', 'Sleep_Quality',
+        'Physical_Activity', 'Screen_Time', 'Caffeine_Intake',
+        'Smoking_Habit', 'Work_Hours', 'Travel_Time',
+        'Social_Interactions', 'Meditation_Practice', 'Exercise_Type'
+    )
+
+    # Categorical mappings for preprocessing
+    categorical_mappings = {
+        'Gender': {'Male': 0, 'Female': 1},
+        'Smoking_Habit': {'No': 0, 'Yes': 1},
+        'Meditation_Practice': {'No': 0, 'Yes': 1},
+        'Exercise_Type': {
+            'Cardio': 0, 'Yoga': 1, 'Strength Training': 2,
+            'Aerobics': 3, 'Walking': 4, 'Pilates': 5
+        }
+    }
+
+    # Stress level mappings for output
+    stress_level_mappings = {
+        'Low': 0, 'Medium': 1, 'High': 2
+    }
+    reverse_stress_mappings = {v: k for k, v in stress_level_mappings.items()}
+
     def __init__(self, model_path: str = "pulse_ai_model.pkl"):
         """Initialize the ModelService."""
         self.model_path = model_path
@@ -56,31 +127,67 @@ class ModelService:
         self.model_name = None
         self.model_score = None
         self.is_loaded = False
-        
-        # Expected feature names based on the dataset structure
-        self.expected_features = [
-            'Age', 'Gender', 'Sleep_Duration', 'Sleep_Quality', 
-            'Physical_Activity', 'Screen_Time', 'Caffeine_Intake', 
-            'Smoking_Habit', 'Work_Hours', 'Travel_Time', 
-            'Social_Interactions', 'Meditation_Practice', 'Exercise_Type'
-        ]
-        
-        # Categorical mappings for preprocessing
-        self.categorical_mappings = {
-            'Gender': {'Male': 0, 'Female': 1},
-            'Smoking_Habit': {'No': 0, 'Yes': 1},
-            'Meditation_Practice': {'No': 0, 'Yes': 1},
-            'Exercise_Type': {
-                'Cardio': 0, 'Yoga': 1, 'Strength Training': 2, 
-                'Aerobics': 3, 'Walking': 4, 'Pilates': 5
-            }
-        }
-        
-        # Stress level mappings for output
-        self.stress_level_mappings = {
-            'Low': 0, 'Medium': 1, 'High': 2
-        }
-        self.reverse_stress_mappings = {v: k for k, v in self.stress_level_mappings.items()}
+
+        # Compiled preprocessing state (built once in load_model)
+        self._categorical_luts = None
+        self._categorical_arrays = None
+        self._categorical_items = None
+        self._numerical_indices = None
+        self._numerical_names = None
+
+        # Per-thread scratch buffer for single-row preprocessing, so
+        # concurrent requests never clobber each other's feature rows
+        self._scratch = threading.local()
+
+        # ONNX Runtime session (set when loading an exported .onnx model)
+        self._session = None
+        self._onnx_input_name = None
+
+        # Lazily cached by _get_feature_importance; reset on load
+        self._feature_importance = None
+
+    def _compile_preprocessing(self):
+        """
+        Precompute the per-feature lookup tables.
+
+        Building these once at load time keeps preprocess_input free of
+        per-request dict membership checks and intermediate lists: values
+        are written directly into a thread-local float32 row by index.
+        """
+        # Per-index categorical lookup table (None for numerical features)
+        self._categorical_luts = tuple(
+            self.categorical_mappings.get(feature)
+            for feature in self.feature_names
+        )
+
+        # Sorted key/value arrays per categorical column for vectorized
+        # encoding of batches via np.searchsorted (None for numerical
+        # features). One numpy call replaces N per-row dict lookups.
+        sorted_cats = []
+        for lut in self._categorical_luts:
+            if lut is None:
+                sorted_cats.append(None)
+            else:
+                keys = np.array(sorted(lut.keys()))
+                values = np.array([lut[k] for k in keys], dtype=np.float32)
+                sorted_cats.append((keys, values))
+        self._categorical_arrays = tuple(sorted_cats)
+
+        # Split columns into categorical and numerical groups so the
+        # numeric values can be cast in one np.asarray call per request
+        self._categorical_items = tuple(
+            (i, name, lut)
+            for i, (name, lut) in enumerate(zip(self.feature_names, self._categorical_luts))
+            if lut is not None
+        )
+        self._numerical_names = tuple(
+            name for name, lut in zip(self.feature_names, self._categorical_luts)
+            if lut is None
+        )
+        self._numerical_indices = np.array(
+            [i for i, lut in enumerate(self._categorical_luts) if lut is None],
+            dtype=np.intp
+        )
     
     def load_model(self) -> bool:
         """
@@ -91,22 +198,34 @@ class ModelService:
         try:
             logger.info(f"Loading ML model from: {self.model_path}")
             
-            # Check if model file exists
-            if not os.path.exists(self.model_path):
+            # Single stat covers both the existence and size checks
+            try:
+                file_size = os.stat(self.model_path).st_size
+            except FileNotFoundError:
                 logger.error(f"Model file not found: {self.model_path}")
                 return False
-            
-            # Check file size (basic validation)
-            file_size = os.path.getsize(self.model_path)
+
             if file_size == 0:
                 logger.error(f"Model file is empty: {self.model_path}")
                 return False
-            
+
             logger.info(f"Model file size: {file_size} bytes")
-            
+
+            # Exported ONNX models are served through ONNX Runtime
+            if self.model_path.endswith('.onnx'):
+                return self._load_onnx_model()
+
             # Load model artifacts
-            with open(self.model_path, 'rb') as f:
-                model_artifacts = pickle.load(f)
+            if self.model_path.endswith('.joblib'):
+                if joblib is None:
+                    logger.error("joblib is not installed; cannot load .joblib model")
+                    return False
+                # Memory-map the ndarray payloads: startup avoids a full
+                # deserialization pass and pre-forked workers share pages
+                model_artifacts = joblib.load(self.model_path, mmap_mode='r')
+            else:
+                with open(self.model_path, 'rb') as f:
+                    model_artifacts = pickle.load(f)
             
             # Validate model artifacts structure
             required_keys = ['model', 'feature_names', 'model_name', 'model_score']
@@ -132,13 +251,48 @@ class ModelService:
             logger.info(f"  - Model score: {self.model_score:.4f}")
             logger.info(f"  - Feature count: {len(self.feature_names)}")
             
+            # Precompute preprocessing lookup tables and the feature buffer
+            self._compile_preprocessing()
+
+            # Invalidate the importance cache for the new model
+            self._feature_importance = None
+
             self.is_loaded = True
             return True
-            
+
         except Exception as e:
             logger.error(f"Error loading model: {str(e)}")
             return False
     
+    def _load_onnx_model(self) -> bool:
+        """
+        Load an ONNX-exported model through ONNX Runtime.
+
+        Models exported with models/export_onnx.py avoid the pickle
+        deserialization cost at startup and run through ONNX Runtime's
+        fused CPU kernels at predict time.
+        """
+        if ort is None:
+            logger.error("onnxruntime is not installed; cannot load ONNX model")
+            return False
+
+        self._session = ort.InferenceSession(
+            self.model_path, providers=['CPUExecutionProvider']
+        )
+        self._onnx_input_name = self._session.get_inputs()[0].name
+
+        # Feature order is fixed by the export; metadata carries the rest
+        metadata = self._session.get_modelmeta().custom_metadata_map
+        self.feature_names = list(self.expected_features)
+        self.model_name = metadata.get('model_name', 'ONNXModel')
+        self.model_score = float(metadata.get('model_score', 0.0))
+
+        logger.info(f"ONNX model loaded: {self.model_name}")
+
+        self._compile_preprocessing()
+        self.is_loaded = True
+        return True
+
     def preprocess_input(self, input_data: Dict[str, Any]) -> Optional[np.ndarray]:
         """
         Preprocess input data for model prediction.
@@ -168,46 +322,115 @@ class ModelService:
                 logger.error(f"Input validation errors: {validation_errors}")
                 return None
             
-            # Create feature array in the correct order
-            processed_features = []
-            
-            for feature in self.feature_names:
-                if feature in input_data:
-                    value = input_data[feature]
-                    
-                    # Handle categorical features
-                    if feature in self.categorical_mappings:
-                        if value in self.categorical_mappings[feature]:
-                            processed_value = self.categorical_mappings[feature][value]
-                        else:
-                            logger.error(f"Invalid categorical value for {feature}: {value}")
-                            logger.error(f"Valid values are: {list(self.categorical_mappings[feature].keys())}")
-                            return None
-                    else:
-                        # Handle numerical features
-                        try:
-                            processed_value = float(value)
-                        except (ValueError, TypeError):
-                            logger.error(f"Invalid numerical value for {feature}: {value}")
-                            return None
-                    
-                    processed_features.append(processed_value)
-                else:
+            # Write values directly into the thread-local (1, n) buffer
+            # by index, using the lookup tables compiled in load_model.
+            # This avoids building an intermediate Python list per
+            # request, and each worker thread owns its buffer so
+            # concurrent calls cannot overwrite one another's rows.
+            feature_array = getattr(self._scratch, 'buf', None)
+            if feature_array is None:
+                feature_array = np.empty((1, len(self.feature_names)), dtype=np.float32)
+                self._scratch.buf = feature_array
+            row = feature_array[0]
+
+            # Categorical features: one dict lookup each
+            for i, feature, lut in self._categorical_items:
+                if feature not in input_data:
                     logger.error(f"Feature {feature} not found in input data")
                     return None
-            
-            # Convert to numpy array and reshape for single prediction
-            feature_array = np.array(processed_features).reshape(1, -1)
-            
+                value = input_data[feature]
+                encoded = lut.get(value)
+                if encoded is None:
+                    logger.error(f"Invalid categorical value for {feature}: {value}")
+                    logger.error(f"Valid values are: {list(lut.keys())}")
+                    return None
+                row[i] = encoded
+
+            # Numerical features: a single C-level cast replaces the
+            # per-feature float() calls
+            try:
+                row[self._numerical_indices] = np.asarray(
+                    [input_data[name] for name in self._numerical_names],
+                    dtype=np.float32
+                )
+            except KeyError as missing:
+                logger.error(f"Feature {missing.args[0]} not found in input data")
+                return None
+            except (ValueError, TypeError):
+                logger.error("Invalid numerical value in input data")
+                return None
+
             logger.debug(f"Preprocessed features shape: {feature_array.shape}")
             logger.debug(f"Preprocessed features: {feature_array[0]}")
-            
+
             return feature_array
             
         except Exception as e:
             logger.error(f"Error preprocessing input data: {str(e)}")
             return None
     
+    def preprocess_batch(self, input_rows: List[Dict[str, Any]]) -> Optional[np.ndarray]:
+        """
+        Preprocess a batch of input dictionaries into an (N, F) feature matrix.
+
+        Categorical columns are encoded in a single vectorized pass per
+        column using np.searchsorted over the sorted key arrays built in
+        load_model, instead of one dict lookup per row.
+        """
+        try:
+            if not input_rows:
+                return None
+
+            for input_data in input_rows:
+                missing_features = [
+                    feature for feature in self.expected_features
+                    if feature not in input_data
+                ]
+                if missing_features:
+                    logger.error(f"Missing required features: {missing_features}")
+                    return None
+
+                validation_errors = self._validate_input_ranges(input_data)
+                if validation_errors:
+                    logger.error(f"Input validation errors: {validation_errors}")
+                    return None
+
+            n_rows = len(input_rows)
+            feature_matrix = np.empty((n_rows, len(self.feature_names)), dtype=np.float32)
+
+            for i, feature in enumerate(self.feature_names):
+                cat_arrays = self._categorical_arrays[i]
+
+                if cat_arrays is not None:
+                    # Vectorized categorical encoding: one searchsorted per column
+                    keys, values = cat_arrays
+                    raw = np.array([row[feature] for row in input_rows])
+                    idx = np.searchsorted(keys, raw)
+                    idx_clipped = np.minimum(idx, len(keys) - 1)
+                    invalid = keys[idx_clipped] != raw
+                    if invalid.any():
+                        bad_value = raw[invalid][0]
+                        logger.error(f"Invalid categorical value for {feature}: {bad_value}")
+                        logger.error(f"Valid values are: {list(keys)}")
+                        return None
+                    feature_matrix[:, i] = values[idx_clipped]
+                else:
+                    # Numerical column: single batched cast
+                    try:
+                        feature_matrix[:, i] = np.asarray(
+                            [row[feature] for row in input_rows], dtype=np.float32
+                        )
+                    except (ValueError, TypeError):
+                        logger.error(f"Invalid numerical value in column {feature}")
+                        return None
+
+            logger.debug(f"Preprocessed batch shape: {feature_matrix.shape}")
+            return feature_matrix
+
+        except Exception as e:
+            logger.error(f"Error preprocessing input batch: {str(e)}")
+            return None
+
     def _validate_input_ranges(self, input_data: Dict[str, Any]) -> List[str]:
         """Validate input data ranges based on dataset boundaries."""
         errors = []
@@ -280,16 +503,30 @@ class ModelService:
                 logger.error("Failed to preprocess input data")
                 return None
             
-            # Generate prediction
-            prediction = self.model.predict(processed_features)[0]
-            
-            # Get prediction probabilities for confidence scoring
-            confidence_score = 0.0
-            if hasattr(self.model, 'predict_proba'):
-                probabilities = self.model.predict_proba(processed_features)[0]
-                confidence_score = float(np.max(probabilities))
-            else:
+            # Generate prediction (ONNX Runtime session or sklearn estimator)
+            if self._session is not None:
+                outputs = self._session.run(
+                    None,
+                    {self._onnx_input_name: processed_features.astype(np.float32)}
+                )
+                prediction = outputs[0][0]
                 confidence_score = 0.8  # Default confidence
+                if len(outputs) > 1:
+                    probabilities = outputs[1][0]
+                    if isinstance(probabilities, dict):
+                        confidence_score = float(max(probabilities.values()))
+                    else:
+                        confidence_score = float(np.max(probabilities))
+            else:
+                prediction = self.model.predict(processed_features)[0]
+
+                # Get prediction probabilities for confidence scoring
+                confidence_score = 0.0
+                if hasattr(self.model, 'predict_proba'):
+                    probabilities = self.model.predict_proba(processed_features)[0]
+                    confidence_score = float(np.max(probabilities))
+                else:
+                    confidence_score = 0.8  # Default confidence
             
             # Convert prediction to stress level
             if isinstance(prediction, (int, np.integer)):
@@ -390,46 +627,35 @@ class ModelService:
         return insights
     
     def _get_feature_importance(self) -> Optional[Dict[str, float]]:
-        """Get feature importance from the model if available."""
+        """Get feature importance from the model if available.
+
+        The importances are fixed for a trained model, so the dict is
+        built once and cached on the instance; a model reload clears it.
+        """
+        if self._feature_importance is not None:
+            return self._feature_importance
+
         try:
             if not self.is_loaded or not hasattr(self.model, 'feature_importances_'):
                 return None
-            
+
             importance_scores = self.model.feature_importances_
             feature_importance = {}
-            
+
             for i, feature_name in enumerate(self.feature_names):
                 if i < len(importance_scores):
                     feature_importance[feature_name] = float(importance_scores[i])
-            
+
+            self._feature_importance = feature_importance
             return feature_importance
-            
+
         except Exception as e:
             logger.error(f"Error getting feature importance: {str(e)}")
             return None
     
-    def _generate_recommendations(self, stress_level: str) -> List[str]:
+    def _generate_recommendations(self, stress_level: str) -> tuple:
         """Generate recommendations based on stress level."""
-        if stress_level == 'Low':
-            return [
-                "Maintain your current healthy lifestyle habits",
-                "Continue regular physical activity and good sleep schedule"
-            ]
-        elif stress_level == 'Medium':
-            return [
-                "Focus on improving sleep quality and duration",
-                "Incorporate regular physical exercise into your routine",
-                "Practice stress-reduction techniques like deep breathing"
-            ]
-        elif stress_level == 'High':
-            return [
-                "Prioritize getting adequate sleep (7-9 hours per night)",
-                "Engage in regular physical activity to reduce stress hormones",
-                "Practice meditation or mindfulness exercises daily",
-                "Consider speaking with a healthcare professional"
-            ]
-        else:
-            return ["Focus on maintaining a balanced lifestyle"]
+        return _REC_TABLE.get(stress_level, _REC_DEFAULT)
     
     def get_model_info(self) -> Dict[str, Any]:
         """Get information about the loaded model."""
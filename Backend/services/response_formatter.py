@@ -15,20 +15,294 @@ Features:
 Requirements covered: 4.2, 4.3, 4.4, 4.5
 """
 
+import functools
+import heapq
+import itertools
 import logging
+import operator
+import types
 from typing import Dict, Any, List, Optional
-from datetime import datetime
-import uuid
+import secrets
 
 from schemas import (
-    StressPredictionResponse, 
-    WellnessPlan, 
-    WellnessTask, 
+    StressPredictionResponse,
+    WellnessPlan,
+    WellnessTask,
     StressLevelEnum
 )
 
+# Optional numba for the compiled score-adjustment kernel
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 logger = logging.getLogger(__name__)
 
+# Shared key function for importance ranking, built once instead of a
+# fresh lambda per request
+_IMPORTANCE_GETTER = operator.itemgetter(1)
+
+if njit is not None:
+    @njit(cache=True)
+    def _adjust_score(level_tag, confidence):
+        """
+        Confidence-adjusted numerical score for a level tag (0/1/2).
+
+        Same arithmetic as the Python fallback in
+        _calculate_numerical_score, compiled once at import so the
+        per-request cost is a bare native call.
+        """
+        if level_tag == 0:
+            score = 25.0 - (1.0 - confidence) * 15.0
+            if score < 10.0:
+                score = 10.0
+        elif level_tag == 2:
+            score = 75.0 + (1.0 - confidence) * 15.0
+            if score > 90.0:
+                score = 90.0
+        else:
+            score = 50.0
+        return int(round(score))
+
+    # Warm the JIT at import so the first request does not pay compilation
+    _adjust_score(1, 0.8)
+else:
+    _adjust_score = None
+
+# Template tables built once at import and wrapped read-only so no
+# request can mutate the shared copies. Every ResponseFormatter instance
+# and every call reference these instead of rebuilding dicts.
+_WELLNESS_TEMPLATES = types.MappingProxyType({
+    StressLevelEnum.LOW: (
+        {
+            'title': 'Maintain Current Healthy Habits',
+            'type': 'lifestyle',
+            'link': '/wellness/habit-maintenance',
+            'reward': 10
+        },
+        {
+            'title': 'Weekly Stress Check-in',
+            'type': 'tool',
+            'link': '/tools/stress-tracker',
+            'reward': 15
+        }
+    ),
+    StressLevelEnum.MEDIUM: (
+        {
+            'title': 'Deep Breathing Exercises',
+            'type': 'tool',
+            'link': '/tools/breathing-exercises',
+            'reward': 20
+        },
+        {
+            'title': 'Improve Sleep Hygiene',
+            'type': 'article',
+            'link': '/articles/sleep-hygiene',
+            'reward': 25
+        },
+        {
+            'title': 'Regular Exercise Routine',
+            'type': 'lifestyle',
+            'link': '/wellness/exercise-plan',
+            'reward': 30
+        }
+    ),
+    StressLevelEnum.HIGH: (
+        {
+            'title': 'Immediate Stress Relief Techniques',
+            'type': 'tool',
+            'link': '/tools/emergency-calm',
+            'reward': 35
+        },
+        {
+            'title': 'Professional Support Resources',
+            'type': 'article',
+            'link': '/articles/professional-help',
+            'reward': 40
+        },
+        {
+            'title': 'Comprehensive Lifestyle Changes',
+            'type': 'lifestyle',
+            'link': '/wellness/lifestyle-overhaul',
+            'reward': 45
+        },
+        {
+            'title': 'Daily Meditation Practice',
+            'type': 'tool',
+            'link': '/tools/meditation-program',
+            'reward': 30
+        }
+    )
+})
+
+# Validated WellnessTask prototypes built once from the templates above.
+# Request time only clones them with a fresh id via model_copy, which
+# skips the per-field pydantic validation a full constructor would run.
+_WELLNESS_TASK_PROTOTYPES = types.MappingProxyType({
+    level: tuple(
+        WellnessTask(id='task-template', **task_data)
+        for task_data in task_templates
+    )
+    for level, task_templates in _WELLNESS_TEMPLATES.items()
+})
+
+# Personalized task prototypes, keyed by the lifestyle trigger that
+# selects them in _generate_personal_tasks
+_PERSONAL_TASK_PROTOTYPES = types.MappingProxyType({
+    'short_sleep': WellnessTask(
+        id='task-template',
+        title='Establish Better Sleep Schedule',
+        type='lifestyle',
+        link='/wellness/sleep-schedule',
+        reward=25
+    ),
+    'low_activity': WellnessTask(
+        id='task-template',
+        title='Start Daily Walking Routine',
+        type='tool',
+        link='/tools/walking-tracker',
+        reward=20
+    ),
+    'no_meditation': WellnessTask(
+        id='task-template',
+        title='Begin Mindfulness Practice',
+        type='tool',
+        link='/tools/meditation-guide',
+        reward=15
+    ),
+    'high_screen_time': WellnessTask(
+        id='task-template',
+        title='Digital Detox Challenge',
+        type='lifestyle',
+        link='/wellness/digital-detox',
+        reward=30
+    )
+})
+
+_RECOMMENDATION_TEMPLATES = types.MappingProxyType({
+    StressLevelEnum.LOW: (
+        "Maintain your current healthy lifestyle habits",
+        "Continue regular physical activity and good sleep schedule",
+        "Keep practicing stress-prevention techniques"
+    ),
+    StressLevelEnum.MEDIUM: (
+        "Focus on improving sleep quality and duration",
+        "Incorporate regular physical exercise into your routine",
+        "Practice stress-reduction techniques like deep breathing",
+        "Consider time management strategies to reduce daily pressure"
+    ),
+    StressLevelEnum.HIGH: (
+        "Prioritize getting adequate sleep (7-9 hours per night)",
+        "Engage in regular physical activity to reduce stress hormones",
+        "Practice meditation or mindfulness exercises daily",
+        "Consider speaking with a healthcare professional",
+        "Implement immediate stress-relief techniques",
+        "Review and adjust your daily schedule to reduce pressure"
+    )
+})
+
+_BASE_SCORES = types.MappingProxyType({
+    StressLevelEnum.LOW: 25,
+    StressLevelEnum.MEDIUM: 50,
+    StressLevelEnum.HIGH: 75
+})
+
+# Integer tags for the compiled score kernel (numba cannot take enums)
+_LEVEL_TAGS = types.MappingProxyType({
+    StressLevelEnum.LOW: 0,
+    StressLevelEnum.MEDIUM: 1,
+    StressLevelEnum.HIGH: 2
+})
+
+# Fallback insight per level, formatted once instead of per request
+_DEFAULT_INSIGHT = types.MappingProxyType({
+    level: f"Your current stress level is {level.value.lower()}"
+    for level in StressLevelEnum
+})
+
+_PLAN_TITLES = types.MappingProxyType({
+    StressLevelEnum.LOW: "Stress Maintenance Plan",
+    StressLevelEnum.MEDIUM: "Stress Reduction Plan",
+    StressLevelEnum.HIGH: "Intensive Stress Management Plan"
+})
+
+# Per-feature insight wording, keyed by whether the user's value is on
+# the helpful ('high') or concerning ('low') side for that feature
+_FEATURE_INSIGHT_TEMPLATES = types.MappingProxyType({
+    'Sleep_Duration': {
+        'low': "Your sleep duration appears to be a key factor affecting your stress levels",
+        'high': "Your adequate sleep duration is helping maintain lower stress levels"
+    },
+    'Work_Hours': {
+        'low': "Your work hours are a significant factor in your stress assessment",
+        'high': "Long work hours appear to be a major contributor to your stress levels"
+    },
+    'Physical_Activity': {
+        'low': "Your physical activity level is significantly impacting your stress levels",
+        'high': "Your active lifestyle is positively influencing your stress management"
+    },
+    'Screen_Time': {
+        'low': "Screen time usage appears to be affecting your stress levels",
+        'high': "High screen time may be contributing to your elevated stress levels"
+    },
+    'Sleep_Quality': {
+        'low': "Sleep quality is a key factor in your stress level assessment",
+        'high': "Good sleep quality is helping you manage stress effectively"
+    }
+})
+
+# Features where more is better (the rest, like work hours and screen
+# time, are better low) and the high/low cutoff for each group
+_HIGHER_IS_BETTER = frozenset({'Sleep_Duration', 'Physical_Activity', 'Sleep_Quality'})
+_FEATURE_THRESHOLDS = {True: 3, False: 8}
+
+# Thresholds for mapping numerical predictions onto levels, scanned in
+# order (anything above the last threshold is High)
+_NUMERIC_LEVEL_THRESHOLDS = (
+    (0.33, StressLevelEnum.LOW),
+    (0.66, StressLevelEnum.MEDIUM)
+)
+
+
+# Low-intensity exercise types that earn the "add vigorous exercise"
+# recommendation; frozenset membership beats a tuple scan
+_LIGHT_EXERCISES = frozenset({'Walking', 'Yoga'})
+
+
+@functools.cache
+def _exercise_label(exercise_type: str) -> str:
+    """Lower-cased exercise name for insight text, cached because the
+    exercise vocabulary is a handful of categorical values."""
+    return exercise_type.lower()
+
+
+# Case-insensitive string-to-enum table for _str_to_level: one lower()
+# plus a dict hash instead of title-casing and scanning a sequence
+_LEVEL_STRINGS = types.MappingProxyType({
+    'low': StressLevelEnum.LOW,
+    'medium': StressLevelEnum.MEDIUM,
+    'high': StressLevelEnum.HIGH
+})
+
+
+@functools.cache
+def _str_to_level(raw_level: str) -> Optional[StressLevelEnum]:
+    """
+    Normalize a string prediction to its StressLevelEnum, or None.
+
+    Models emit the same handful of strings over and over, so the
+    normalization is cached: repeat inputs cost one dict lookup.
+    """
+    return _LEVEL_STRINGS.get(raw_level.strip().lower())
+
+
+_PLAN_SUMMARIES = types.MappingProxyType({
+    StressLevelEnum.LOW: "A maintenance plan to help you continue managing stress effectively",
+    StressLevelEnum.MEDIUM: "A focused plan to help reduce your stress levels through targeted interventions",
+    StressLevelEnum.HIGH: "An intensive plan designed to significantly reduce your stress levels"
+})
+
 
 class ResponseFormatter:
     """
@@ -43,8 +317,10 @@ class ResponseFormatter:
     
     def __init__(self):
         """Initialize the ResponseFormatter."""
-        self.wellness_task_templates = self._initialize_wellness_templates()
-        self.recommendation_templates = self._initialize_recommendation_templates()
+        # Shared read-only module-level tables; kept as attributes for
+        # callers that reach them through the instance
+        self.wellness_task_templates = _WELLNESS_TEMPLATES
+        self.recommendation_templates = _RECOMMENDATION_TEMPLATES
     
     def format_prediction_response(
         self,
@@ -89,8 +365,11 @@ class ResponseFormatter:
                 insights
             )
             
-            # Create response object
-            response = StressPredictionResponse(
+            # Create response object. Every field is produced above from
+            # validated templates and arithmetic, so model_construct can
+            # skip pydantic's per-field validation; external input was
+            # already validated at the API boundary
+            response = StressPredictionResponse.model_construct(
                 level=stress_level,
                 score=numerical_score,
                 confidence=confidence,
@@ -116,28 +395,28 @@ class ResponseFormatter:
         
         Requirements: 4.2
         """
-        try:
-            if isinstance(raw_level, str):
-                level_str = raw_level.strip().title()
-                if level_str in ['Low', 'Medium', 'High']:
-                    return StressLevelEnum(level_str)
-            
-            # Handle numerical predictions
-            if isinstance(raw_level, (int, float)):
-                if raw_level <= 0.33:
-                    return StressLevelEnum.LOW
-                elif raw_level <= 0.66:
-                    return StressLevelEnum.MEDIUM
-                else:
-                    return StressLevelEnum.HIGH
-            
-            # Default fallback
-            logger.warning(f"Unknown stress level format: {raw_level}, defaulting to Medium")
-            return StressLevelEnum.MEDIUM
-            
-        except Exception as e:
-            logger.error(f"Error categorizing stress level: {str(e)}")
-            return StressLevelEnum.MEDIUM
+        if isinstance(raw_level, str):
+            level = _str_to_level(raw_level)
+            if level is not None:
+                return level
+        else:
+            # Handle numerical predictions: one float() normalization
+            # instead of isinstance tuple checks, which also accepts
+            # numpy scalar predictions straight from the model
+            try:
+                value = float(raw_level)
+            except (TypeError, ValueError):
+                value = None
+
+            if value is not None:
+                for threshold, level in _NUMERIC_LEVEL_THRESHOLDS:
+                    if value <= threshold:
+                        return level
+                return StressLevelEnum.HIGH
+
+        # Default fallback
+        logger.warning(f"Unknown stress level format: {raw_level}, defaulting to Medium")
+        return StressLevelEnum.MEDIUM
     
     def _calculate_numerical_score(
         self, 
@@ -149,31 +428,23 @@ class ResponseFormatter:
         
         Requirements: 4.2
         """
-        try:
-            # Base scores for each level
-            base_scores = {
-                StressLevelEnum.LOW: 25,
-                StressLevelEnum.MEDIUM: 50,
-                StressLevelEnum.HIGH: 75
-            }
-            
-            base_score = base_scores.get(stress_level, 50)
-            confidence = prediction_result.get('confidence', 0.8)
-            
-            # Adjust score based on confidence
-            # Higher confidence can push scores toward extremes
-            if stress_level == StressLevelEnum.LOW:
-                adjusted_score = max(10, base_score - (1 - confidence) * 15)
-            elif stress_level == StressLevelEnum.HIGH:
-                adjusted_score = min(90, base_score + (1 - confidence) * 15)
-            else:
-                adjusted_score = base_score
-            
-            return int(round(adjusted_score))
-            
-        except Exception as e:
-            logger.error(f"Error calculating numerical score: {str(e)}")
-            return 50
+        confidence = prediction_result.get('confidence', 0.8)
+
+        if _adjust_score is not None:
+            return _adjust_score(_LEVEL_TAGS.get(stress_level, 1), confidence)
+
+        base_score = _BASE_SCORES.get(stress_level, 50)
+
+        # Adjust score based on confidence
+        # Higher confidence can push scores toward extremes
+        if stress_level == StressLevelEnum.LOW:
+            adjusted_score = max(10, base_score - (1 - confidence) * 15)
+        elif stress_level == StressLevelEnum.HIGH:
+            adjusted_score = min(90, base_score + (1 - confidence) * 15)
+        else:
+            adjusted_score = base_score
+
+        return int(round(adjusted_score))
     
     def _generate_enhanced_insights(
         self, 
@@ -186,45 +457,48 @@ class ResponseFormatter:
         
         Requirements: 4.3
         """
-        insights = []
-        
         try:
-            # Feature importance insights
+            # Feature importance insights. nlargest keeps a 3-element heap
+            # instead of sorting the whole dict just to take the head.
+            feature_insights = []
             if feature_importance:
-                top_features = sorted(
-                    feature_importance.items(), 
-                    key=lambda x: x[1], 
-                    reverse=True
-                )[:3]
-                
+                top_features = heapq.nlargest(
+                    3, feature_importance.items(), key=_IMPORTANCE_GETTER
+                )
+
                 for feature_name, importance in top_features:
                     if importance > 0.1:  # Only include significant features
                         insight = self._generate_feature_insight(
-                            feature_name, 
-                            input_data.get(feature_name), 
+                            feature_name,
+                            input_data.get(feature_name),
                             importance
                         )
                         if insight:
-                            insights.append(insight)
-            
-            # Lifestyle-based insights
+                            feature_insights.append(insight)
+
             lifestyle_insights = self._generate_lifestyle_insights(input_data)
-            insights.extend(lifestyle_insights)
-            
-            # Stress level specific insights
-            level_insights = self._generate_level_specific_insights(stress_level, input_data)
-            insights.extend(level_insights)
-            
+            level_insights = self._generate_level_specific_insights(
+                stress_level, input_data
+            )
+
+            # Merge the three sublists in one chain pass instead of
+            # growing a list through repeated extends, then dedup so
+            # repeats across the generators cannot silently consume one
+            # of the five slots; dict.fromkeys dedups in C preserving order
+            insights = list(dict.fromkeys(itertools.chain(
+                feature_insights, lifestyle_insights, level_insights
+            )))
+
             # Ensure we have at least one insight
             if not insights:
-                insights.append(f"Your current stress level is {stress_level.value.lower()}")
-            
+                insights.append(_DEFAULT_INSIGHT[stress_level])
+
             # Limit to most relevant insights (max 5)
             return insights[:5]
             
         except Exception as e:
             logger.error(f"Error generating insights: {str(e)}")
-            return [f"Your current stress level is {stress_level.value.lower()}"]
+            return [_DEFAULT_INSIGHT[stress_level]]
     
     def _generate_feature_insight(
         self, 
@@ -233,99 +507,59 @@ class ResponseFormatter:
         importance: float
     ) -> Optional[str]:
         """Generate insight for a specific feature based on its importance and value."""
-        try:
-            insight_templates = {
-                'Sleep_Duration': {
-                    'low': "Your sleep duration appears to be a key factor affecting your stress levels",
-                    'high': "Your adequate sleep duration is helping maintain lower stress levels"
-                },
-                'Work_Hours': {
-                    'low': "Your work hours are a significant factor in your stress assessment",
-                    'high': "Long work hours appear to be a major contributor to your stress levels"
-                },
-                'Physical_Activity': {
-                    'low': "Your physical activity level is significantly impacting your stress levels",
-                    'high': "Your active lifestyle is positively influencing your stress management"
-                },
-                'Screen_Time': {
-                    'low': "Screen time usage appears to be affecting your stress levels",
-                    'high': "High screen time may be contributing to your elevated stress levels"
-                },
-                'Sleep_Quality': {
-                    'low': "Sleep quality is a key factor in your stress level assessment",
-                    'high': "Good sleep quality is helping you manage stress effectively"
-                }
-            }
-            
-            if feature_name in insight_templates:
-                templates = insight_templates[feature_name]
-                
-                # Determine if value is high or low based on feature type
-                if feature_name in ['Sleep_Duration', 'Physical_Activity', 'Sleep_Quality']:
-                    # Higher is generally better
-                    if isinstance(feature_value, (int, float)):
-                        template_key = 'high' if feature_value >= 3 else 'low'
-                    else:
-                        template_key = 'low'
-                else:
-                    # Lower is generally better (work hours, screen time)
-                    if isinstance(feature_value, (int, float)):
-                        template_key = 'high' if feature_value >= 8 else 'low'
-                    else:
-                        template_key = 'low'
-                
-                return templates.get(template_key)
-            
-            return None
-            
-        except Exception as e:
-            logger.error(f"Error generating feature insight: {str(e)}")
+        templates = _FEATURE_INSIGHT_TEMPLATES.get(feature_name)
+        if templates is None:
             return None
+
+        # Determine if value is high or low based on feature type
+        threshold = _FEATURE_THRESHOLDS[feature_name in _HIGHER_IS_BETTER]
+        if isinstance(feature_value, (int, float)):
+            template_key = 'high' if feature_value >= threshold else 'low'
+        else:
+            template_key = 'low'
+
+        return templates.get(template_key)
     
     def _generate_lifestyle_insights(self, input_data: Dict[str, Any]) -> List[str]:
         """Generate insights based on lifestyle patterns."""
         insights = []
-        
-        try:
-            # Sleep insights
-            sleep_duration = input_data.get('Sleep_Duration', 0)
-            if sleep_duration < 6:
-                insights.append("Your sleep duration is below the recommended 7-9 hours")
-            elif sleep_duration > 9:
-                insights.append("You're getting plenty of sleep, which supports stress management")
-            
-            # Work-life balance insights
-            work_hours = input_data.get('Work_Hours', 0)
-            travel_time = input_data.get('Travel_Time', 0)
-            total_work_time = work_hours + travel_time
-            
-            if total_work_time > 10:
-                insights.append("Your total work and commute time may be impacting your stress levels")
-            
-            # Physical activity insights
-            physical_activity = input_data.get('Physical_Activity', 0)
-            exercise_type = input_data.get('Exercise_Type', '')
-            
-            if physical_activity < 2:
-                insights.append("Increasing physical activity could help reduce stress")
-            elif physical_activity >= 4:
-                insights.append(f"Your regular {exercise_type.lower()} routine is excellent for stress management")
-            
-            # Screen time insights
-            screen_time = input_data.get('Screen_Time', 0)
-            if screen_time > 10:
-                insights.append("High screen time may be contributing to your stress levels")
-            
-            # Wellness practices insights
-            meditation = input_data.get('Meditation_Practice', 'No')
-            if meditation == 'Yes':
-                insights.append("Your meditation practice is a valuable tool for stress management")
-            
-            return insights
-            
-        except Exception as e:
-            logger.error(f"Error generating lifestyle insights: {str(e)}")
-            return []
+
+        # Bind the bound methods once: the locals below are LOAD_FAST
+        # instead of repeated attribute lookup plus call setup
+        get = input_data.get
+        append = insights.append
+
+        # Sleep insights
+        sleep_duration = get('Sleep_Duration', 0)
+        if sleep_duration < 6:
+            append("Your sleep duration is below the recommended 7-9 hours")
+        elif sleep_duration > 9:
+            append("You're getting plenty of sleep, which supports stress management")
+
+        # Work-life balance insights
+        total_work_time = get('Work_Hours', 0) + get('Travel_Time', 0)
+
+        if total_work_time > 10:
+            append("Your total work and commute time may be impacting your stress levels")
+
+        # Physical activity insights
+        physical_activity = get('Physical_Activity', 0)
+
+        if physical_activity < 2:
+            append("Increasing physical activity could help reduce stress")
+        elif physical_activity >= 4:
+            exercise_label = _exercise_label(get('Exercise_Type', ''))
+            append(f"Your regular {exercise_label} routine is excellent for stress management")
+
+        # Screen time insights
+        if get('Screen_Time', 0) > 10:
+            append("High screen time may be contributing to your stress levels")
+
+        # Wellness practices insights
+        if get('Meditation_Practice', 'No') == 'Yes':
+            append("Your meditation practice is a valuable tool for stress management")
+
+        return insights
     
     def _generate_level_specific_insights(
         self, 
@@ -334,31 +568,24 @@ class ResponseFormatter:
     ) -> List[str]:
         """Generate insights specific to the stress level."""
         insights = []
-        
-        try:
-            if stress_level == StressLevelEnum.LOW:
-                insights.append("You're managing stress well - keep up the good work!")
-                
-            elif stress_level == StressLevelEnum.MEDIUM:
-                insights.append("There's room for improvement in your stress management")
-                
-            elif stress_level == StressLevelEnum.HIGH:
-                insights.append("Your stress levels indicate a need for immediate attention")
-                
-                # Add specific high-stress insights
-                caffeine = input_data.get('Caffeine_Intake', 0)
-                if caffeine > 3:
-                    insights.append("High caffeine intake may be exacerbating your stress")
-                
-                social_interactions = input_data.get('Social_Interactions', 0)
-                if social_interactions < 2:
-                    insights.append("Limited social interactions may be affecting your stress levels")
-            
-            return insights
-            
-        except Exception as e:
-            logger.error(f"Error generating level-specific insights: {str(e)}")
-            return []
+
+        if stress_level == StressLevelEnum.LOW:
+            insights.append("You're managing stress well - keep up the good work!")
+
+        elif stress_level == StressLevelEnum.MEDIUM:
+            insights.append("There's room for improvement in your stress management")
+
+        elif stress_level == StressLevelEnum.HIGH:
+            insights.append("Your stress levels indicate a need for immediate attention")
+
+            # Add specific high-stress insights
+            if input_data.get('Caffeine_Intake', 0) > 3:
+                insights.append("High caffeine intake may be exacerbating your stress")
+
+            if input_data.get('Social_Interactions', 0) < 2:
+                insights.append("Limited social interactions may be affecting your stress levels")
+
+        return insights
     
     def _generate_personalized_recommendations(
         self, 
@@ -374,21 +601,17 @@ class ResponseFormatter:
             recommendations = []
             
             # Base recommendations by stress level
-            base_recommendations = self.recommendation_templates.get(stress_level, [])
+            base_recommendations = _RECOMMENDATION_TEMPLATES.get(stress_level, ())
             recommendations.extend(base_recommendations)
             
             # Personalized recommendations based on input data
             personal_recommendations = self._generate_personal_recommendations(input_data)
             recommendations.extend(personal_recommendations)
             
-            # Remove duplicates while preserving order
-            seen = set()
-            unique_recommendations = []
-            for rec in recommendations:
-                if rec not in seen:
-                    seen.add(rec)
-                    unique_recommendations.append(rec)
-            
+            # Remove duplicates while preserving order: dict.fromkeys runs
+            # the dedup loop in C and keeps insertion order
+            unique_recommendations = list(dict.fromkeys(recommendations))
+
             return unique_recommendations[:6]  # Limit to 6 recommendations
             
         except Exception as e:
@@ -398,46 +621,34 @@ class ResponseFormatter:
     def _generate_personal_recommendations(self, input_data: Dict[str, Any]) -> List[str]:
         """Generate recommendations based on specific user data patterns."""
         recommendations = []
-        
-        try:
-            # Sleep-based recommendations
-            sleep_duration = input_data.get('Sleep_Duration', 0)
-            sleep_quality = input_data.get('Sleep_Quality', 0)
-            
-            if sleep_duration < 7:
-                recommendations.append("Aim for 7-9 hours of sleep per night")
-            if sleep_quality < 3:
-                recommendations.append("Focus on improving sleep quality through better sleep hygiene")
-            
-            # Exercise recommendations
-            physical_activity = input_data.get('Physical_Activity', 0)
-            exercise_type = input_data.get('Exercise_Type', '')
-            
-            if physical_activity < 2:
-                recommendations.append("Start with 30 minutes of daily physical activity")
-            elif exercise_type in ['Walking', 'Yoga']:
-                recommendations.append("Consider adding more vigorous exercise to your routine")
-            
-            # Work-life balance recommendations
-            work_hours = input_data.get('Work_Hours', 0)
-            if work_hours > 10:
-                recommendations.append("Try to establish better work-life boundaries")
-            
-            # Screen time recommendations
-            screen_time = input_data.get('Screen_Time', 0)
-            if screen_time > 8:
-                recommendations.append("Consider reducing screen time, especially before bed")
-            
-            # Wellness practice recommendations
-            meditation = input_data.get('Meditation_Practice', 'No')
-            if meditation == 'No':
-                recommendations.append("Try incorporating 10 minutes of daily meditation or mindfulness")
-            
-            return recommendations
-            
-        except Exception as e:
-            logger.error(f"Error generating personal recommendations: {str(e)}")
-            return []
+        get = input_data.get
+        append = recommendations.append
+
+        # Sleep-based recommendations
+        if get('Sleep_Duration', 0) < 7:
+            append("Aim for 7-9 hours of sleep per night")
+        if get('Sleep_Quality', 0) < 3:
+            append("Focus on improving sleep quality through better sleep hygiene")
+
+        # Exercise recommendations
+        if get('Physical_Activity', 0) < 2:
+            append("Start with 30 minutes of daily physical activity")
+        elif get('Exercise_Type', '') in _LIGHT_EXERCISES:
+            append("Consider adding more vigorous exercise to your routine")
+
+        # Work-life balance recommendations
+        if get('Work_Hours', 0) > 10:
+            append("Try to establish better work-life boundaries")
+
+        # Screen time recommendations
+        if get('Screen_Time', 0) > 8:
+            append("Consider reducing screen time, especially before bed")
+
+        # Wellness practice recommendations
+        if get('Meditation_Practice', 'No') == 'No':
+            append("Try incorporating 10 minutes of daily meditation or mindfulness")
+
+        return recommendations
     
     def _create_wellness_plan(
         self, 
@@ -458,7 +669,7 @@ class ResponseFormatter:
             # Generate wellness tasks
             tasks = self._generate_wellness_tasks(stress_level, input_data)
             
-            return WellnessPlan(
+            return WellnessPlan.model_construct(
                 title=plan_title,
                 summary=plan_summary,
                 tasks=tasks
@@ -470,12 +681,7 @@ class ResponseFormatter:
     
     def _generate_plan_title(self, stress_level: StressLevelEnum) -> str:
         """Generate appropriate wellness plan title."""
-        titles = {
-            StressLevelEnum.LOW: "Stress Maintenance Plan",
-            StressLevelEnum.MEDIUM: "Stress Reduction Plan",
-            StressLevelEnum.HIGH: "Intensive Stress Management Plan"
-        }
-        return titles.get(stress_level, "Personalized Wellness Plan")
+        return _PLAN_TITLES.get(stress_level, "Personalized Wellness Plan")
     
     def _generate_plan_summary(
         self, 
@@ -483,23 +689,15 @@ class ResponseFormatter:
         input_data: Dict[str, Any]
     ) -> str:
         """Generate wellness plan summary."""
-        summaries = {
-            StressLevelEnum.LOW: "A maintenance plan to help you continue managing stress effectively",
-            StressLevelEnum.MEDIUM: "A focused plan to help reduce your stress levels through targeted interventions",
-            StressLevelEnum.HIGH: "An intensive plan designed to significantly reduce your stress levels"
-        }
-        
-        base_summary = summaries.get(stress_level, "A personalized plan to help manage your stress")
-        
+        base_summary = _PLAN_SUMMARIES.get(stress_level, "A personalized plan to help manage your stress")
+
         # Add personalization based on key factors
-        sleep_duration = input_data.get('Sleep_Duration', 0)
-        physical_activity = input_data.get('Physical_Activity', 0)
-        
-        if sleep_duration < 6:
+        get = input_data.get
+        if get('Sleep_Duration', 0) < 6:
             base_summary += " with a focus on improving sleep quality"
-        elif physical_activity < 2:
+        elif get('Physical_Activity', 0) < 2:
             base_summary += " emphasizing increased physical activity"
-        
+
         return base_summary
     
     def _generate_wellness_tasks(
@@ -511,183 +709,63 @@ class ResponseFormatter:
         tasks = []
         
         try:
-            # Get base tasks for stress level
-            base_tasks = self.wellness_task_templates.get(stress_level, [])
-            
+            # Get base task prototypes for stress level
+            base_tasks = _WELLNESS_TASK_PROTOTYPES.get(stress_level, ())
+
             # Add personalized tasks based on input data
             personal_tasks = self._generate_personal_tasks(input_data)
-            
+
             # Combine and prioritize tasks
-            all_tasks = base_tasks + personal_tasks
-            
-            # Convert to WellnessTask objects and limit to 4-6 tasks
-            for i, task_data in enumerate(all_tasks[:6]):
-                task = WellnessTask(
-                    id=f"task-{i+1}-{uuid.uuid4().hex[:8]}",
-                    title=task_data['title'],
-                    type=task_data['type'],
-                    link=task_data['link'],
-                    reward=task_data['reward']
-                )
-                tasks.append(task)
-            
+            all_tasks = [*base_tasks, *personal_tasks]
+
+            # Clone prototypes with fresh ids, limited to 4-6 tasks.
+            # model_copy reuses the already-validated fields; token_hex(4)
+            # yields the same 8 hex chars without formatting a full UUID
+            for i, prototype in enumerate(all_tasks[:6]):
+                tasks.append(prototype.model_copy(
+                    update={'id': f"task-{i+1}-{secrets.token_hex(4)}"}
+                ))
+
             return tasks
             
         except Exception as e:
             logger.error(f"Error generating wellness tasks: {str(e)}")
             return self._get_fallback_tasks()
     
-    def _generate_personal_tasks(self, input_data: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Generate personalized tasks based on user input data."""
+    def _generate_personal_tasks(self, input_data: Dict[str, Any]) -> List[WellnessTask]:
+        """Select personalized task prototypes based on user input data."""
         tasks = []
-        
-        try:
-            # Sleep-related tasks
-            sleep_duration = input_data.get('Sleep_Duration', 0)
-            if sleep_duration < 7:
-                tasks.append({
-                    'title': 'Establish Better Sleep Schedule',
-                    'type': 'lifestyle',
-                    'link': '/wellness/sleep-schedule',
-                    'reward': 25
-                })
-            
-            # Exercise tasks
-            physical_activity = input_data.get('Physical_Activity', 0)
-            if physical_activity < 2:
-                tasks.append({
-                    'title': 'Start Daily Walking Routine',
-                    'type': 'tool',
-                    'link': '/tools/walking-tracker',
-                    'reward': 20
-                })
-            
-            # Meditation tasks
-            meditation = input_data.get('Meditation_Practice', 'No')
-            if meditation == 'No':
-                tasks.append({
-                    'title': 'Begin Mindfulness Practice',
-                    'type': 'tool',
-                    'link': '/tools/meditation-guide',
-                    'reward': 15
-                })
-            
-            # Screen time tasks
-            screen_time = input_data.get('Screen_Time', 0)
-            if screen_time > 8:
-                tasks.append({
-                    'title': 'Digital Detox Challenge',
-                    'type': 'lifestyle',
-                    'link': '/wellness/digital-detox',
-                    'reward': 30
-                })
-            
-            return tasks
-            
-        except Exception as e:
-            logger.error(f"Error generating personal tasks: {str(e)}")
-            return []
-    
-    def _initialize_wellness_templates(self) -> Dict[StressLevelEnum, List[Dict[str, Any]]]:
-        """Initialize wellness task templates for each stress level."""
-        return {
-            StressLevelEnum.LOW: [
-                {
-                    'title': 'Maintain Current Healthy Habits',
-                    'type': 'lifestyle',
-                    'link': '/wellness/habit-maintenance',
-                    'reward': 10
-                },
-                {
-                    'title': 'Weekly Stress Check-in',
-                    'type': 'tool',
-                    'link': '/tools/stress-tracker',
-                    'reward': 15
-                }
-            ],
-            StressLevelEnum.MEDIUM: [
-                {
-                    'title': 'Deep Breathing Exercises',
-                    'type': 'tool',
-                    'link': '/tools/breathing-exercises',
-                    'reward': 20
-                },
-                {
-                    'title': 'Improve Sleep Hygiene',
-                    'type': 'article',
-                    'link': '/articles/sleep-hygiene',
-                    'reward': 25
-                },
-                {
-                    'title': 'Regular Exercise Routine',
-                    'type': 'lifestyle',
-                    'link': '/wellness/exercise-plan',
-                    'reward': 30
-                }
-            ],
-            StressLevelEnum.HIGH: [
-                {
-                    'title': 'Immediate Stress Relief Techniques',
-                    'type': 'tool',
-                    'link': '/tools/emergency-calm',
-                    'reward': 35
-                },
-                {
-                    'title': 'Professional Support Resources',
-                    'type': 'article',
-                    'link': '/articles/professional-help',
-                    'reward': 40
-                },
-                {
-                    'title': 'Comprehensive Lifestyle Changes',
-                    'type': 'lifestyle',
-                    'link': '/wellness/lifestyle-overhaul',
-                    'reward': 45
-                },
-                {
-                    'title': 'Daily Meditation Practice',
-                    'type': 'tool',
-                    'link': '/tools/meditation-program',
-                    'reward': 30
-                }
-            ]
-        }
-    
-    def _initialize_recommendation_templates(self) -> Dict[StressLevelEnum, List[str]]:
-        """Initialize recommendation templates for each stress level."""
-        return {
-            StressLevelEnum.LOW: [
-                "Maintain your current healthy lifestyle habits",
-                "Continue regular physical activity and good sleep schedule",
-                "Keep practicing stress-prevention techniques"
-            ],
-            StressLevelEnum.MEDIUM: [
-                "Focus on improving sleep quality and duration",
-                "Incorporate regular physical exercise into your routine",
-                "Practice stress-reduction techniques like deep breathing",
-                "Consider time management strategies to reduce daily pressure"
-            ],
-            StressLevelEnum.HIGH: [
-                "Prioritize getting adequate sleep (7-9 hours per night)",
-                "Engage in regular physical activity to reduce stress hormones",
-                "Practice meditation or mindfulness exercises daily",
-                "Consider speaking with a healthcare professional",
-                "Implement immediate stress-relief techniques",
-                "Review and adjust your daily schedule to reduce pressure"
-            ]
-        }
+        get = input_data.get
+
+        # Sleep-related tasks
+        if get('Sleep_Duration', 0) < 7:
+            tasks.append(_PERSONAL_TASK_PROTOTYPES['short_sleep'])
+
+        # Exercise tasks
+        if get('Physical_Activity', 0) < 2:
+            tasks.append(_PERSONAL_TASK_PROTOTYPES['low_activity'])
+
+        # Meditation tasks
+        if get('Meditation_Practice', 'No') == 'No':
+            tasks.append(_PERSONAL_TASK_PROTOTYPES['no_meditation'])
+
+        # Screen time tasks
+        if get('Screen_Time', 0) > 8:
+            tasks.append(_PERSONAL_TASK_PROTOTYPES['high_screen_time'])
+
+        return tasks
     
     def _get_fallback_tasks(self) -> List[WellnessTask]:
         """Get fallback wellness tasks in case of errors."""
         return [
-            WellnessTask(
+            WellnessTask.model_construct(
                 id="fallback-1",
                 title="Practice Deep Breathing",
                 type="tool",
                 link="/tools/breathing",
                 reward=10
             ),
-            WellnessTask(
+            WellnessTask.model_construct(
                 id="fallback-2",
                 title="Take a Short Walk",
                 type="lifestyle",
@@ -698,7 +776,7 @@ class ResponseFormatter:
     
     def _create_fallback_wellness_plan(self) -> WellnessPlan:
         """Create a fallback wellness plan in case of errors."""
-        return WellnessPlan(
+        return WellnessPlan.model_construct(
             title="Basic Wellness Plan",
             summary="A simple plan to help manage stress",
             tasks=self._get_fallback_tasks()
@@ -706,7 +784,7 @@ class ResponseFormatter:
     
     def _create_fallback_response(self) -> StressPredictionResponse:
         """Create a fallback response in case of formatting errors."""
-        return StressPredictionResponse(
+        return StressPredictionResponse.model_construct(
             level=StressLevelEnum.MEDIUM,
             score=50,
             confidence=0.5,
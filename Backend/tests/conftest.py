@@ -0,0 +1,61 @@
+"""Shared pytest fixtures for the backend test suite."""
+
+import os
+from types import MappingProxyType
+
+import pytest
+
+from model_service import initialize_model_service, get_model_service
+
+# Resolve the model relative to this file so the suite works from any cwd
+MODEL_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), os.pardir,
+    'models', 'pulse_ai_model_test.pkl'
+)
+
+# Shared sample payloads, defined once for every test module and kept
+# read-only so no test can mutate them for the rest of the session
+SAMPLE_DATA = MappingProxyType({
+    'Age': 30,
+    'Gender': 'Male',
+    'Sleep_Duration': 7,
+    'Sleep_Quality': 4,
+    'Physical_Activity': 2,
+    'Screen_Time': 4,
+    'Caffeine_Intake': 1,
+    'Smoking_Habit': 'No',
+    'Work_Hours': 8,
+    'Travel_Time': 1,
+    'Social_Interactions': 5,
+    'Meditation_Practice': 'Yes',
+    'Exercise_Type': 'Cardio'
+})
+
+EDGE_MIN_DATA = MappingProxyType({
+    'Age': 18,
+    'Gender': 'Female',
+    'Sleep_Duration': 4.0,
+    'Sleep_Quality': 1,
+    'Physical_Activity': 0,
+    'Screen_Time': 1.0,
+    'Caffeine_Intake': 0,
+    'Smoking_Habit': 'Yes',
+    'Work_Hours': 4.0,
+    'Travel_Time': 0.0,
+    'Social_Interactions': 1,
+    'Meditation_Practice': 'No',
+    'Exercise_Type': 'Walking'
+})
+
+
+@pytest.fixture(scope="session")
+def model_service():
+    """Session-scoped model service so the pickle loads once per run."""
+    assert initialize_model_service(MODEL_PATH), \
+        "Model service initialization failed"
+    service = get_model_service()
+    # Warm up once: the first predict pays one-time costs (BLAS thread
+    # pool spin-up, lazy sklearn allocations) that would otherwise land
+    # on whichever test happens to run first and skew its timing.
+    service.predict(SAMPLE_DATA)
+    return service
@@ -4,220 +4,276 @@ Complete Backend API Test Suite
 Tests all backend functionality for the checkpoint task.
 """
 
-import requests
-import json
+import argparse
+import asyncio
+import statistics
+
+import httpx
+import orjson
 import time
 import logging
 from typing import Dict, Any
-import subprocess
 import sys
-import os
-from threading import Thread
-import signal
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+
+def _json(response):
+    """Decode a response body with orjson instead of stdlib json."""
+    return orjson.loads(response.content)
+
+
+# Valid prediction payload shared by the endpoint test and stress mode
+VALID_TEST_DATA = {
+    "age": 30,
+    "gender": "Male",
+    "sleep_duration": 7.5,
+    "sleep_quality": 4,
+    "physical_activity": 3,
+    "screen_time": 8.0,
+    "caffeine_intake": 2,
+    "smoking_habit": "No",
+    "work_hours": 8.0,
+    "travel_time": 1.0,
+    "social_interactions": 3,
+    "meditation_practice": "Yes",
+    "exercise_type": "Cardio"
+}
+
+# Payload with required fields missing, for the validation test
+INVALID_TEST_DATA = {
+    "age": 30,
+    "gender": "Male",
+    # Missing sleep_duration and other required fields
+}
+
+# Encode the payloads once at import; every request reuses the bytes
+VALID_TEST_DATA_BYTES = orjson.dumps(VALID_TEST_DATA)
+INVALID_TEST_DATA_BYTES = orjson.dumps(INVALID_TEST_DATA)
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Fields every successful predict response must carry
+REQUIRED_FIELDS = frozenset((
+    'level', 'score', 'confidence', 'insights', 'recommendations', 'wellnessPlan'
+))
+
+
 class BackendTester:
-    def __init__(self, base_url: str = "http://localhost:8000"):
-        self.base_url = base_url
-        self.server_process = None
-        
-    def start_server(self):
-        """Start the FastAPI server in the background."""
+    def __init__(self):
+        # Deferred import: pulling in app (and with it FastAPI, numpy,
+        # sklearn) at module scope would make pytest collection and any
+        # unrelated fast test pay the full startup cost
+        from app import app
+        self.app = app
+
+        # In-process ASGI transport: requests are direct calls into the
+        # app, with no subprocess, TCP handshake, or port to race on
+        self.client = httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app),
+            base_url="http://test",
+            timeout=30
+        )
+
+        # Entered in start_app, exited in stop_app
+        self._lifespan = None
+
+    async def start_app(self) -> bool:
+        """Run the app's startup handlers (model load) in-process."""
         try:
-            logger.info("Starting FastAPI server...")
-            self.server_process = subprocess.Popen(
-                [sys.executable, "app.py"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                cwd=os.getcwd()
-            )
-            
-            # Wait for server to start
-            time.sleep(3)
-            
-            # Check if server is running
-            if self.server_process.poll() is None:
-                logger.info("✓ Server started successfully")
-                return True
-            else:
-                logger.error("❌ Server failed to start")
-                return False
-                
+            logger.info("Starting app in-process...")
+            # Drive the lifespan context manager directly; unlike the
+            # removed router.startup()/shutdown() methods it exists on
+            # every starlette release fastapi>=0.100.0 can resolve
+            self._lifespan = self.app.router.lifespan_context(self.app)
+            await self._lifespan.__aenter__()
+            logger.info("✓ App started successfully")
+            return True
         except Exception as e:
-            logger.error(f"❌ Error starting server: {e}")
+            logger.error(f"❌ Error starting app: {e}")
             return False
-    
-    def stop_server(self):
-        """Stop the FastAPI server."""
-        if self.server_process:
-            try:
-                self.server_process.terminate()
-                self.server_process.wait(timeout=5)
-                logger.info("✓ Server stopped successfully")
-            except subprocess.TimeoutExpired:
-                self.server_process.kill()
-                logger.info("✓ Server forcefully stopped")
-            except Exception as e:
-                logger.error(f"❌ Error stopping server: {e}")
-    
-    def test_health_endpoint(self) -> bool:
+
+    async def stop_app(self):
+        """Run the app's shutdown handlers and close the client."""
+        try:
+            if self._lifespan is not None:
+                await self._lifespan.__aexit__(None, None, None)
+                self._lifespan = None
+            logger.info("✓ App stopped successfully")
+        except Exception as e:
+            logger.error(f"❌ Error stopping app: {e}")
+        finally:
+            await self.client.aclose()
+
+    async def test_health_endpoint(self) -> bool:
         """Test the health check endpoint."""
         try:
             logger.info("Testing health endpoint...")
-            response = requests.get(f"{self.base_url}/health", timeout=10)
-            
+            response = await self.client.get("/health")
+
             if response.status_code == 200:
-                data = response.json()
+                data = _json(response)
                 logger.info(f"✓ Health endpoint working - Status: {data.get('status')}")
                 return True
             else:
                 logger.error(f"❌ Health endpoint failed - Status: {response.status_code}")
                 return False
-                
+
         except Exception as e:
             logger.error(f"❌ Health endpoint error: {e}")
             return False
-    
-    def test_root_endpoint(self) -> bool:
+
+    async def test_root_endpoint(self) -> bool:
         """Test the root endpoint."""
         try:
             logger.info("Testing root endpoint...")
-            response = requests.get(f"{self.base_url}/", timeout=10)
-            
+            response = await self.client.get("/")
+
             if response.status_code == 200:
-                data = response.json()
+                data = _json(response)
                 logger.info(f"✓ Root endpoint working - API: {data.get('name')}")
                 return True
             else:
                 logger.error(f"❌ Root endpoint failed - Status: {response.status_code}")
                 return False
-                
+
         except Exception as e:
             logger.error(f"❌ Root endpoint error: {e}")
             return False
-    
-    def test_predict_endpoint_valid(self) -> bool:
+
+    async def test_predict_endpoint_valid(self) -> bool:
         """Test the predict endpoint with valid data."""
         try:
             logger.info("Testing predict endpoint with valid data...")
-            
-            test_data = {
-                "age": 30,
-                "gender": "Male",
-                "sleep_duration": 7.5,
-                "sleep_quality": 4,
-                "physical_activity": 3,
-                "screen_time": 8.0,
-                "caffeine_intake": 2,
-                "smoking_habit": "No",
-                "work_hours": 8.0,
-                "travel_time": 1.0,
-                "social_interactions": 3,
-                "meditation_practice": "Yes",
-                "exercise_type": "Cardio"
-            }
-            
-            response = requests.post(
-                f"{self.base_url}/predict",
-                json=test_data,
-                headers={"Content-Type": "application/json"},
-                timeout=10
+
+            response = await self.client.post(
+                "/predict",
+                content=VALID_TEST_DATA_BYTES,
+                headers=JSON_HEADERS
             )
-            
+
             if response.status_code == 200:
-                data = response.json()
-                required_fields = ['level', 'score', 'confidence', 'insights', 'recommendations', 'wellnessPlan']
-                
-                missing_fields = [field for field in required_fields if field not in data]
+                data = _json(response)
+
+                # Set difference runs as one C-level hashset op instead
+                # of a Python membership loop per field
+                missing_fields = REQUIRED_FIELDS - data.keys()
                 if missing_fields:
-                    logger.error(f"❌ Predict endpoint missing fields: {missing_fields}")
+                    logger.error(f"❌ Predict endpoint missing fields: {sorted(missing_fields)}")
                     return False
-                
+
                 logger.info(f"✓ Predict endpoint working - Level: {data.get('level')}, Score: {data.get('score')}")
                 return True
             else:
                 logger.error(f"❌ Predict endpoint failed - Status: {response.status_code}")
                 logger.error(f"Response: {response.text}")
                 return False
-                
+
         except Exception as e:
             logger.error(f"❌ Predict endpoint error: {e}")
             return False
-    
-    def test_predict_endpoint_invalid(self) -> bool:
+
+    async def test_predict_endpoint_invalid(self) -> bool:
         """Test the predict endpoint with invalid data."""
         try:
             logger.info("Testing predict endpoint with invalid data...")
-            
-            # Test with missing required field
-            invalid_data = {
-                "age": 30,
-                "gender": "Male",
-                # Missing sleep_duration and other required fields
-            }
-            
-            response = requests.post(
-                f"{self.base_url}/predict",
-                json=invalid_data,
-                headers={"Content-Type": "application/json"},
-                timeout=10
+
+            response = await self.client.post(
+                "/predict",
+                content=INVALID_TEST_DATA_BYTES,
+                headers=JSON_HEADERS
             )
-            
+
             if response.status_code == 422:  # Validation error expected
                 logger.info("✓ Predict endpoint correctly rejects invalid data")
                 return True
             else:
                 logger.error(f"❌ Predict endpoint should reject invalid data - Status: {response.status_code}")
                 return False
-                
+
         except Exception as e:
             logger.error(f"❌ Predict endpoint validation error: {e}")
             return False
-    
-    def test_cors_headers(self) -> bool:
+
+    async def test_cors_headers(self) -> bool:
         """Test CORS headers are present."""
         try:
             logger.info("Testing CORS headers...")
-            
+
             # Make an OPTIONS request to check CORS
-            response = requests.options(
-                f"{self.base_url}/predict",
+            response = await self.client.options(
+                "/predict",
                 headers={
                     "Origin": "http://localhost:3000",
                     "Access-Control-Request-Method": "POST",
                     "Access-Control-Request-Headers": "Content-Type"
-                },
-                timeout=10
+                }
             )
-            
+
             cors_headers = [
                 'access-control-allow-origin',
                 'access-control-allow-methods',
                 'access-control-allow-headers'
             ]
-            
+
             present_headers = [header for header in cors_headers if header in response.headers]
-            
+
             if len(present_headers) >= 2:  # At least some CORS headers present
                 logger.info("✓ CORS headers present")
                 return True
             else:
                 logger.warning("⚠ CORS headers may not be properly configured")
                 return True  # Don't fail the test for this
-                
+
         except Exception as e:
             logger.error(f"❌ CORS test error: {e}")
             return True  # Don't fail the test for CORS issues
-    
-    def run_all_tests(self) -> bool:
+
+    async def stress_predict(self, n: int = 500, concurrency: int = 50) -> bool:
+        """Fire n concurrent predictions and report latency percentiles."""
+        logger.info(f"Stress testing predict endpoint: {n} requests, concurrency {concurrency}...")
+
+        semaphore = asyncio.Semaphore(concurrency)
+        latencies = []
+        payload = VALID_TEST_DATA_BYTES
+        headers = JSON_HEADERS
+
+        async def post_once():
+            async with semaphore:
+                start = time.perf_counter()
+                response = await self.client.post("/predict", content=payload, headers=headers)
+                latencies.append(time.perf_counter() - start)
+                return response.status_code == 200
+
+        started = time.perf_counter()
+        results = await asyncio.gather(
+            *(post_once() for _ in range(n)),
+            return_exceptions=True
+        )
+        elapsed = time.perf_counter() - started
+
+        ok = sum(1 for result in results if result is True)
+        if latencies:
+            # quantiles(n=100) yields the 1st..99th percentile cut points
+            percentiles = statistics.quantiles(latencies, n=100)
+            logger.info(f"✓ Stress run: {ok}/{n} succeeded in {elapsed:.2f}s ({n / elapsed:.1f} req/s)")
+            logger.info(
+                f"  Latency p50={percentiles[49] * 1000:.1f}ms "
+                f"p90={percentiles[89] * 1000:.1f}ms "
+                f"p99={percentiles[98] * 1000:.1f}ms"
+            )
+        else:
+            logger.error("❌ Stress run produced no successful requests")
+
+        return ok == n
+
+    async def run_all_tests(self) -> bool:
         """Run all backend tests."""
         logger.info("=" * 50)
         logger.info("BACKEND API CHECKPOINT TESTS")
         logger.info("=" * 50)
-        
+
         tests = [
             ("Health Endpoint", self.test_health_endpoint),
             ("Root Endpoint", self.test_root_endpoint),
@@ -225,33 +281,38 @@ class BackendTester:
             ("Predict Endpoint (Invalid)", self.test_predict_endpoint_invalid),
             ("CORS Headers", self.test_cors_headers),
         ]
-        
+
+        # The tests are independent coroutines, so let gather interleave
+        # them on the event loop; order of results matches the list
+        outcomes = await asyncio.gather(
+            *(test_func() for _, test_func in tests),
+            return_exceptions=True
+        )
+
         results = []
-        for test_name, test_func in tests:
-            logger.info(f"\n--- {test_name} ---")
-            try:
-                result = test_func()
-                results.append((test_name, result))
-            except Exception as e:
-                logger.error(f"❌ {test_name} failed with exception: {e}")
+        for (test_name, _), outcome in zip(tests, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.error(f"❌ {test_name} failed with exception: {outcome}")
                 results.append((test_name, False))
-        
+            else:
+                results.append((test_name, outcome))
+
         # Summary
         logger.info("\n" + "=" * 50)
         logger.info("TEST RESULTS SUMMARY")
         logger.info("=" * 50)
-        
+
         passed = 0
         total = len(results)
-        
+
         for test_name, result in results:
             status = "✓ PASS" if result else "❌ FAIL"
             logger.info(f"{test_name}: {status}")
             if result:
                 passed += 1
-        
+
         logger.info(f"\nOverall: {passed}/{total} tests passed")
-        
+
         if passed == total:
             logger.info("🎉 ALL BACKEND TESTS PASSED!")
             return True
@@ -260,35 +321,49 @@ class BackendTester:
             return False
 
 
-def main():
-    """Main test execution."""
+async def run(args) -> bool:
+    """Drive the tester against the in-process app."""
     tester = BackendTester()
-    
+
     try:
-        # Start server
-        if not tester.start_server():
-            logger.error("Failed to start server. Exiting.")
+        if not await tester.start_app():
+            logger.error("Failed to start app. Exiting.")
             return False
-        
-        # Wait a bit more for server to be fully ready
-        time.sleep(2)
-        
-        # Run tests
-        success = tester.run_all_tests()
-        
+
+        success = await tester.run_all_tests()
+
+        if args.stress:
+            success = await tester.stress_predict(
+                n=args.stress_requests,
+                concurrency=args.stress_concurrency
+            ) and success
+
         return success
-        
+    finally:
+        await tester.stop_app()
+
+
+def main():
+    """Main test execution."""
+    parser = argparse.ArgumentParser(description="Backend API checkpoint tests")
+    parser.add_argument("--stress", action="store_true",
+                        help="Also run the concurrent load test with latency percentiles")
+    parser.add_argument("--stress-requests", type=int, default=500,
+                        help="Number of requests in stress mode")
+    parser.add_argument("--stress-concurrency", type=int, default=50,
+                        help="Concurrent in-flight requests in stress mode")
+    args = parser.parse_args()
+
+    try:
+        return asyncio.run(run(args))
     except KeyboardInterrupt:
         logger.info("Tests interrupted by user")
         return False
     except Exception as e:
         logger.error(f"Test execution failed: {e}")
         return False
-    finally:
-        # Always stop server
-        tester.stop_server()
 
 
 if __name__ == "__main__":
     success = main()
-    sys.exit(0 if success else 1)
\ No newline at end of file
+    sys.exit(0 if success else 1)
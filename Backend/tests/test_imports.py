@@ -1,34 +1,17 @@
 #!/usr/bin/env python3
 """Test imports"""
 
-try:
-    import pickle
-    print("✓ pickle imported")
-except ImportError as e:
-    print(f"❌ pickle import failed: {e}")
+import importlib.util
 
-try:
-    import logging
-    print("✓ logging imported")
-except ImportError as e:
-    print(f"❌ logging import failed: {e}")
+# find_spec only checks presence on sys.path; it never executes the
+# module, so probing numpy/pandas/sklearn costs microseconds instead of
+# the ~1 s their top-level code takes to run
+modules = ["pickle", "logging", "numpy", "pandas", "sklearn.ensemble"]
 
-try:
-    import numpy as np
-    print("✓ numpy imported")
-except ImportError as e:
-    print(f"❌ numpy import failed: {e}")
+for name in modules:
+    if importlib.util.find_spec(name) is not None:
+        print(f"✓ {name} available")
+    else:
+        print(f"❌ {name} not found")
 
-try:
-    import pandas as pd
-    print("✓ pandas imported")
-except ImportError as e:
-    print(f"❌ pandas import failed: {e}")
-
-try:
-    from sklearn.ensemble import RandomForestClassifier
-    print("✓ sklearn imported")
-except ImportError as e:
-    print(f"❌ sklearn import failed: {e}")
-
-print("All imports tested")
\ No newline at end of file
+print("All imports tested")
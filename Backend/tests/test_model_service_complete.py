@@ -4,40 +4,197 @@ Complete Model Service Test Suite
 Tests all model service functionality for the checkpoint task.
 """
 
+import functools
+import itertools
+import json
 import logging
 import sys
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from types import MappingProxyType
 from model_service import ModelService, initialize_model_service, get_model_service
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Test payloads built once at import; the service's preprocessing
+# already goes straight from these dicts into a preallocated float32
+# feature buffer, so no per-call DataFrame round-trip exists to remove.
+# MappingProxyType keeps them read-only so no test can mutate a shared payload
+VALID_DATA = MappingProxyType({
+    'Age': 30,
+    'Gender': 'Male',
+    'Sleep_Duration': 7,
+    'Sleep_Quality': 4,
+    'Physical_Activity': 2,
+    'Screen_Time': 4,
+    'Caffeine_Intake': 1,
+    'Smoking_Habit': 'No',
+    'Work_Hours': 8,
+    'Travel_Time': 1,
+    'Social_Interactions': 5,
+    'Meditation_Practice': 'Yes',
+    'Exercise_Type': 'Cardio'
+})
+
+EDGE_DATA = MappingProxyType({
+    'Age': 18,  # Minimum age
+    'Gender': 'Female',
+    'Sleep_Duration': 4.0,  # Minimum sleep
+    'Sleep_Quality': 1,  # Minimum quality
+    'Physical_Activity': 0,  # Minimum activity
+    'Screen_Time': 1.0,  # Minimum screen time
+    'Caffeine_Intake': 0,  # Minimum caffeine
+    'Smoking_Habit': 'Yes',
+    'Work_Hours': 4.0,  # Minimum work hours
+    'Travel_Time': 0.0,  # Minimum travel
+    'Social_Interactions': 1,  # Minimum social
+    'Meditation_Practice': 'No',
+    'Exercise_Type': 'Walking'
+})
+
+PREPROCESS_DATA = MappingProxyType({
+    'Age': 30,
+    'Gender': 'Male',
+    'Sleep_Duration': 7.5,
+    'Sleep_Quality': 4,
+    'Physical_Activity': 3,
+    'Screen_Time': 8.0,
+    'Caffeine_Intake': 2,
+    'Smoking_Habit': 'No',
+    'Work_Hours': 8.0,
+    'Travel_Time': 1.0,
+    'Social_Interactions': 3,
+    'Meditation_Practice': 'Yes',
+    'Exercise_Type': 'Cardio'
+})
+
+INVALID_DATA = MappingProxyType({
+    'Age': 30,
+    'Gender': 'Male',
+    # Missing required fields
+})
+
+# Two representative values per categorical feature for the boundary
+# sweep; the numeric bounds come from the service's own validation
+# vectors so the grid never drifts out of the accepted ranges. With 9
+# numeric + 4 categorical features the Cartesian product is 2^13 = 8192
+# rows, covered by one predict_batch call.
+CATEGORICAL_BOUNDS = MappingProxyType({
+    'Gender': ('Female', 'Male'),
+    'Smoking_Habit': ('No', 'Yes'),
+    'Meditation_Practice': ('No', 'Yes'),
+    'Exercise_Type': ('Walking', 'Cardio')
+})
+
+# Model files in preference order: the memory-mappable joblib artifact
+# first when create_test_model.py has produced one, then the checked-in
+# test pickle, then production. Resolved relative to this file so the
+# suite works from any cwd.
+_MODELS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, 'models')
+MODEL_CANDIDATES = (
+    os.path.join(_MODELS_DIR, "pulse_ai_model_test.joblib"),
+    os.path.join(_MODELS_DIR, "pulse_ai_model_test.pkl"),
+    os.path.join(_MODELS_DIR, "pulse_ai_model.pkl"),
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _find_model():
+    """First existing model candidate, stat'ed once per session."""
+    return next((p for p in MODEL_CANDIDATES if os.path.exists(p)), None)
+
+
+# Wall-time budgets per test; `--bless` rewrites the checked-in baseline
+_BASELINE_PATH = os.path.join(os.path.dirname(__file__), 'perf_baseline.json')
+_BLESS = '--bless' in sys.argv
+_TIMINGS = {}
+
+
+@functools.lru_cache(maxsize=1)
+def _load_baseline():
+    """Blessed per-test durations in ns, or {} if none checked in."""
+    try:
+        with open(_BASELINE_PATH) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def timed(threshold_ns):
+    """Fail a passing test that blows its wall-time budget.
+
+    The budget is the static threshold, tightened to 2.5x the blessed
+    baseline when one exists. Budgets are deliberately generous - the
+    tests share a thread pool - so only order-of-magnitude regressions
+    (e.g. reintroducing a per-row DataFrame build) trip them.
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(self):
+            start = time.perf_counter_ns()
+            passed = fn(self)
+            elapsed = time.perf_counter_ns() - start
+            _TIMINGS[fn.__name__] = elapsed
+
+            baseline = _load_baseline().get(fn.__name__)
+            budget = min(threshold_ns, int(baseline * 2.5)) if baseline else threshold_ns
+            if passed and not _BLESS and elapsed > budget:
+                logger.error("❌ %s took %.1f ms (budget %.1f ms)",
+                             fn.__name__, elapsed / 1e6, budget / 1e6)
+                return False
+            return passed
+        return wrapper
+    return decorator
+
+
+# Field sets checked via set difference instead of per-field scans
+MODEL_INFO_FIELDS = frozenset({'loaded', 'model_name', 'model_score', 'feature_count'})
+PREDICTION_FIELDS = frozenset({'level', 'score', 'confidence', 'insights', 'recommendations'})
+
+
 class ModelServiceTester:
+    # Display name -> method name, in reporting order (initialization
+    # excluded: it must run alone before the pool)
+    _TEST_PLAN = (
+        ("Model Info", "test_model_info"),
+        ("Valid Prediction", "test_valid_prediction"),
+        ("Invalid Prediction", "test_invalid_prediction"),
+        ("Edge Cases", "test_edge_cases"),
+        ("Data Preprocessing", "test_preprocessing"),
+        ("Batch Prediction", "test_batch_prediction"),
+        ("Vectorized Throughput", "test_vectorized_throughput"),
+    )
+
     def __init__(self):
         self.model_service = None
-        
+        # Bind the test methods once instead of per run_all_tests call
+        self._tests = [(name, getattr(self, attr)) for name, attr in self._TEST_PLAN]
+
     def test_model_initialization(self) -> bool:
         """Test model service initialization."""
         try:
             logger.info("Testing model service initialization...")
-            
-            # Try with test model first
-            if os.path.exists("pulse_ai_model_test.pkl"):
-                success = initialize_model_service("pulse_ai_model_test.pkl")
-                if success:
-                    self.model_service = get_model_service()
-                    logger.info("✓ Model service initialized with test model")
-                    return True
-            
-            # Try with production model
-            if os.path.exists("pulse_ai_model.pkl"):
-                success = initialize_model_service("pulse_ai_model.pkl")
-                if success:
-                    self.model_service = get_model_service()
-                    logger.info("✓ Model service initialized with production model")
-                    return True
-            
+
+            # Reuse a service another module (or the session fixture)
+            # already initialized rather than re-unpickling the model
+            existing = get_model_service()
+            if existing is not None and existing.is_loaded:
+                self.model_service = existing
+                logger.info("✓ Reusing already-initialized model service")
+                return True
+
+            model_path = _find_model()
+            if model_path and initialize_model_service(model_path):
+                self.model_service = get_model_service()
+                # Warm up so one-time costs (BLAS thread pool spin-up,
+                # lazy sklearn allocations) don't skew the later tests
+                self.model_service.predict(VALID_DATA)
+                logger.info("✓ Model service initialized with %s", model_path)
+                return True
+
             logger.error("❌ No valid model files found")
             return False
             
@@ -56,9 +213,8 @@ class ModelServiceTester:
             
             info = self.model_service.get_model_info()
             
-            required_fields = ['loaded', 'model_name', 'model_score', 'feature_count']
-            missing_fields = [field for field in required_fields if field not in info]
-            
+            missing_fields = MODEL_INFO_FIELDS - info.keys()
+
             if missing_fields:
                 logger.error(f"❌ Model info missing fields: {missing_fields}")
                 return False
@@ -67,13 +223,15 @@ class ModelServiceTester:
                 logger.error("❌ Model not loaded according to info")
                 return False
             
-            logger.info(f"✓ Model info retrieved - Name: {info['model_name']}, Score: {info['model_score']:.4f}")
+            logger.info("✓ Model info retrieved - Name: %s, Score: %.4f",
+                        info['model_name'], info['model_score'])
             return True
             
         except Exception as e:
             logger.error(f"❌ Model info error: {e}")
             return False
     
+    @timed(50_000_000)  # 50ms
     def test_valid_prediction(self) -> bool:
         """Test prediction with valid data."""
         try:
@@ -83,32 +241,14 @@ class ModelServiceTester:
                 logger.error("❌ Model service not initialized")
                 return False
             
-            # Valid test data
-            test_data = {
-                'Age': 30,
-                'Gender': 'Male',
-                'Sleep_Duration': 7,
-                'Sleep_Quality': 4,
-                'Physical_Activity': 2,
-                'Screen_Time': 4,
-                'Caffeine_Intake': 1,
-                'Smoking_Habit': 'No',
-                'Work_Hours': 8,
-                'Travel_Time': 1,
-                'Social_Interactions': 5,
-                'Meditation_Practice': 'Yes',
-                'Exercise_Type': 'Cardio'
-            }
-            
-            result = self.model_service.predict(test_data)
+            result = self.model_service.predict(VALID_DATA)
             
             if not result:
                 logger.error("❌ Prediction returned None")
                 return False
             
-            required_fields = ['level', 'score', 'confidence', 'insights', 'recommendations']
-            missing_fields = [field for field in required_fields if field not in result]
-            
+            missing_fields = PREDICTION_FIELDS - result.keys()
+
             if missing_fields:
                 logger.error(f"❌ Prediction result missing fields: {missing_fields}")
                 return False
@@ -126,7 +266,8 @@ class ModelServiceTester:
                 logger.error(f"❌ Invalid confidence range: {result['confidence']}")
                 return False
             
-            logger.info(f"✓ Valid prediction - Level: {result['level']}, Score: {result['score']}, Confidence: {result['confidence']:.3f}")
+            logger.info("✓ Valid prediction - Level: %s, Score: %s, Confidence: %.3f",
+                        result['level'], result['score'], result['confidence'])
             return True
             
         except Exception as e:
@@ -142,14 +283,7 @@ class ModelServiceTester:
                 logger.error("❌ Model service not initialized")
                 return False
             
-            # Test with missing fields
-            invalid_data = {
-                'Age': 30,
-                'Gender': 'Male',
-                # Missing required fields
-            }
-            
-            result = self.model_service.predict(invalid_data)
+            result = self.model_service.predict(INVALID_DATA)
             
             if result is not None:
                 logger.error("❌ Invalid data should return None")
@@ -166,41 +300,57 @@ class ModelServiceTester:
         """Test edge cases and boundary values."""
         try:
             logger.info("Testing edge cases...")
-            
+
             if not self.model_service:
                 logger.error("❌ Model service not initialized")
                 return False
-            
-            # Test with boundary values
-            edge_data = {
-                'Age': 18,  # Minimum age
-                'Gender': 'Female',
-                'Sleep_Duration': 4.0,  # Minimum sleep
-                'Sleep_Quality': 1,  # Minimum quality
-                'Physical_Activity': 0,  # Minimum activity
-                'Screen_Time': 1.0,  # Minimum screen time
-                'Caffeine_Intake': 0,  # Minimum caffeine
-                'Smoking_Habit': 'Yes',
-                'Work_Hours': 4.0,  # Minimum work hours
-                'Travel_Time': 0.0,  # Minimum travel
-                'Social_Interactions': 1,  # Minimum social
-                'Meditation_Practice': 'No',
-                'Exercise_Type': 'Walking'
-            }
-            
-            result = self.model_service.predict(edge_data)
-            
+
+            # All-minimum sample first: the historical single-point check
+            result = self.model_service.predict(EDGE_DATA)
+
             if not result:
                 logger.error("❌ Edge case prediction failed")
                 return False
-            
-            logger.info(f"✓ Edge case handled - Level: {result['level']}")
+
+            # Full boundary sweep: Cartesian product of per-feature
+            # bounds, pushed through the vectorized batch path at once.
+            # Numeric bounds are read off the service's validation
+            # vectors, so the sweep tracks whatever ranges it accepts
+            bounds = {
+                feature: (float(lo), float(hi))
+                for feature, lo, hi in zip(self.model_service._range_features,
+                                           self.model_service._range_lo,
+                                           self.model_service._range_hi)
+            }
+            bounds.update(CATEGORICAL_BOUNDS)
+
+            names = tuple(bounds)
+            grid = [dict(zip(names, combo))
+                    for combo in itertools.product(*bounds.values())]
+            results = self.model_service.predict_batch(grid)
+
+            if results is None:
+                logger.error("❌ Boundary sweep rejected by input validation")
+                return False
+
+            if len(results) != len(grid):
+                logger.error(f"❌ Sweep returned {len(results)} results for {len(grid)} rows")
+                return False
+
+            levels = {r['level'] for r in results if r}
+            if None in results or not levels <= {'Low', 'Medium', 'High'}:
+                logger.error(f"❌ Sweep produced invalid levels: {levels}")
+                return False
+
+            logger.info("✓ Edge cases handled - %d boundary rows, levels seen: %s",
+                        len(grid), sorted(levels))
             return True
-            
+
         except Exception as e:
             logger.error(f"❌ Edge case test error: {e}")
             return False
     
+    @timed(10_000_000)  # 10ms
     def test_preprocessing(self) -> bool:
         """Test data preprocessing functionality."""
         try:
@@ -210,23 +360,7 @@ class ModelServiceTester:
                 logger.error("❌ Model service not initialized")
                 return False
             
-            test_data = {
-                'Age': 30,
-                'Gender': 'Male',
-                'Sleep_Duration': 7.5,
-                'Sleep_Quality': 4,
-                'Physical_Activity': 3,
-                'Screen_Time': 8.0,
-                'Caffeine_Intake': 2,
-                'Smoking_Habit': 'No',
-                'Work_Hours': 8.0,
-                'Travel_Time': 1.0,
-                'Social_Interactions': 3,
-                'Meditation_Practice': 'Yes',
-                'Exercise_Type': 'Cardio'
-            }
-            
-            processed = self.model_service.preprocess_input(test_data)
+            processed = self.model_service.preprocess_input(PREPROCESS_DATA)
             
             if processed is None:
                 logger.error("❌ Preprocessing returned None")
@@ -236,37 +370,115 @@ class ModelServiceTester:
                 logger.error(f"❌ Wrong preprocessing shape: {processed.shape}")
                 return False
             
-            logger.info(f"✓ Preprocessing successful - Shape: {processed.shape}")
+            logger.info("✓ Preprocessing successful - Shape: %s", processed.shape)
             return True
             
         except Exception as e:
             logger.error(f"❌ Preprocessing test error: {e}")
             return False
     
+    def test_batch_prediction(self) -> bool:
+        """Test the vectorized batch prediction path."""
+        try:
+            logger.info("Testing batch prediction...")
+
+            if not self.model_service:
+                logger.error("❌ Model service not initialized")
+                return False
+
+            # Valid and edge-case rows go through one vectorized call
+            # instead of a model dispatch per row
+            samples = [VALID_DATA, EDGE_DATA]
+
+            results = self.model_service.predict_batch(samples)
+
+            if len(results) != len(samples):
+                logger.error(f"❌ Batch returned {len(results)} results for {len(samples)} samples")
+                return False
+
+            if any(result is None for result in results):
+                logger.error("❌ Batch prediction failed for at least one sample")
+                return False
+
+            levels = [result['level'] for result in results]
+            logger.info("✓ Batch prediction successful - Levels: %s", levels)
+            return True
+
+        except Exception as e:
+            logger.error(f"❌ Batch prediction test error: {e}")
+            return False
+
+    def test_vectorized_throughput(self) -> bool:
+        """Measure per-instance latency across batch sizes."""
+        try:
+            logger.info("Testing vectorized throughput...")
+
+            if not self.model_service:
+                logger.error("❌ Model service not initialized")
+                return False
+
+            # Warm the path so no batch size pays one-time costs
+            self.model_service.predict_batch([VALID_DATA])
+
+            per_instance_ns = {}
+            for batch_size in (1, 8, 16, 32, 64):
+                batch = [VALID_DATA] * batch_size
+                started = time.perf_counter_ns()
+                results = self.model_service.predict_batch(batch)
+                elapsed = time.perf_counter_ns() - started
+
+                if len(results) != batch_size or any(r is None for r in results):
+                    logger.error(f"❌ Batch of {batch_size} failed")
+                    return False
+
+                per_instance_ns[batch_size] = elapsed // batch_size
+
+            for batch_size, latency_ns in per_instance_ns.items():
+                logger.info("  v=%d: %.1f µs/instance", batch_size, latency_ns / 1000)
+
+            # Batching should amortize per-call overhead; report the
+            # ratio but only fail on correctness, not on timing noise
+            speedup = per_instance_ns[1] / max(per_instance_ns[8], 1)
+            logger.info("✓ Vectorized throughput measured - v=8 speedup over v=1: %.1fx", speedup)
+            return True
+
+        except Exception as e:
+            logger.error(f"❌ Vectorized throughput test error: {e}")
+            return False
+
     def run_all_tests(self) -> bool:
         """Run all model service tests."""
         logger.info("=" * 50)
         logger.info("MODEL SERVICE CHECKPOINT TESTS")
         logger.info("=" * 50)
         
-        tests = [
-            ("Model Initialization", self.test_model_initialization),
-            ("Model Info", self.test_model_info),
-            ("Valid Prediction", self.test_valid_prediction),
-            ("Invalid Prediction", self.test_invalid_prediction),
-            ("Edge Cases", self.test_edge_cases),
-            ("Data Preprocessing", self.test_preprocessing),
-        ]
-        
-        results = []
-        for test_name, test_func in tests:
-            logger.info(f"\n--- {test_name} ---")
-            try:
-                result = test_func()
-                results.append((test_name, result))
-            except Exception as e:
-                logger.error(f"❌ {test_name} failed with exception: {e}")
-                results.append((test_name, False))
+        tests = self._tests
+
+        # Initialization must finish first; every other test only reads
+        # the loaded service, and sklearn predict releases the GIL in
+        # its C code, so the rest run on a thread pool
+        results = [("Model Initialization", self.test_model_initialization())]
+
+        if results[0][1]:
+            with ThreadPoolExecutor(max_workers=min(len(tests), os.cpu_count() or 1)) as executor:
+                futures = {
+                    executor.submit(test_func): test_name
+                    for test_name, test_func in tests
+                }
+                for future in as_completed(futures):
+                    test_name = futures[future]
+                    try:
+                        results.append((test_name, future.result()))
+                    except Exception as e:
+                        logger.error(f"❌ {test_name} failed with exception: {e}")
+                        results.append((test_name, False))
+
+            # Restore the declared ordering for the summary
+            order = {test_name: i for i, (test_name, _) in enumerate(tests, start=1)}
+            order["Model Initialization"] = 0
+            results.sort(key=lambda item: order[item[0]])
+        else:
+            results.extend((test_name, False) for test_name, _ in tests)
         
         # Summary
         logger.info("\n" + "=" * 50)
@@ -278,11 +490,11 @@ class ModelServiceTester:
         
         for test_name, result in results:
             status = "✓ PASS" if result else "❌ FAIL"
-            logger.info(f"{test_name}: {status}")
+            logger.info("%s: %s", test_name, status)
             if result:
                 passed += 1
         
-        logger.info(f"\nOverall: {passed}/{total} tests passed")
+        logger.info("\nOverall: %d/%d tests passed", passed, total)
         
         if passed == total:
             logger.info("🎉 ALL MODEL SERVICE TESTS PASSED!")
@@ -298,8 +510,14 @@ def main():
     
     try:
         success = tester.run_all_tests()
+
+        if _BLESS and _TIMINGS:
+            with open(_BASELINE_PATH, 'w') as f:
+                json.dump(_TIMINGS, f, indent=2, sort_keys=True)
+            logger.info("Perf baseline written to %s", _BASELINE_PATH)
+
         return success
-        
+
     except KeyboardInterrupt:
         logger.info("Tests interrupted by user")
         return False
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""Parametrized /predict tests for low, medium, and high stress inputs."""
+
+import functools
+import random
+import time
+
+import httpx
+import orjson
+import pytest
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Low-stress profile (healthy habits)
+LOW_STRESS_DATA = {
+    "age": 30,
+    "gender": "Male",
+    "sleep_duration": 7,
+    "sleep_quality": 4,
+    "physical_activity": 2,
+    "screen_time": 4,
+    "caffeine_intake": 1,
+    "smoking_habit": "No",
+    "work_hours": 8,
+    "travel_time": 1,
+    "social_interactions": 5,
+    "meditation_practice": "Yes",
+    "exercise_type": "Cardio"
+}
+
+# Medium-stress profile
+MEDIUM_STRESS_DATA = {
+    "age": 35,
+    "gender": "Female",
+    "sleep_duration": 6,
+    "sleep_quality": 3,
+    "physical_activity": 1,
+    "screen_time": 6,
+    "caffeine_intake": 3,
+    "smoking_habit": "No",
+    "work_hours": 9,
+    "travel_time": 2,
+    "social_interactions": 3,
+    "meditation_practice": "No",
+    "exercise_type": "Aerobics"
+}
+
+# High-stress profile (poor sleep, long hours, no recovery habits)
+HIGH_STRESS_DATA = {
+    "age": 45,
+    "gender": "Male",
+    "sleep_duration": 4,
+    "sleep_quality": 2,
+    "physical_activity": 0,
+    "screen_time": 12,
+    "caffeine_intake": 6,
+    "smoking_habit": "Yes",
+    "work_hours": 14,
+    "travel_time": 3,
+    "social_interactions": 1,
+    "meditation_practice": "No",
+    "exercise_type": "Walking"
+}
+
+
+# Sorted-key encoding gives identical payloads identical bytes, so the
+# bytes double as the response-cache key
+LOW_STRESS_BYTES = orjson.dumps(LOW_STRESS_DATA, option=orjson.OPT_SORT_KEYS)
+MEDIUM_STRESS_BYTES = orjson.dumps(MEDIUM_STRESS_DATA, option=orjson.OPT_SORT_KEYS)
+HIGH_STRESS_BYTES = orjson.dumps(HIGH_STRESS_DATA, option=orjson.OPT_SORT_KEYS)
+
+# Set by the client fixture for the cached helper below
+_client = None
+
+
+@functools.lru_cache(maxsize=128)
+def _predict(body: bytes):
+    """POST one payload; repeats of identical bodies hit memory.
+
+    The endpoint is deterministic for a fixed model, so re-sending the
+    same bytes within a session would only re-measure the network.
+    """
+    response = _client.post("/predict", content=body, headers=JSON_HEADERS)
+    return response.status_code, orjson.loads(response.content)
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Keep-alive client shared by every case, warmed with one request."""
+    global _client
+    with httpx.Client(
+        base_url="http://localhost:8000",
+        timeout=10,
+        limits=httpx.Limits(max_keepalive_connections=20)
+    ) as session_client:
+        _client = session_client
+        # Warmup request: pays the TCP connect and the server's
+        # first-prediction warmup, and primes the response cache.
+        # Bounded backoff with jitter rides out a server that is still
+        # starting; a server that never answers skips the module
+        for attempt in range(3):
+            try:
+                _predict(MEDIUM_STRESS_BYTES)
+                break
+            except httpx.HTTPError:
+                time.sleep(min(2, 0.2 * 2 ** attempt) + random.random() * 0.1)
+        else:
+            _client = None
+            pytest.skip("API server is not running on localhost:8000")
+        yield session_client
+        _client = None
+        _predict.cache_clear()
+
+
+@pytest.mark.parametrize("body", [
+    LOW_STRESS_BYTES,
+    MEDIUM_STRESS_BYTES,
+    HIGH_STRESS_BYTES,
+], ids=["low", "medium", "high"])
+def test_predict(client, body):
+    """Each stress profile produces a complete successful prediction."""
+    status_code, result = _predict(body)
+
+    assert status_code == 200
+    assert result["level"] in ("Low", "Medium", "High")
+    assert 0 <= result["score"] <= 100
+    assert 0.0 <= result["confidence"] <= 1.0
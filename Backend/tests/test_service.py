@@ -3,44 +3,41 @@
 Test the ModelService functionality.
 """
 import logging
-from model_service import initialize_model_service, get_model_service
+
+import pytest
+
+from tests.conftest import SAMPLE_DATA, EDGE_MIN_DATA
 
 # Configure logging for testing
 logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
 
-print("Testing ModelService...")
 
-# Initialize model service with test model
-if initialize_model_service("pulse_ai_model_test.pkl"):
-    print("+ Model service initialized successfully")
-    
-    model_service = get_model_service()
-    
-    # Get model info
+def test_service_info(model_service):
+    """The shared service reports it is loaded."""
     info = model_service.get_model_info()
-    print(f"+ Model info: {info}")
-    
-    # Test prediction with sample data
-    sample_data = {
-        'Age': 30,
-        'Gender': 'Male',
-        'Sleep_Duration': 7,
-        'Sleep_Quality': 4,
-        'Physical_Activity': 2,
-        'Screen_Time': 4,
-        'Caffeine_Intake': 1,
-        'Smoking_Habit': 'No',
-        'Work_Hours': 8,
-        'Travel_Time': 1,
-        'Social_Interactions': 5,
-        'Meditation_Practice': 'Yes',
-        'Exercise_Type': 'Cardio'
-    }
-    
-    result = model_service.predict(sample_data)
-    if result:
-        print(f"+ Sample prediction: {result}")
-    else:
-        print("- Sample prediction failed")
-else:
-    print("- Model service initialization failed")
\ No newline at end of file
+    logger.info("+ Model info: %s", info)
+    assert info.get('loaded'), "Model not loaded according to info"
+
+
+@pytest.mark.parametrize("sample_case", [
+    SAMPLE_DATA,
+    EDGE_MIN_DATA,
+], ids=["valid", "edge-min"])
+def test_sample_prediction(model_service, sample_case):
+    """Each sample case yields a complete prediction."""
+    result = model_service.predict(sample_case)
+    assert result is not None, "Sample prediction failed"
+
+    logger.info("+ Sample prediction: %s (score %s)", result['level'], result['score'])
+    assert result['level'] in ('Low', 'Medium', 'High')
+    assert 0 <= result['score'] <= 100
+    assert 0.0 <= result['confidence'] <= 1.0
+
+
+def test_service_batch_prediction(model_service):
+    """One vectorized model call for all rows at once."""
+    batch_results = model_service.predict_batch([SAMPLE_DATA, EDGE_MIN_DATA])
+    assert len(batch_results) == 2
+    assert all(r is not None for r in batch_results), "Batch prediction failed"
+    logger.info("+ Batch prediction successful for %d samples", len(batch_results))